@@ -0,0 +1,302 @@
+"""
+Benchmark suite of the per-call overhead and memory allocations of every decorator and context manager of the package
+against an undecorated baseline, including multi-threaded contention runs.
+
+Run it from the repository root with `python -m benchmarks.decorator_overhead_benchmark`, use `--output results.json`
+to save the machine-readable results and `--compare results.json` to report the regressions against a previous run.
+"""
+
+import json
+from argparse import ArgumentParser
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from os import devnull
+from platform import python_implementation, python_version
+from sys import platform
+from threading import Barrier, Thread
+from time import perf_counter_ns
+from timeit import repeat
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+from typing import Any
+
+from developing_tools.context_managers import ExecutionTimeBlock
+from developing_tools.functions import (
+    cacheit,
+    exclusive_parameters,
+    execution_time,
+    print_parameters,
+    retryit,
+    timeout,
+    typecheck,
+)
+from developing_tools.patterns import SingletonPattern
+from developing_tools.utils.argument_class import Argument
+
+NUMBER = 20_000
+REPEAT = 5
+THREADS = (1, 2, 4, 8)
+ALLOCATION_CALLS = 1_000
+TOLERANCE = 0.10
+MAIN_THREAD_ONLY = ('timeout signal',)
+
+
+def function(a: int, b: int) -> int:
+    """
+    Trivial function used to measure the decorator overhead.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+def block(a: int, b: int) -> int:
+    """
+    Trivial function that runs inside an ExecutionTimeBlock.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    with ExecutionTimeBlock():
+        return a + b
+
+
+class Config(metaclass=SingletonPattern):
+    """
+    Singleton class used to measure the instantiation overhead.
+    """
+
+
+def singleton(a: int, b: int) -> int:
+    """
+    Instantiates the singleton class.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    Config()
+    return a + b
+
+
+def cases() -> dict[str, Callable[[int, int], int]]:
+    """
+    Returns the benchmarked callables by name, all of them take two integers and return their sum.
+
+    Returns:
+        dict[str, Callable[[int, int], int]]: The benchmarked callables.
+    """
+    implementations: dict[str, Callable[[int, int], int]] = {
+        'baseline': function,
+        'cacheit': cacheit()(function),
+        'execution_time': execution_time()(function),
+        'execution_time aggregate': execution_time(aggregate=True)(function),
+        'execution_time sampled': execution_time(aggregate=True, sample_every=100)(function),
+        'retryit': retryit(attempts=3, delay=0)(function),
+        'timeout thread': timeout(seconds=10)(function),
+        'print_parameters': print_parameters()(function),
+        'print_parameters silent': print_parameters(print_output=False)(function),
+        'exclusive_parameters': exclusive_parameters(Argument(compatible=['a'], incompatible=[]))(function),
+        'typecheck': typecheck()(function),
+        'ExecutionTimeBlock': block,
+        'SingletonPattern': singleton,
+    }
+    if platform != 'win32':
+        implementations['timeout signal'] = timeout(seconds=10, isolation='signal')(function)
+
+    return implementations
+
+
+def measure_time(callable_: Callable[[int, int], int], number: int, repeat_: int) -> float:
+    """
+    Measures the best per-call time of the given callable in the current thread.
+
+    Args:
+        callable_ (Callable[[int, int], int]): Callable to measure.
+        number (int): Number of calls of each repetition.
+        repeat_ (int): Number of repetitions, the fastest one is reported.
+
+    Returns:
+        float: The per-call time in nanoseconds.
+    """
+    return min(repeat(lambda: callable_(1, 2), number=number, repeat=repeat_)) / number * 1e9
+
+
+def measure_allocations(callable_: Callable[[int, int], int]) -> tuple[float, float]:
+    """
+    Measures the memory allocated by the given callable with tracemalloc.
+
+    Args:
+        callable_ (Callable[[int, int], int]): Callable to measure.
+
+    Returns:
+        tuple[float, float]: The peak of memory allocated during a call and the memory retained per call, in bytes.
+    """
+    callable_(1, 2)  # warm up lazily created state such as thread pools and histograms
+    start()
+    try:
+        before, _ = get_traced_memory()
+        reset_peak()
+        callable_(1, 2)
+        _, peak = get_traced_memory()
+
+        before, _ = get_traced_memory()
+        for _ in range(ALLOCATION_CALLS):
+            callable_(1, 2)
+
+        after, _ = get_traced_memory()
+
+    finally:
+        stop()
+
+    return max(peak - before, 0), max(after - before, 0) / ALLOCATION_CALLS
+
+
+def measure_contention(callable_: Callable[[int, int], int], threads: int, number: int) -> float:
+    """
+    Measures the time needed by the given number of threads to call the given callable number times in total.
+
+    Args:
+        callable_ (Callable[[int, int], int]): Callable to measure.
+        threads (int): Number of threads.
+        number (int): Total number of calls, split between the threads.
+
+    Returns:
+        float: The per-call time in nanoseconds.
+    """
+    barrier = Barrier(parties=threads + 1)
+    calls = number // threads
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(calls):
+            callable_(1, 2)
+
+        barrier.wait()
+
+    workers = [Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start_time = perf_counter_ns()
+    barrier.wait()
+    elapsed = perf_counter_ns() - start_time
+
+    for worker in workers:
+        worker.join()
+
+    return elapsed / (calls * threads)
+
+
+def run(number: int, repeat_: int, threads: tuple[int, ...]) -> dict[str, Any]:
+    """
+    Runs the whole suite.
+
+    Args:
+        number (int): Number of calls of each timing repetition.
+        repeat_ (int): Number of timing repetitions.
+        threads (tuple[int, ...]): Numbers of threads of the contention runs.
+
+    Returns:
+        dict[str, Any]: The machine-readable results.
+    """
+    results: dict[str, Any] = {}
+    with open(devnull, mode='w') as output, redirect_stdout(output):
+        for name, callable_ in cases().items():
+            peak_bytes, retained_bytes = measure_allocations(callable_=callable_)
+            results[name] = {
+                'ns_per_call': measure_time(callable_=callable_, number=number, repeat_=repeat_),
+                'peak_bytes_per_call': peak_bytes,
+                'retained_bytes_per_call': retained_bytes,
+                'contention_ns_per_call': {
+                    str(thread_count): measure_contention(callable_=callable_, threads=thread_count, number=number)
+                    for thread_count in threads
+                    if name not in MAIN_THREAD_ONLY
+                },
+            }
+
+    baseline = results['baseline']['ns_per_call']
+    for result in results.values():
+        result['overhead_ns_per_call'] = result['ns_per_call'] - baseline
+
+    return {
+        'python': f'{python_implementation()} {python_version()}',
+        'platform': platform,
+        'number': number,
+        'repeat': repeat_,
+        'results': results,
+    }
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Compares the overhead of two runs of the suite.
+
+    Args:
+        current (dict[str, Any]): Results of the current run.
+        previous (dict[str, Any]): Results of the previous run.
+        tolerance (float): Allowed relative increase of the overhead before it is reported as a regression.
+
+    Returns:
+        list[str]: The names of the benchmarks whose overhead regressed.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        if name == 'baseline' or name not in previous['results']:
+            continue
+
+        previous_overhead = max(previous['results'][name]['overhead_ns_per_call'], 1.0)
+        if result['overhead_ns_per_call'] > previous_overhead * (1 + tolerance):
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> None:
+    """
+    Run the benchmark suite, print a summary table and optionally save and compare the machine-readable results.
+    """
+    parser = ArgumentParser(description='Decorator overhead benchmark suite.')
+    parser.add_argument('--number', type=int, default=NUMBER, help='calls of each timing repetition')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='timing repetitions, the fastest one is reported')
+    parser.add_argument('--threads', type=int, nargs='+', default=THREADS, help='threads of the contention runs')
+    parser.add_argument('--output', help='path of the JSON file where the results are saved')
+    parser.add_argument('--compare', help='path of a previous JSON results file to compare the overhead against')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='allowed relative overhead increase')
+    arguments = parser.parse_args()
+
+    report = run(number=arguments.number, repeat_=arguments.repeat, threads=tuple(arguments.threads))
+
+    print(f'{"Benchmark":<26} {"ns/call":>10} {"overhead":>10} {"peak B":>8} {"kept B":>8}  contention ns/call by threads')  # fmt: skip  # noqa: E501
+    for name, result in report['results'].items():
+        contention = '  '.join(f'{threads}:{value:.0f}' for threads, value in result['contention_ns_per_call'].items())  # fmt: skip  # noqa: E501
+        print(f'{name:<26} {result["ns_per_call"]:>10.1f} {result["overhead_ns_per_call"]:>10.1f} {result["peak_bytes_per_call"]:>8.0f} {result["retained_bytes_per_call"]:>8.1f}  {contention}')  # fmt: skip  # noqa: E501
+
+    if arguments.output:
+        with open(arguments.output, mode='w') as file:
+            json.dump(report, file, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = compare(current=report, previous=json.load(file), tolerance=arguments.tolerance)
+
+        if regressions:
+            raise SystemExit(f'Overhead regressions: {", ".join(regressions)}.')
+
+        print('No overhead regressions.')
+
+
+if __name__ == '__main__':
+    main()
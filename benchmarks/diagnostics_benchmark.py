@@ -0,0 +1,104 @@
+"""
+Benchmark of the per-call overhead of the diagnostic decorators and context managers with the diagnostics enabled and
+disabled, disabled decorators must return the original function so their overhead is zero.
+
+Run it from the repository root with `python -m benchmarks.diagnostics_benchmark`.
+"""
+
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from os import devnull
+from timeit import repeat
+from typing import Any
+
+from developing_tools.context_managers import ExecutionTimeBlock
+from developing_tools.functions import execution_time, print_parameters
+from developing_tools.utils.diagnostics import set_diagnostics_enabled
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+def function(a: int, b: int) -> int:
+    """
+    Trivial function used to measure the decorator overhead.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+def block(a: int, b: int) -> int:
+    """
+    Trivial function that runs inside an ExecutionTimeBlock.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    with ExecutionTimeBlock():
+        return a + b
+
+
+def measure(callable_: Callable[..., Any]) -> float:
+    """
+    Measure the best per-call time of the given callable.
+
+    Args:
+        callable_ (Callable[..., Any]): Callable to measure.
+
+    Returns:
+        float: The best per-call time in nanoseconds.
+    """
+    return min(repeat(lambda: callable_(1, 2), number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def implementations() -> dict[str, Callable[..., Any]]:
+    """
+    Decorates the benchmarked function with the current diagnostics setting.
+
+    Returns:
+        dict[str, Callable[..., Any]]: The benchmarked callables by name.
+    """
+    return {
+        'execution_time': execution_time()(function),
+        'execution_time aggregate': execution_time(aggregate=True)(function),
+        'print_parameters': print_parameters()(function),
+        'ExecutionTimeBlock': block,
+    }
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the per-call time of each implementation with the diagnostics enabled and disabled.
+    """
+    baseline = measure(callable_=function)
+    print(f'{"undecorated":<25} {baseline:>10.1f} ns/call')
+
+    with open(devnull, mode='w') as output:
+        with redirect_stdout(output):
+            enabled = {name: measure(callable_=callable_) for name, callable_ in implementations().items()}
+
+        set_diagnostics_enabled(enabled=False)
+        try:
+            decorated = implementations()
+            disabled = {name: measure(callable_=callable_) for name, callable_ in decorated.items()}
+
+        finally:
+            set_diagnostics_enabled(enabled=True)
+
+    for name in enabled:
+        unchanged = 'original function' if decorated[name] is function else 'wrapped'
+        print(f'{name:<25} enabled {enabled[name]:>10.1f} ns/call  disabled {disabled[name]:>10.1f} ns/call  ({unchanged})')  # fmt: skip  # noqa: E501
+
+
+if __name__ == '__main__':
+    main()
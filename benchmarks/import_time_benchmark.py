@@ -0,0 +1,83 @@
+"""
+Import time benchmark of the package entry points, measured with `python -X importtime` in fresh interpreters. It fails
+when an entry point exceeds its startup budget or imports a module that must stay off the import path.
+
+Run it from the repository root with `python -m benchmarks.import_time_benchmark`, use `--output results.json` to save
+the machine-readable results.
+"""
+
+import json
+from argparse import ArgumentParser
+from statistics import median
+from subprocess import run  # nosec: B404
+from sys import executable
+
+RUNS = 7
+BUDGETS = {
+    'developing_tools.functions': 30.0,
+    'developing_tools.context_managers': 30.0,
+    'developing_tools.patterns': 30.0,
+    'developing_tools.functions.retryit': 60.0,
+    'developing_tools.functions.timeout': 60.0,
+    'developing_tools.functions.execution_time': 60.0,
+}
+FORBIDDEN_MODULES = ('asyncio', 'concurrent.futures', 'multiprocessing', 'typing_extensions')
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """
+    Imports a module in a fresh interpreter and returns its cumulative import time and the forbidden modules it loaded.
+
+    Args:
+        module (str): Name of the module to import.
+
+    Returns:
+        tuple[float, list[str]]: The cumulative import time in milliseconds and the forbidden modules imported.
+    """
+    code = f'import sys, {module}; print(",".join(name for name in {FORBIDDEN_MODULES!r} if name in sys.modules))'
+    result = run([executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True)  # noqa: S603  # nosec: B603
+
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative = int(fields[1])
+
+    return cumulative / 1000, [name for name in result.stdout.strip().split(',') if name]
+
+
+def main() -> None:
+    """
+    Run the benchmark, print the median import time of each entry point against its budget and exit with an error if
+    any budget is exceeded or any forbidden module is imported.
+    """
+    parser = ArgumentParser(description='Import time benchmark.')
+    parser.add_argument('--runs', type=int, default=RUNS, help='fresh interpreters per entry point, the median is reported')  # fmt: skip  # noqa: E501
+    parser.add_argument('--budget-scale', type=float, default=1.0, help='multiplier applied to every budget')
+    parser.add_argument('--output', help='path of the JSON file where the results are saved')
+    arguments = parser.parse_args()
+
+    results = {}
+    failures = []
+    for module, budget in BUDGETS.items():
+        measurements = [measure(module=module) for _ in range(arguments.runs)]
+        milliseconds = median(measurement[0] for measurement in measurements)
+        forbidden = sorted({name for _, names in measurements for name in names})
+        budget *= arguments.budget_scale
+
+        results[module] = {'milliseconds': milliseconds, 'budget_milliseconds': budget, 'forbidden_modules': forbidden}
+        if milliseconds > budget or forbidden:
+            failures.append(module)
+
+        print(f'{module:<45} {milliseconds:>8.2f} ms  budget {budget:>6.1f} ms  {"forbidden: " + ", ".join(forbidden) if forbidden else ""}')  # fmt: skip  # noqa: E501
+
+    if arguments.output:
+        with open(arguments.output, mode='w') as file:
+            json.dump(results, file, indent=2)
+
+    if failures:
+        raise SystemExit(f'Import budget exceeded: {", ".join(failures)}.')
+
+
+if __name__ == '__main__':
+    main()
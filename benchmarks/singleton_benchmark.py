@@ -0,0 +1,116 @@
+"""
+Multi-threaded contention benchmark of the SingletonPattern metaclass against the previous global lock implementation.
+
+Run it from the repository root with `python -m benchmarks.singleton_benchmark`.
+"""
+
+from threading import Barrier, Lock, Thread
+from time import perf_counter
+from typing import Any, ClassVar
+from typing_extensions import override
+
+from developing_tools.patterns import SingletonPattern
+
+THREADS = (1, 2, 4, 8)
+CALLS = 200_000
+
+
+class LegacySingletonPattern(type):
+    """
+    Previous SingletonPattern implementation, every instantiation acquires one lock shared by all singleton classes.
+    """
+
+    __instances: ClassVar[dict[type, Any]] = {}
+    __lock: Lock = Lock()
+
+    @override
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns the singleton instance of the class, creating it if it does not exist.
+
+        Args:
+            *args (Any): Positional arguments to be used in the creation of the singleton instance.
+            **kwargs (Any): Keyword arguments to be used in the creation of the singleton instance.
+
+        Returns:
+            Any: The singleton instance of the class.
+        """
+        with cls.__lock:
+            if cls not in cls.__instances:
+                cls.__instances[cls] = super().__call__(*args, **kwargs)
+
+        return cls.__instances[cls]
+
+
+class LegacyConfig(metaclass=LegacySingletonPattern):
+    """
+    Singleton class using the previous implementation.
+    """
+
+
+class LegacyRegistry(metaclass=LegacySingletonPattern):
+    """
+    Another singleton class using the previous implementation.
+    """
+
+
+class Config(metaclass=SingletonPattern):
+    """
+    Singleton class using the current implementation.
+    """
+
+
+class Registry(metaclass=SingletonPattern):
+    """
+    Another singleton class using the current implementation.
+    """
+
+
+def measure(classes: tuple[type, ...], threads: int) -> float:
+    """
+    Measure the time needed by the given number of threads to instantiate the given classes CALLS times in total.
+
+    Args:
+        classes (tuple[type, ...]): Singleton classes, each thread instantiates one of them in round robin.
+        threads (int): Number of threads.
+
+    Returns:
+        float: The per-call time in nanoseconds.
+    """
+    barrier = Barrier(parties=threads + 1)
+    calls = CALLS // threads
+
+    def run(singleton: type) -> None:
+        barrier.wait()
+        for _ in range(calls):
+            singleton()
+
+        barrier.wait()
+
+    workers = [Thread(target=run, args=(classes[i % len(classes)],)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start_time = perf_counter()
+    barrier.wait()
+    elapsed = perf_counter() - start_time
+
+    for worker in workers:
+        worker.join()
+
+    return elapsed / (calls * threads) * 1e9
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the per-call time of each implementation and number of threads.
+    """
+    for threads in THREADS:
+        legacy = measure(classes=(LegacyConfig, LegacyRegistry), threads=threads)
+        current = measure(classes=(Config, Registry), threads=threads)
+        print(f'{threads:>2} threads  legacy {legacy:>8.1f} ns/call  current {current:>8.1f} ns/call  speedup {legacy / current:.2f}x')  # fmt: skip  # noqa: E501
+
+
+if __name__ == '__main__':
+    main()
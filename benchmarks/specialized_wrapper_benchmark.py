@@ -0,0 +1,122 @@
+"""
+Benchmark of the per-call overhead of the signature specialized wrappers against the generic *args and **kwargs
+wrappers, for small-arity functions decorated with the decorators built on specialized_wrapper.
+
+Run it from the repository root with `python -m benchmarks.specialized_wrapper_benchmark`.
+"""
+
+from collections.abc import Callable
+from inspect import Parameter, Signature
+from timeit import repeat
+from types import FunctionType
+from typing import Any
+
+from developing_tools.functions import exclusive_parameters, execution_time, ratelimit
+from developing_tools.utils.argument_class import Argument
+
+NUMBER = 200_000
+REPEAT = 5
+
+
+def one(a: int) -> int:
+    """
+    Trivial function with one parameter.
+
+    Args:
+        a (int): First number.
+
+    Returns:
+        int: The number.
+    """
+    return a
+
+
+def two(a: int, b: int) -> int:
+    """
+    Trivial function with two parameters.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+def three(a: int, b: int, c: int) -> int:
+    """
+    Trivial function with three parameters.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+        c (int): Third number.
+
+    Returns:
+        int: The sum of the numbers.
+    """
+    return a + b + c
+
+
+def generic(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Returns a copy of the function whose signature is (*args, **kwargs), so decorators fall back to generic wrappers.
+
+    Args:
+        function (Callable[..., Any]): Function to copy.
+
+    Returns:
+        Callable[..., Any]: The copy of the function.
+    """
+    copy = FunctionType(function.__code__, function.__globals__, function.__name__)
+    variable = [Parameter('args', Parameter.VAR_POSITIONAL), Parameter('kwargs', Parameter.VAR_KEYWORD)]
+    setattr(copy, '__signature__', Signature(parameters=variable))  # noqa: B010
+    return copy
+
+
+def decorators() -> dict[str, Callable[[Callable[..., Any]], Callable[..., Any]]]:
+    """
+    Returns the benchmarked decorators by name.
+
+    Returns:
+        dict[str, Callable[[Callable[..., Any]], Callable[..., Any]]]: The benchmarked decorators.
+    """
+    return {
+        'exclusive_parameters': exclusive_parameters(Argument(compatible=['a'], incompatible=[])),
+        'execution_time sampled': execution_time(aggregate=True, sample_every=100),
+        'ratelimit': ratelimit(calls=10**9),
+    }
+
+
+def measure(callable_: Callable[..., Any], arguments: tuple[int, ...]) -> float:
+    """
+    Measures the best per-call time of the given callable.
+
+    Args:
+        callable_ (Callable[..., Any]): Callable to measure.
+        arguments (tuple[int, ...]): Positional arguments of each call.
+
+    Returns:
+        float: The per-call time in nanoseconds.
+    """
+    return min(repeat(lambda: callable_(*arguments), number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the per-call overhead of the generic and specialized wrappers of each decorator and
+    arity.
+    """
+    for function in (one, two, three):
+        arguments = tuple(range(function.__code__.co_argcount))
+        baseline = measure(callable_=function, arguments=arguments)
+        for name, decorator in decorators().items():
+            legacy = measure(callable_=decorator(generic(function=function)), arguments=arguments) - baseline
+            current = measure(callable_=decorator(function), arguments=arguments) - baseline
+            print(f'{function.__code__.co_argcount} arguments  {name:<24} generic {legacy:>7.1f} ns/call  specialized {current:>7.1f} ns/call  speedup {legacy / current:.2f}x')  # fmt: skip  # noqa: E501
+
+
+if __name__ == '__main__':
+    main()
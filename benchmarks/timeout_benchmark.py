@@ -0,0 +1,114 @@
+"""
+Benchmark of the per-call overhead of the timeout decorator against the previous thread per call implementation.
+
+Run it from the repository root with `python -m benchmarks.timeout_benchmark`.
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from sys import platform
+from threading import Thread
+from timeit import repeat
+from typing import Any
+
+from developing_tools.functions import timeout
+
+NUMBER = 2_000
+REPEAT = 5
+
+
+def legacy_timeout(seconds: float = 10) -> Callable[..., Any]:
+    """
+    Previous timeout implementation, it spawns a new thread on every call and joins it after the deadline.
+
+    Args:
+        seconds (float, optional): Timeout in seconds. Defaults to 10.
+
+    Returns:
+        Callable[..., Any]: Decorator function.
+    """
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Decorator to set a timeout for a function.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+
+        def execution(output: list[Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+            try:
+                output.append(function(*args, **kwargs))
+
+            except Exception as exception:
+                output.append(exception)
+
+        @wraps(wrapped=function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result: list[Any] = []
+            thread = Thread(target=execution, args=(result, args, kwargs))
+            thread.start()
+
+            thread.join(timeout=seconds)
+            if thread.is_alive():
+                thread.join()
+                raise TimeoutError(f'Function {function.__name__} exceeded the {seconds} seconds timeout.')
+
+            if isinstance(result[0], Exception):
+                raise result[0]
+
+            return result[0]
+
+        return wrapper
+
+    return decorator
+
+
+def function(a: int, b: int) -> int:
+    """
+    Trivial function used to measure the decorator overhead.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+def measure(callable_: Callable[..., Any]) -> float:
+    """
+    Measure the best per-call time of the given callable.
+
+    Args:
+        callable_ (Callable[..., Any]): Callable to measure.
+
+    Returns:
+        float: The best per-call time in microseconds.
+    """
+    return min(repeat(lambda: callable_(1, 2), number=NUMBER, repeat=REPEAT)) / NUMBER * 1_000_000
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the per-call time of each implementation.
+    """
+    implementations: dict[str, Callable[..., Any]] = {
+        'undecorated': function,
+        'legacy thread per call': legacy_timeout(seconds=10)(function),
+        'thread pool': timeout(seconds=10)(function),
+    }
+    if platform != 'win32':
+        implementations['signal'] = timeout(seconds=10, isolation='signal')(function)
+
+    for name, implementation in implementations.items():
+        print(f'{name:<25} {measure(callable_=implementation):>10.2f} us/call')
+
+
+if __name__ == '__main__':
+    main()
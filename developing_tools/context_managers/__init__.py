@@ -1,3 +1,10 @@
-from .execution_time_manager import ExecutionTimeBlock
+from typing import TYPE_CHECKING
+
+from developing_tools.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .execution_time_manager import ExecutionTimeBlock
 
 __all__ = ('ExecutionTimeBlock',)
+
+__getattr__, __dir__ = lazy_exports(package=__name__, exports={'ExecutionTimeBlock': 'execution_time_manager'})
@@ -2,23 +2,60 @@
 A context manager for measuring the execution time of code blocks.
 """
 
-from time import perf_counter
+from contextvars import ContextVar, Token
+from time import perf_counter, perf_counter_ns, thread_time
 from types import NoneType, TracebackType
-from typing import Self
+from typing import TYPE_CHECKING, Self
+
+from developing_tools.utils.async_timing import LoopHoldWatch, loop_heartbeat
+from developing_tools.utils.diagnostics import diagnostics_enabled
+from developing_tools.utils.timing_tree import ROOT_TITLE, UNTITLED_TITLE, TimingNode
+from developing_tools.utils.trace_collector import TraceCollector, active_collector
+
+if TYPE_CHECKING:  # pragma: no cover
+    from developing_tools.utils.memory_profile import MemoryProfile
+
+_root_node: ContextVar[TimingNode | None] = ContextVar('execution_time_block_root_node', default=None)
+_current_node: ContextVar[TimingNode | None] = ContextVar('execution_time_block_current_node', default=None)
 
 
 class ExecutionTimeBlock:
     """
     A context manager for measuring the execution time of code blocks.
+
+    Nested blocks automatically form a call tree, tracked per thread and per asyncio task context, where blocks with
+    the same title under the same parent are aggregated. The tree of the current context is returned by
+    ExecutionTimeBlock.timing_tree().
+
+    It can also be used with 'async with', then the longest time the event loop was blocked while the block ran is
+    measured too, with a resolution of LOOP_HEARTBEAT_INTERVAL seconds by a heartbeat shared by all the async blocks
+    running on the same event loop.
+
+    With profile_memory the allocations traced by tracemalloc, the resident memory delta and the garbage collections
+    per generation are measured and reported too. It is opt-in because tracemalloc slows every allocation down.
+
+    While a TraceCollector is active every block is also recorded in its timeline.
+
+    When the diagnostics are disabled at creation time the block does nothing, see set_diagnostics_enabled.
     """
 
     __title: str | None
     __output_decimals: int
+    __profile: 'MemoryProfile | None'
+    __enabled: bool
     __start_time: float
     __end_time: float
     __execution_time: float
+    __start_cpu_time: float
+    __cpu_time: float
+    __loop_hold_time: float
+    __node: TimingNode
+    __loop_watch: LoopHoldWatch
+    __collector: TraceCollector | None
+    __trace_start_time: int
+    __token: Token[TimingNode | None]
 
-    def __init__(self, title: str | None = None, output_decimals: int = 10) -> None:
+    def __init__(self, title: str | None = None, output_decimals: int = 10, profile_memory: bool = False) -> None:
         """
         Initializes the ExecutionTimeBlock context manager.
 
@@ -26,11 +63,14 @@ class ExecutionTimeBlock:
             title (str | None, optional): Title for the code block being timed. Defaults to None.
             output_decimals (int, optional): Number of decimal places to include in the printed execution time. Defaults
             to 10.
+            profile_memory (bool, optional): Whether to measure the allocations, resident memory and garbage
+            collections of the block. Defaults to False.
 
         Raises:
             TypeError: If the title argument is not a string or None.
             TypeError: If the output_decimals argument is not an integer.
             ValueError: If the output_decimals argument is a negative integer.
+            TypeError: If the profile_memory argument is not a boolean.
         """
         if type(title) not in [str, NoneType]:
             raise TypeError(f'Title must be a string, got {type(title).__name__} instead.')
@@ -41,8 +81,21 @@ class ExecutionTimeBlock:
         if output_decimals < 0:
             raise ValueError(f'output_decimals must be a non-negative integer, got {output_decimals} instead.')
 
+        if type(profile_memory) is not bool:
+            raise TypeError(f'profile_memory must be a boolean, got {type(profile_memory).__name__} instead.')
+
         self.__title = title
         self.__output_decimals = output_decimals
+        self.__enabled = diagnostics_enabled()
+        self.__profile = None
+        if profile_memory and self.__enabled:
+            from developing_tools.utils.memory_profile import MemoryProfile
+
+            self.__profile = MemoryProfile()
+        if not self.__enabled:
+            self.__start_time = self.__end_time = self.__execution_time = self.__cpu_time = 0.0
+
+        self.__loop_hold_time = 0.0
 
     def __enter__(self) -> Self:
         """
@@ -52,7 +105,9 @@ class ExecutionTimeBlock:
         Returns:
             Self: Returns itself to be used in the 'with' statement.
         """
-        self.__start_time = perf_counter()
+        if self.__enabled:
+            self.__start(asynchronous=False)
+
         return self
 
     def __exit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: TracebackType | None) -> None:
@@ -68,14 +123,143 @@ class ExecutionTimeBlock:
             exc_tb (TracebackType | None): The traceback object for the exception. None if the context was exited
             without an exception.
         """
-        self.__end_time = perf_counter()
-        self.__execution_time = self.__end_time - self.__start_time
+        if not self.__enabled:
+            return
+
+        self.__stop(asynchronous=False)
 
         if self.__title is None:
             print(f'This code took {self.execution_time:.{self.output_decimals}f} seconds to execute.')
         else:
             print(f'Code block with title "{self.title}" took {self.execution_time:.{self.output_decimals}f} seconds to execute.')  # fmt: skip  # noqa: E501
 
+        self.__print_memory_profile()
+
+    async def __aenter__(self) -> Self:
+        """
+        Automatically called at the beginning of the block after the 'async with' statement, and starts the
+        ExecutionTimeBlock and the event loop heartbeat.
+
+        Returns:
+            Self: Returns itself to be used in the 'async with' statement.
+        """
+        if self.__enabled:
+            self.__loop_watch = loop_heartbeat().watch()
+            self.__start(asynchronous=True)
+
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: TracebackType | None) -> None:
+        """
+        Exit the runtime context related to this object, additionally printing the execution time, CPU time and the
+        longest event loop block of the code wrapped in the async with statement.
+
+        Args:
+            exc_type (type | None): The type of the exception that caused the context to be exited. None if the context
+            was exited without an exception.
+            exc_val (Exception | None): The exception that caused the context to be exited. None if the context was
+            exited without an exception.
+            exc_tb (TracebackType | None): The traceback object for the exception. None if the context was exited
+            without an exception.
+        """
+        if not self.__enabled:
+            return
+
+        self.__loop_hold_time = self.__loop_watch.stop()
+        self.__stop(asynchronous=True)
+
+        times = f'{self.execution_time:.{self.output_decimals}f} seconds to execute, {self.cpu_time:.{self.output_decimals}f} seconds of CPU time and blocked the event loop for at most {self.loop_hold_time:.{self.output_decimals}f} seconds'  # fmt: skip  # noqa: E501
+        if self.__title is None:
+            print(f'This code took {times}.')
+        else:
+            print(f'Code block with title "{self.title}" took {times}.')
+
+        self.__print_memory_profile()
+
+    def __start(self, asynchronous: bool) -> None:
+        """
+        Adds the block to the timing call tree of the current context and starts the clocks.
+
+        Args:
+            asynchronous (bool): Whether the block is an async block, whose trace slices can interleave.
+        """
+        parent = _current_node.get()
+        if parent is None:
+            parent = self.timing_tree()
+
+        self.__node = parent.child(title=self.__title)
+        self.__token = _current_node.set(self.__node)
+
+        if self.__profile is not None:
+            self.__profile.start()
+
+        self.__collector = active_collector()
+        if self.__collector is not None:
+            self.__trace_start_time = perf_counter_ns()
+            if not asynchronous:
+                self.__collector.begin(name=self.__title or UNTITLED_TITLE)
+
+        self.__start_cpu_time = thread_time()
+        self.__start_time = perf_counter()
+
+    def __stop(self, asynchronous: bool) -> None:
+        """
+        Stops the clocks and records the execution time in the timing call tree.
+
+        Args:
+            asynchronous (bool): Whether the block is an async block, whose trace slices can interleave.
+        """
+        self.__end_time = perf_counter()
+        self.__cpu_time = thread_time() - self.__start_cpu_time
+        self.__execution_time = self.__end_time - self.__start_time
+        if self.__profile is not None:
+            self.__profile.stop()
+
+        if self.__collector is not None:
+            args = {'cpu_time': self.__cpu_time, 'loop_hold_time': self.__loop_hold_time}
+            if asynchronous:
+                self.__collector.complete(name=self.__title or UNTITLED_TITLE, start_time=self.__trace_start_time, args=args)  # fmt: skip  # noqa: E501
+            else:
+                self.__collector.end(name=self.__title or UNTITLED_TITLE, args=args)
+
+        self.__node.add(execution_time=self.__execution_time)
+        _current_node.reset(self.__token)
+
+    def __print_memory_profile(self) -> None:
+        """
+        Prints the memory profile of the block, if it was measured.
+        """
+        profile = self.__profile
+        if profile is None:
+            return
+
+        print(f'\tMemory: {profile.allocated_memory} bytes allocated, {profile.peak_memory} bytes peak, {profile.resident_memory_delta} bytes resident memory delta.')  # fmt: skip  # noqa: E501
+        for generation, (collections, pause_time) in enumerate(zip(profile.gc_collections, profile.gc_pause_time, strict=True)):  # fmt: skip  # noqa: E501
+            print(f'\tGarbage collector generation {generation}: {collections} collections, {pause_time:.{self.output_decimals}f} seconds paused.')  # fmt: skip  # noqa: E501
+
+    @staticmethod
+    def timing_tree() -> TimingNode:
+        """
+        Returns the root of the timing call tree of the current context, creating it if it does not exist. Threads have
+        their own tree, asyncio tasks share the tree of the context they were created from.
+
+        Returns:
+            TimingNode: The root node of the timing call tree.
+        """
+        root = _root_node.get()
+        if root is None:
+            root = TimingNode(title=ROOT_TITLE)
+            _root_node.set(root)
+
+        return root
+
+    @staticmethod
+    def reset_timing_tree() -> None:
+        """
+        Discards the timing call tree of the current context.
+        """
+        _root_node.set(TimingNode(title=ROOT_TITLE))
+
     @property
     def title(self) -> str | None:
         """
@@ -125,3 +309,75 @@ class ExecutionTimeBlock:
             float: The execution time of the code wrapped in the with statement.
         """
         return self.__execution_time
+
+    @property
+    def cpu_time(self) -> float:
+        """
+        Returns the CPU time of the thread while the block ran. In an async block it includes the other tasks the event
+        loop ran while the block was awaiting.
+
+        Returns:
+            float: The CPU time in seconds.
+        """
+        return self.__cpu_time
+
+    @property
+    def loop_hold_time(self) -> float:
+        """
+        Returns the longest time the event loop was blocked while the async block ran, 0.0 for sync blocks.
+
+        Returns:
+            float: The longest event loop block in seconds.
+        """
+        return self.__loop_hold_time
+
+    @property
+    def allocated_memory(self) -> int | None:
+        """
+        Returns the memory allocated by the block and still alive when it ended, as traced by tracemalloc.
+
+        Returns:
+            int | None: The allocated memory in bytes, None if the memory was not profiled.
+        """
+        return None if self.__profile is None else self.__profile.allocated_memory
+
+    @property
+    def peak_memory(self) -> int | None:
+        """
+        Returns the allocation peak of the block over the memory traced when it started.
+
+        Returns:
+            int | None: The allocation peak in bytes, None if the memory was not profiled.
+        """
+        return None if self.__profile is None else self.__profile.peak_memory
+
+    @property
+    def resident_memory_delta(self) -> int | None:
+        """
+        Returns the change of the resident set size (RSS) of the process while the block ran.
+
+        Returns:
+            int | None: The resident set size delta in bytes, None if the memory was not profiled.
+        """
+        return None if self.__profile is None else self.__profile.resident_memory_delta
+
+    @property
+    def gc_collections(self) -> tuple[int, ...] | None:
+        """
+        Returns the number of garbage collections per generation while the block ran.
+
+        Returns:
+            tuple[int, ...] | None: The collections of generations 0, 1 and 2, None if the memory was not profiled.
+        """
+        return None if self.__profile is None else self.__profile.gc_collections
+
+    @property
+    def gc_pause_time(self) -> tuple[float, ...] | None:
+        """
+        Returns the time spent in garbage collections per generation while the block ran.
+
+        Returns:
+            tuple[float, ...] | None: The pause time in seconds of generations 0, 1 and 2, None if the memory was not
+            profiled.
+        """
+        return None if self.__profile is None else self.__profile.gc_pause_time
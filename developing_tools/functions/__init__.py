@@ -1,13 +1,30 @@
-from .exclusive_parameters import exclusive_parameters
-from .execution_time import execution_time
-from .print_parameters import print_parameters
-from .retryit import retryit
-from .timeout import timeout
+from typing import TYPE_CHECKING
+
+from developing_tools.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cacheit import cacheit
+    from .exclusive_parameters import exclusive_parameters
+    from .execution_time import execution_time
+    from .hedge import hedge
+    from .print_parameters import print_parameters
+    from .ratelimit import ratelimit
+    from .retryit import retryit
+    from .retryit_batch import retryit_batch
+    from .timeout import timeout
+    from .typecheck import typecheck
 
 __all__ = (
+    'cacheit',
     'exclusive_parameters',
     'execution_time',
+    'hedge',
     'print_parameters',
+    'ratelimit',
     'retryit',
+    'retryit_batch',
     'timeout',
+    'typecheck',
 )
+
+__getattr__, __dir__ = lazy_exports(package=__name__, exports={name: name for name in __all__})
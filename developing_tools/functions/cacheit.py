@@ -0,0 +1,163 @@
+"""
+Decorator to cache the results of a function.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import get_ident
+from typing import Any
+
+from developing_tools.utils.cache import ABANDONED, Cache, make_key
+
+
+def cacheit(  # noqa: C901
+    max_size: int | None = 128,
+    ttl: float | None = None,
+    key: Callable[..., Hashable] | None = None,
+) -> Callable[..., Any]:
+    """
+    Decorator to cache the results of a function, evicting the least recently used entries when the cache is full and
+    the entries older than their time to live.
+
+    The cache is attached to the decorated function as the cache attribute, use function.cache.statistics() to get the
+    hits, misses, evictions and expirations, function.cache.invalidate(*args, **kwargs) to remove the entry of a call
+    and function.cache.clear() to remove every entry. Concurrent calls with the same arguments execute the function only
+    once and exceptions are never cached. The calls waiting for a call that is cancelled or interrupted are not
+    interrupted with it, one of them executes the function instead. A recursive call with the same arguments as a call
+    in progress in the same thread or task executes the function again instead of waiting for itself.
+
+    Args:
+        max_size (int | None, optional): Maximum number of cached results, if None the cache is unbounded. Default is
+        128.
+        ttl (float | None, optional): Number of seconds a result stays cached, if None results never expire. Default
+        is None.
+        key (Callable[..., Hashable] | None, optional): Function that receives the call arguments and returns the cache
+        key, if None the positional and keyword arguments are used, so they must be hashable. Default is None.
+
+    Raises:
+        TypeError: If max_size is not an integer or None.
+        ValueError: If max_size is less than 1.
+        TypeError: If ttl is not a number or None.
+        ValueError: If ttl is not greater than 0.
+        TypeError: If key is not callable or None.
+
+    Returns:
+        Callable[..., Any]: The decorated function.
+    """
+    if max_size is not None:
+        if type(max_size) is not int:
+            raise TypeError(f'The max_size must be an integer. Got {type(max_size).__name__} instead.')
+
+        if max_size < 1:
+            raise ValueError(f'The max_size must be greater than 0. Got {max_size} instead.')
+
+    if ttl is not None:
+        if type(ttl) not in [int, float]:
+            raise TypeError(f'The ttl must be a number. Got {type(ttl).__name__} instead.')
+
+        if ttl <= 0:
+            raise ValueError(f'The ttl must be greater than 0. Got {ttl} instead.')
+
+    if key is not None and not callable(key):
+        raise TypeError(f'The key must be callable. Got {type(key).__name__} instead.')
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:  # noqa: C901
+        """
+        Decorator to cache the results of a function.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+        cache = Cache(max_size=max_size, ttl=ttl, key=key or make_key)
+
+        @wraps(wrapped=function)
+        def wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+            """
+            Wrapper function that returns the cached result of the function or executes and caches it.
+
+            Args:
+                *args (tuple[Any]): Positional arguments passed to the decorated function.
+                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated function.
+
+            Returns:
+                Any: The result of the decorated function.
+            """
+            call_key = cache.key(*args, **kwargs)
+            while True:
+                found, value, owner = cache.lookup(key=call_key, owner=get_ident())
+                if found:
+                    return value
+
+                if value is None:
+                    return function(*args, **kwargs)  # recursive call with the same arguments
+
+                if owner:
+                    break
+
+                result = value.result()
+                if result is not ABANDONED:
+                    return result
+
+            try:
+                result = function(*args, **kwargs)
+
+            except BaseException as exception:
+                cache.complete(key=call_key, exception=exception)
+                raise
+
+            cache.complete(key=call_key, value=result)
+            return result
+
+        @wraps(wrapped=function)
+        async def async_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+            """
+            Wrapper coroutine that returns the cached result of the coroutine function or awaits and caches it, calls
+            waiting for a concurrent call with the same arguments do not block the event loop.
+
+            Args:
+                *args (tuple[Any]): Positional arguments passed to the decorated coroutine function.
+                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated coroutine function.
+
+            Returns:
+                Any: The result of the decorated coroutine function.
+            """
+            from asyncio import current_task, shield, wrap_future  # already loaded while a coroutine runs
+
+            call_key = cache.key(*args, **kwargs)
+            while True:
+                found, value, owner = cache.lookup(key=call_key, owner=current_task())
+                if found:
+                    return value
+
+                if value is None:
+                    return await function(*args, **kwargs)  # recursive await with the same arguments
+
+                if owner:
+                    break
+
+                result = await shield(wrap_future(value))  # a cancelled waiter must not cancel the shared future
+                if result is not ABANDONED:
+                    return result
+
+            try:
+                result = await function(*args, **kwargs)
+
+            except BaseException as exception:
+                cache.complete(key=call_key, exception=exception)
+                raise
+
+            cache.complete(key=call_key, value=result)
+            return result
+
+        if iscoroutinefunction(function):
+            setattr(async_wrapper, 'cache', cache)  # noqa: B010
+            return async_wrapper
+
+        setattr(wrapper, 'cache', cache)  # noqa: B010
+        return wrapper
+
+    return decorator
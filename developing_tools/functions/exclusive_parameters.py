@@ -3,16 +3,40 @@ This module contains a decorator to enforce compatible and incompatible argument
 """
 
 from collections.abc import Callable
-from functools import wraps
+from inspect import Parameter, signature
 from typing import Any
 
 from developing_tools.utils.argument_class import Argument
+from developing_tools.utils.specialized_wrapper import specialized_wrapper, wrapper_signature
 
+WRAPPER_BODY = """\
+provided_mask = {provided_mask}
+if provided_mask not in valid_masks:
+    validate(provided_mask)
 
-def exclusive_parameters(*arguments: Argument) -> Callable[..., Any]:
+return {call}
+"""
+GENERIC_WRAPPER_BODY = """\
+provided_mask = positional_masks[min(len(args), maximum_positional)]
+for key in kwargs:
+    provided_mask |= bits.get(key, 0)
+
+if provided_mask not in valid_masks:
+    validate(provided_mask)
+
+return {call}
+"""
+
+
+def exclusive_parameters(*arguments: Argument) -> Callable[..., Any]:  # noqa: C901
     """
     Decorator to enforce compatible and incompatible argument rules on a function.
 
+    The rules are compiled once at decoration time into bitmasks indexed by parameter name, arguments passed
+    positionally are mapped to their parameter names through the function signature, and every combination of provided
+    arguments is validated only once. The wrapper is generated with the signature of the function, so the provided
+    arguments are known without inspecting the call, see specialized_wrapper.
+
     Args:
         *arguments (Argument): Variable length Argument objects specifying compatible and incompatible argument rules.
 
@@ -27,43 +51,78 @@ def exclusive_parameters(*arguments: Argument) -> Callable[..., Any]:
         Args:
             function (Callable[..., Any]): The function to decorate.
 
+        Raises:
+            ValueError: If parameters are not accepted by the function.
+
         Returns:
             Callable[..., Any]: The wrapped function with argument validation.
         """
-
-        @wraps(wrapped=function)
-        def wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+        signature_parameters = signature(function).parameters
+        parameters = {parameter for sublist in arguments for parameter in sublist.arguments}
+        function_parameters = set(signature_parameters)
+
+        accepts_any_keyword = any(parameter.kind is Parameter.VAR_KEYWORD for parameter in signature_parameters.values())  # fmt: skip  # noqa: E501
+        if parameters - function_parameters and not accepts_any_keyword:
+            raise ValueError(f'Parameters not accepted by function: {parameters - function_parameters}')
+
+        bits = {parameter: 1 << index for index, parameter in enumerate(sorted(parameters))}
+        rules = tuple(
+            (
+                sum(bits[parameter] for parameter in set(argument.compatible)),
+                sum(bits[parameter] for parameter in set(argument.incompatible)),
+                argument,
+            )
+            for argument in arguments
+        )
+
+        positional_masks = [0]
+        for name, parameter in signature_parameters.items():
+            if parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                positional_masks.append(positional_masks[-1] | bits.get(name, 0))
+
+        valid_masks: set[int] = set()
+
+        def validate(provided_mask: int) -> None:
             """
-            Wrapper function to enforce argument rules.
+            Validates a combination of provided arguments, valid combinations are remembered.
 
             Args:
-                *args (tuple[Any]): Positional arguments passed to the decorated function.
-                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated function.
+                provided_mask (int): Bitmask of the provided arguments.
 
             Raises:
-                ValueError: If parameters are not accepted by the function.
                 ValueError: If incompatible and compatible arguments are used incorrectly.
-
-            Returns:
-                Any: The result of the decorated function.
             """
-            parameters = {parameter for sublist in arguments for parameter in sublist.arguments}
-            function_parameters = set(function.__annotations__.keys())
-            function_parameters.remove('return')
-
-            if parameters - function_parameters:
-                raise ValueError(f'Parameters not accepted by function: {parameters - function_parameters}')
-
-            provided_arguments = set(kwargs.keys())
-            for argument in arguments:
-                compatible_arguments = set(argument.compatible) <= provided_arguments
-                incompatible_arguments = set(argument.incompatible) & provided_arguments
-
-                if compatible_arguments and incompatible_arguments:
+            for compatible_mask, incompatible_mask, argument in rules:
+                if provided_mask & compatible_mask == compatible_mask and provided_mask & incompatible_mask:
                     raise ValueError(f'Incompatible arguments used together: {argument.compatible} and {argument.incompatible}')  # fmt: skip  # noqa: E501
 
-            return function(*args, **kwargs)
-
-        return wrapper
+            valid_masks.add(provided_mask)
+
+        # the specialized wrapper knows the required parameters are provided and tracks the optional ones
+        required_mask = 0
+        provided = []
+        wrapper_parameters = getattr(wrapper_signature(function=function), 'parameters', {})
+        for name, parameter in wrapper_parameters.items():
+            if name in bits:
+                if parameter.default is Parameter.empty:
+                    required_mask |= bits[name]
+
+                else:
+                    provided.append(f'({name} is not MISSING and {bits[name]})')
+
+        namespace = {
+            'bits': bits,
+            'maximum_positional': len(positional_masks) - 1,
+            'positional_masks': positional_masks,
+            'valid_masks': valid_masks,
+            'validate': validate,
+        }
+        return specialized_wrapper(
+            function=function,
+            body=WRAPPER_BODY.replace('{provided_mask}', ' | '.join([str(required_mask), *provided])),
+            namespace=namespace,
+            tracked=bits,
+            generic_body=GENERIC_WRAPPER_BODY,
+        )
 
     return decorator
@@ -4,20 +4,106 @@ This module contains a decorator that prints the time it took for a function to
 
 from collections.abc import Callable
 from functools import wraps
-from time import perf_counter
+from inspect import iscoroutinefunction
+from itertools import count
+from random import random
+from time import perf_counter_ns
 from typing import Any
 
+from developing_tools.utils.async_timing import TimedCoroutine
+from developing_tools.utils.diagnostics import diagnostics_enabled
+from developing_tools.utils.latency_registry import LatencyRegistry
+from developing_tools.utils.specialized_wrapper import specialized_wrapper
+from developing_tools.utils.trace_collector import active_collector
 
-def execution_time(output_decimals: int = 10) -> Callable[..., Any]:
+SAMPLE_EVERY_BODY = """\
+if next(counter) % sample_every:
+    return {call}
+
+"""
+SAMPLE_PROBABILITY_BODY = """\
+if random() >= sample_probability:
+    return {call}
+
+"""
+WRAPPER_BODY = """\
+collector = active_collector()
+if collector is not None:
+    collector.begin(name=qualname)
+
+start_time = perf_counter_ns()
+try:
+    function_output = {call}
+
+finally:
+    end_time = perf_counter_ns()
+    if collector is not None:
+        collector.end(name=qualname)
+
+execution_time = (end_time - start_time) / 1e9
+
+print(f'Function "{function_name}" took {execution_time:.{output_decimals}f} seconds to execute.')
+
+return function_output
+"""
+AGGREGATE_WRAPPER_BODY = """\
+collector = active_collector()
+if collector is not None:
+    collector.begin(name=qualname)
+
+start_time = perf_counter_ns()
+try:
+    return {call}
+
+finally:
+    histogram.record(nanoseconds=perf_counter_ns() - start_time, weight=weight)
+    if collector is not None:
+        collector.end(name=qualname)
+"""
+
+
+def execution_time(  # noqa: C901
+    output_decimals: int = 10,
+    aggregate: bool = False,
+    sample_every: int | None = None,
+    sample_probability: float | None = None,
+) -> Callable[..., Any]:
     """
     A decorator that measures and prints the execution time of a function.
 
+    When aggregate is True nothing is printed, every execution time is recorded into a histogram registered in the
+    LatencyRegistry under the function "module.qualname", which can be queried for count, mean, min/max and
+    percentiles with LatencyRegistry().snapshot() and cleared with LatencyRegistry().reset().
+
+    With sample_every or sample_probability only some calls are timed, the rest go straight to the function. Each
+    aggregated sample is weighted by the number of calls it stands for, so the reported count is an unbiased estimate
+    of the number of calls.
+
+    Coroutine functions are timed while they are awaited, besides the wall time the CPU time of the coroutine and the
+    longest time it held the event loop without yielding are reported. When aggregated, they are recorded into the
+    "module.qualname[cpu]" and "module.qualname[loop_hold]" histograms.
+
+    While a TraceCollector is active every timed call is also recorded in its timeline.
+
+    When the diagnostics are disabled the function is returned unchanged, see set_diagnostics_enabled.
+
     Args:
         output_decimals (int): The number of decimal places to display in the execution time. Defaults to 10.
+        aggregate (bool): Whether to aggregate the execution times instead of printing them. Defaults to False.
+        sample_every (int | None): Time only 1 in every sample_every calls, if None every call is timed. Defaults to
+        None.
+        sample_probability (float | None): Time each call with this probability, if None every call is timed.
+        Defaults to None.
 
     Raises:
         TypeError: If the output_decimals argument is not an integer.
         ValueError: If the output_decimals argument is a negative integer.
+        TypeError: If the aggregate argument is not a boolean.
+        TypeError: If the sample_every argument is not an integer.
+        ValueError: If the sample_every argument is less than 1.
+        TypeError: If the sample_probability argument is not a number.
+        ValueError: If the sample_probability argument is not greater than 0 and less than or equal to 1.
+        ValueError: If both sample_every and sample_probability are provided.
 
     Returns:
         Callable[..., Any]: A decorator that wraps a function, measuring its execution time.
@@ -28,7 +114,29 @@ def execution_time(output_decimals: int = 10) -> Callable[..., Any]:
     if output_decimals < 0:
         raise ValueError(f'output_decimals must be a non-negative integer, got {output_decimals} instead.')
 
-    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+    if type(aggregate) is not bool:
+        raise TypeError(f'aggregate must be a boolean, got {type(aggregate).__name__} instead.')
+
+    if sample_every is not None:
+        if type(sample_every) is not int:
+            raise TypeError(f'sample_every must be an integer, got {type(sample_every).__name__} instead.')
+
+        if sample_every < 1:
+            raise ValueError(f'sample_every must be greater than 0, got {sample_every} instead.')
+
+    if sample_probability is not None:
+        if type(sample_probability) not in [int, float]:
+            raise TypeError(f'sample_probability must be a number, got {type(sample_probability).__name__} instead.')
+
+        if not 0 < sample_probability <= 1:
+            raise ValueError(f'sample_probability must be between 0 (excluded) and 1, got {sample_probability} instead.')  # fmt: skip  # noqa: E501
+
+        if sample_every is not None:
+            raise ValueError('sample_every and sample_probability can not be used together.')
+
+    weight = sample_every or 1 / (sample_probability or 1)
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:  # noqa: C901
         """
         The actual decorator that wraps the function to measure its execution time.
 
@@ -38,27 +146,115 @@ def execution_time(output_decimals: int = 10) -> Callable[..., Any]:
         Returns:
             Callable[..., Any]: The wrapped function with execution time measurement.
         """
+        if not diagnostics_enabled():
+            return function
+
+        counter = count()
 
         @wraps(wrapped=function)
-        def wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+        async def async_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
             """
-            The wrapper function that measures the execution time of the decorated function.
+            The wrapper coroutine that measures the wall time, CPU time and longest event loop hold of the decorated
+            coroutine function.
 
             Args:
-                *args: Variable length argument list for the decorated function.
-                **kwargs: Arbitrary keyword arguments for the decorated function.
+                *args: Variable length argument list for the decorated coroutine function.
+                **kwargs: Arbitrary keyword arguments for the decorated coroutine function.
 
             Returns:
-                Any: The result of the decorated function.
+                Any: The result of the decorated coroutine function.
             """
-            start_time = perf_counter()
-            function_output = function(*args, **kwargs)
-            execution_time = perf_counter() - start_time
+            if sample_every is not None:
+                if next(counter) % sample_every:
+                    return await function(*args, **kwargs)
+
+            elif sample_probability is not None and random() >= sample_probability:  # noqa: S311  # nosec: B311
+                return await function(*args, **kwargs)
+
+            coroutine = TimedCoroutine(coroutine=function(*args, **kwargs))
+            start_time = perf_counter_ns()
+            try:
+                function_output = await coroutine
+
+            finally:
+                end_time = perf_counter_ns()
+                collector = active_collector()
+                if collector is not None:
+                    collector.complete(name=function.__qualname__, start_time=start_time, args={'cpu_time': coroutine.cpu_time, 'loop_hold_time': coroutine.loop_hold_time})  # fmt: skip  # noqa: E501
 
-            print(f'Function "{function.__name__}" took {execution_time:.{output_decimals}f} seconds to execute.')
+            execution_time = (end_time - start_time) / 1e9
+
+            print(f'Coroutine function "{function.__name__}" took {execution_time:.{output_decimals}f} seconds to execute, {coroutine.cpu_time:.{output_decimals}f} seconds of CPU time and held the event loop for at most {coroutine.loop_hold_time:.{output_decimals}f} seconds.')  # fmt: skip  # noqa: E501
 
             return function_output
 
-        return wrapper
+        name = f'{function.__module__}.{function.__qualname__}'
+        if not iscoroutinefunction(function):
+            body = WRAPPER_BODY
+            if aggregate:
+                body = AGGREGATE_WRAPPER_BODY
+
+            if sample_every is not None:
+                body = SAMPLE_EVERY_BODY + body
+
+            elif sample_probability is not None:
+                body = SAMPLE_PROBABILITY_BODY + body
+
+            namespace = {
+                'active_collector': active_collector,
+                'counter': counter,
+                'function_name': function.__name__,
+                'histogram': LatencyRegistry().histogram(name=name) if aggregate else None,
+                'output_decimals': output_decimals,
+                'perf_counter_ns': perf_counter_ns,
+                'qualname': function.__qualname__,
+                'random': random,
+                'sample_every': sample_every,
+                'sample_probability': sample_probability,
+                'weight': weight,
+            }
+            return specialized_wrapper(function=function, body=body, namespace=namespace)
+
+        if not aggregate:
+            return async_wrapper
+
+        histogram = LatencyRegistry().histogram(name=name)
+        cpu_histogram = LatencyRegistry().histogram(name=f'{name}[cpu]')
+        loop_hold_histogram = LatencyRegistry().histogram(name=f'{name}[loop_hold]')
+
+        @wraps(wrapped=function)
+        async def async_aggregate_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+            """
+            The wrapper coroutine that records the wall time, CPU time and longest event loop hold of the decorated
+            coroutine function into their histograms.
+
+            Args:
+                *args: Variable length argument list for the decorated coroutine function.
+                **kwargs: Arbitrary keyword arguments for the decorated coroutine function.
+
+            Returns:
+                Any: The result of the decorated coroutine function.
+            """
+            if sample_every is not None:
+                if next(counter) % sample_every:
+                    return await function(*args, **kwargs)
+
+            elif sample_probability is not None and random() >= sample_probability:  # noqa: S311  # nosec: B311
+                return await function(*args, **kwargs)
+
+            coroutine = TimedCoroutine(coroutine=function(*args, **kwargs))
+            start_time = perf_counter_ns()
+            try:
+                return await coroutine
+
+            finally:
+                histogram.record(nanoseconds=perf_counter_ns() - start_time, weight=weight)
+                cpu_histogram.record(nanoseconds=round(coroutine.cpu_time * 1e9), weight=weight)
+                loop_hold_histogram.record(nanoseconds=round(coroutine.loop_hold_time * 1e9), weight=weight)
+                collector = active_collector()
+                if collector is not None:
+                    collector.complete(name=function.__qualname__, start_time=start_time, args={'cpu_time': coroutine.cpu_time, 'loop_hold_time': coroutine.loop_hold_time})  # fmt: skip  # noqa: E501
+
+        return async_aggregate_wrapper
 
     return decorator
@@ -0,0 +1,265 @@
+"""
+Decorator to hedge the calls to a function, launching a duplicate call when the first one is slow.
+"""
+
+from collections.abc import Callable
+from contextvars import Context, copy_context
+from functools import wraps
+from inspect import iscoroutinefunction
+from os import cpu_count
+from threading import Lock
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from developing_tools.utils.hedging import HedgeState
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+HEDGE_MAX_WORKERS = min(32, (cpu_count() or 1) + 4)
+
+_executor: 'ThreadPoolExecutor | None' = None
+_executor_lock = Lock()
+
+
+def get_executor() -> 'ThreadPoolExecutor':
+    """
+    Returns the bounded thread pool shared by every hedged function, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor: The shared thread pool.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix='hedge')
+
+    return _executor
+
+
+def hedge(  # noqa: C901
+    delay: float | None = None,
+    percentile: float = 95,
+    max_hedges: int = 1,
+    max_extra_load: float | None = 0.1,
+) -> Callable[..., Any]:
+    """
+    Decorator to hedge the calls to a function, if a call has not finished after the delay a duplicate call is
+    launched and the result of whichever finishes first is returned. The calls that lose are abandoned, coroutines are
+    cancelled and threads keep running until they finish, so only hedge idempotent functions.
+
+    Functions run in a bounded thread pool shared by every hedged function, coroutine functions run as asyncio tasks.
+    When every call fails the exception of the first one to fail is raised. The delay is fixed or, if None, the given
+    percentile of the observed latency of the primary calls, until enough latencies are observed no call is hedged. When
+    a hedged call wins, the latency of the abandoned primary thread is recorded once it finishes, while a cancelled
+    primary coroutine is not recorded, since its latency is unknown.
+
+    The state is attached to the decorated function as the hedging attribute, use function.hedging.statistics() to get
+    the calls, hedged calls, calls won by a hedged call and the extra load ratio.
+
+    Args:
+        delay (float | None, optional): Seconds to wait before launching each hedged call, if None the observed latency
+        percentile is used. Default is None.
+        percentile (float, optional): Latency percentile used as the delay when it is None. Default is 95.
+        max_hedges (int, optional): Maximum number of hedged calls launched per call. Default is 1.
+        max_extra_load (float | None, optional): Maximum ratio of hedged calls to calls, once reached calls are not
+        hedged, if None it is unbounded. Default is 0.1.
+
+    Raises:
+        TypeError: If delay is not a number or None.
+        ValueError: If delay is less than 0.
+        TypeError: If percentile is not a number.
+        ValueError: If percentile is not between 0 and 100.
+        TypeError: If max_hedges is not an integer.
+        ValueError: If max_hedges is less than 1.
+        TypeError: If max_extra_load is not a number or None.
+        ValueError: If max_extra_load is not greater than 0.
+
+    Returns:
+        Callable[..., Any]: Decorator function.
+    """
+    if delay is not None:
+        if type(delay) not in [int, float]:
+            raise TypeError(f'The delay must be a number. Got {type(delay).__name__} instead.')
+
+        if delay < 0:
+            raise ValueError(f'The delay must be greater than or equal to 0. Got {delay} instead.')
+
+    if type(percentile) not in [int, float]:
+        raise TypeError(f'The percentile must be a number. Got {type(percentile).__name__} instead.')
+
+    if not 0 < percentile < 100:
+        raise ValueError(f'The percentile must be between 0 and 100. Got {percentile} instead.')
+
+    if type(max_hedges) is not int:
+        raise TypeError(f'The max_hedges must be an integer. Got {type(max_hedges).__name__} instead.')
+
+    if max_hedges < 1:
+        raise ValueError(f'The max_hedges must be greater than 0. Got {max_hedges} instead.')
+
+    if max_extra_load is not None:
+        if type(max_extra_load) not in [int, float]:
+            raise TypeError(f'The max_extra_load must be a number. Got {type(max_extra_load).__name__} instead.')
+
+        if max_extra_load <= 0:
+            raise ValueError(f'The max_extra_load must be greater than 0. Got {max_extra_load} instead.')
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:  # noqa: C901
+        """
+        Decorator to hedge the calls to a function.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+        state = HedgeState(delay=delay, percentile=percentile, max_extra_load=max_extra_load)
+
+        @wraps(wrapped=function)
+        def wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:  # noqa: C901
+            """
+            Wrapper function that executes the decorated function in the thread pool and hedges it when it is slow.
+
+            Args:
+                *args (tuple[Any]): Positional arguments passed to the decorated function.
+                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated function.
+
+            Raises:
+                Exception: If every call to the decorated function raises an exception.
+
+            Returns:
+                Any: The result of the first call that finishes successfully.
+            """
+            from concurrent.futures import FIRST_COMPLETED, wait
+
+            start_time = perf_counter_ns()
+            hedge_delay = state.start()
+            executor = get_executor()
+
+            def call(context: Context) -> Any:
+                """
+                Executes the decorated function in a copy of the caller context, so it sees the caller deadline.
+
+                Args:
+                    context (Context): Copy of the caller context.
+
+                Returns:
+                    Any: The result of the decorated function.
+                """
+                return context.run(function, *args, **kwargs)
+
+            def record_primary(future: 'Future[Any]') -> None:
+                """
+                Records the latency of the primary call when it finishes after a hedged call answered, so the delay is
+                derived from the latency of the primary calls alone.
+
+                Args:
+                    future (Future[Any]): The primary call.
+                """
+                if not future.cancelled() and future.exception() is None:
+                    state.record(nanoseconds=perf_counter_ns() - start_time)
+
+            primary = executor.submit(call, copy_context())
+            pending = {primary}
+            hedges = 0
+            error: BaseException | None = None
+            try:
+                while True:
+                    timeout = hedge_delay if hedges < max_hedges else None
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        exception = future.exception()
+                        if exception is None:
+                            state.finish(hedged_win=future is not primary)
+                            if future is primary:
+                                state.record(nanoseconds=perf_counter_ns() - start_time)
+                            else:
+                                primary.add_done_callback(record_primary)
+
+                            return future.result()
+
+                        error = error or exception
+
+                    if not pending:
+                        raise error  # type: ignore[misc]
+
+                    if not done:
+                        if not state.acquire_hedge():
+                            hedge_delay = None
+                            continue
+
+                        pending.add(executor.submit(call, copy_context()))
+                        hedges += 1
+
+            finally:
+                for future in pending:
+                    future.cancel()  # only succeeds if the call is still queued, a running call is abandoned
+
+        @wraps(wrapped=function)
+        async def async_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+            """
+            Wrapper coroutine that awaits the decorated coroutine function as a task and hedges it when it is slow, the
+            tasks that lose are cancelled.
+
+            Args:
+                *args (tuple[Any]): Positional arguments passed to the decorated coroutine function.
+                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated coroutine function.
+
+            Raises:
+                Exception: If every call to the decorated coroutine function raises an exception.
+
+            Returns:
+                Any: The result of the first call that finishes successfully.
+            """
+            from asyncio import FIRST_COMPLETED, create_task, wait  # already loaded while a coroutine runs
+
+            start_time = perf_counter_ns()
+            hedge_delay = state.start()
+
+            primary = create_task(function(*args, **kwargs))
+            pending = {primary}
+            hedges = 0
+            error: BaseException | None = None
+            try:
+                while True:
+                    timeout = hedge_delay if hedges < max_hedges else None
+                    done, pending = await wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for task in done:
+                        exception = task.exception()
+                        if exception is None:
+                            state.finish(hedged_win=task is not primary)
+                            if task is primary:
+                                state.record(nanoseconds=perf_counter_ns() - start_time)
+
+                            return task.result()
+
+                        error = error or exception
+
+                    if not pending:
+                        raise error  # type: ignore[misc]
+
+                    if not done:
+                        if not state.acquire_hedge():
+                            hedge_delay = None
+                            continue
+
+                        pending.add(create_task(function(*args, **kwargs)))
+                        hedges += 1
+
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        if iscoroutinefunction(function):
+            setattr(async_wrapper, 'hedging', state)  # noqa: B010
+            return async_wrapper
+
+        setattr(wrapper, 'hedging', state)  # noqa: B010
+        return wrapper
+
+    return decorator
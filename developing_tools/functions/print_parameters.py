@@ -4,20 +4,74 @@ This decorator prints the arguments of a function.
 
 from collections.abc import Callable
 from functools import wraps
+from itertools import count
+from time import perf_counter
 from typing import Any
 
-
-def print_parameters(show_types: bool = False, include_return: bool = True) -> Callable[..., Any]:  # noqa: C901
+from developing_tools.utils.bounded_repr import BoundedRepr
+from developing_tools.utils.call_recorder import CallRecorder
+from developing_tools.utils.diagnostics import diagnostics_enabled
+from developing_tools.utils.rate_limiter import TokenBucket
+from developing_tools.utils.type_validator import type_name
+
+
+def print_parameters(  # noqa: C901
+    show_types: bool = False,
+    include_return: bool = True,
+    recorder: CallRecorder | None = None,
+    print_output: bool = True,
+    max_length: int = 200,
+    max_depth: int = 3,
+    max_elements: int = 10,
+    sample_every: int | None = None,
+    max_prints_per_second: float | None = None,
+) -> Callable[..., Any]:
     """
     A decorator that prints the arguments of a function.
 
+    Values are formatted in bounded time and memory, reprlib style: strings and other objects are cut to max_length
+    characters and containers show at most max_elements elements and max_depth nesting levels, followed by their type
+    and length when they are larger. Byte buffers and array-like objects, like NumPy arrays or pandas data frames, are
+    summarized by their type and length or shape. See BoundedRepr.
+
+    With sample_every only 1 in every sample_every calls is printed and with max_prints_per_second at most that many
+    calls per second are printed, the other calls are neither formatted nor printed but they are still recorded.
+
+    When a recorder is given, the arguments, return value and execution time of every call that returns are also
+    appended to its binary call log, which can be streamed back with iter_call_records or replayed with replay_calls.
+
+    When the diagnostics are disabled the function is returned unchanged, see set_diagnostics_enabled.
+
     Args:
         show_types (bool, optional): Whether to show the types of the arguments. Defaults to False.
         include_return (bool, optional): Whether to include the return value of the function. Defaults to True.
+        recorder (CallRecorder | None, optional): Recorder where the calls are logged, if None calls are not recorded.
+        Defaults to None.
+        print_output (bool, optional): Whether to print the arguments, disable it to only record calls. Defaults to
+        True.
+        max_length (int, optional): Maximum number of characters of a string, number or other object. Defaults to 200.
+        max_depth (int, optional): Maximum nesting level of containers. Defaults to 3.
+        max_elements (int, optional): Maximum number of elements shown of a container. Defaults to 10.
+        sample_every (int | None, optional): Print only 1 in every sample_every calls, if None every call is printed.
+        Defaults to None.
+        max_prints_per_second (float | None, optional): Maximum number of calls printed per second, if None it is
+        unbounded. Defaults to None.
 
     Raises:
         TypeError: If the show_types argument is not a boolean.
         TypeError: If the include_return argument is not a boolean.
+        TypeError: If the recorder argument is not a CallRecorder or None.
+        TypeError: If the print_output argument is not a boolean.
+        TypeError: If the max_length argument is not an integer.
+        ValueError: If the max_length argument is less than 10.
+        TypeError: If the max_depth argument is not an integer.
+        ValueError: If the max_depth argument is less than 1.
+        TypeError: If the max_elements argument is not an integer.
+        ValueError: If the max_elements argument is less than 1.
+        TypeError: If the sample_every argument is not an integer.
+        ValueError: If the sample_every argument is less than 1.
+        TypeError: If the max_prints_per_second argument is not a number.
+        ValueError: If the max_prints_per_second argument is not greater than 0.
 
     Returns:
         Callable[..., Any]: A decorator that wraps a function, printing its arguments.
@@ -28,7 +82,29 @@ def print_parameters(show_types: bool = False, include_return: bool = True) -> C
     if type(include_return) is not bool:
         raise TypeError(f'include_return must be a boolean, got {type(include_return).__name__} instead.')
 
-    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+    if recorder is not None and not isinstance(recorder, CallRecorder):
+        raise TypeError(f'recorder must be a CallRecorder or None, got {type(recorder).__name__} instead.')
+
+    if type(print_output) is not bool:
+        raise TypeError(f'print_output must be a boolean, got {type(print_output).__name__} instead.')
+
+    formatter = BoundedRepr(max_length=max_length, max_depth=max_depth, max_elements=max_elements)
+
+    if sample_every is not None:
+        if type(sample_every) is not int:
+            raise TypeError(f'sample_every must be an integer, got {type(sample_every).__name__} instead.')
+
+        if sample_every < 1:
+            raise ValueError(f'sample_every must be greater than 0, got {sample_every} instead.')
+
+    if max_prints_per_second is not None:
+        if type(max_prints_per_second) not in [int, float]:
+            raise TypeError(f'max_prints_per_second must be a number, got {type(max_prints_per_second).__name__} instead.')  # fmt: skip  # noqa: E501
+
+        if max_prints_per_second <= 0:
+            raise ValueError(f'max_prints_per_second must be greater than 0, got {max_prints_per_second} instead.')
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:  # noqa: C901
         """
         The actual decorator that wraps the function to print its arguments.
 
@@ -38,6 +114,30 @@ def print_parameters(show_types: bool = False, include_return: bool = True) -> C
         Returns:
             Callable[..., Any]: The wrapped function with argument printing.
         """
+        if not diagnostics_enabled():
+            return function
+
+        name = f'{function.__module__}.{function.__qualname__}'
+        supposed_types = {key: type_name(annotation=annotation) for key, annotation in function.__annotations__.items()}
+        counter = count()
+        limiter = None
+        if max_prints_per_second is not None:
+            limiter = TokenBucket(rate=max_prints_per_second, capacity=max(max_prints_per_second, 1))
+
+        def should_print() -> bool:
+            """
+            Returns whether the current call is printed, according to the sampling and the rate limit.
+
+            Returns:
+                bool: True if the call is printed.
+            """
+            if not print_output:
+                return False
+
+            if sample_every is not None and next(counter) % sample_every:
+                return False
+
+            return limiter is None or not limiter.try_acquire()
 
         @wraps(wrapped=function)
         def wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
@@ -51,34 +151,37 @@ def print_parameters(show_types: bool = False, include_return: bool = True) -> C
             Returns:
                 Any: The result of the decorated function.
             """
-            print('Positional arguments:')
-            for i, argument in enumerate(args):
-                if show_types:
-                    print(f'\tArgument {i+1}: value "{argument}", type {type(argument).__name__}')
-                else:
-                    print(f'\tArgument {i+1}: value "{argument}"')
-
-            print('\nKeyword arguments:')
-            for key, value in kwargs.items():
-                if show_types:
-                    supposed_type = function.__annotations__.get(key, 'Any')
-                    supposed_type = supposed_type if supposed_type == 'Any' else supposed_type.__name__
-
-                    print(f'\tArgument {key}: value "{value}", supposed type {supposed_type}, real type {type(value).__name__}')  # fmt: skip  # noqa: E501
-                else:
-                    print(f'\tArgument {key}: value "{value}"')
-
+            printing = should_print()
+            if printing:
+                print('Positional arguments:')
+                for i, argument in enumerate(args):
+                    if show_types:
+                        print(f'\tArgument {i + 1}: value "{formatter.format(argument)}", type {type(argument).__name__}')  # fmt: skip  # noqa: E501
+                    else:
+                        print(f'\tArgument {i + 1}: value "{formatter.format(argument)}"')
+
+                print('\nKeyword arguments:')
+                for key, value in kwargs.items():
+                    if show_types:
+                        supposed_type = supposed_types.get(key, 'Any')
+                        print(f'\tArgument {key}: value "{formatter.format(value)}", supposed type {supposed_type}, real type {type(value).__name__}')  # fmt: skip  # noqa: E501
+                    else:
+                        print(f'\tArgument {key}: value "{formatter.format(value)}"')
+
+            arguments = None if recorder is None else recorder.dump_arguments(args=args, kwargs=kwargs)
+            start_time = perf_counter()
             function_output = function(*args, **kwargs)
-            if include_return:
+            if recorder is not None:
+                recorder.record(function=name, args=args, kwargs=kwargs, return_value=function_output, execution_time=perf_counter() - start_time, arguments=arguments)  # fmt: skip  # noqa: E501
+
+            if printing and include_return:
                 print('\nReturn value:')
 
                 if show_types:
-                    supposed_type = function.__annotations__.get('return', 'Any')
-                    supposed_type = supposed_type if supposed_type == 'Any' else supposed_type.__name__
-
-                    print(f'\t"{function_output}", supposed type {supposed_type}, real type {type(function_output).__name__}')  # fmt: skip  # noqa: E501
+                    supposed_type = supposed_types.get('return', 'Any')
+                    print(f'\t"{formatter.format(function_output)}", supposed type {supposed_type}, real type {type(function_output).__name__}')  # fmt: skip  # noqa: E501
                 else:
-                    print(f'\t"{function_output}"')
+                    print(f'\t"{formatter.format(function_output)}"')
 
             return function_output
 
@@ -0,0 +1,170 @@
+"""
+Decorator to limit the rate of calls to a function.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import sleep
+from typing import Any, Literal
+
+from developing_tools.utils.deadline import remaining_time
+from developing_tools.utils.rate_limiter import (
+    RateLimitExceededError,
+    RateLimiter,
+    SlidingWindow,
+    TokenBucket,
+    shared_limiter,
+)
+from developing_tools.utils.specialized_wrapper import specialized_wrapper
+
+WRAPPER_BODY = """\
+while wait := wait_time(function=function, limiter=limiter):
+    sleep(wait)
+
+return {call}
+"""
+
+
+def ratelimit(  # noqa: C901
+    calls: int = 10,
+    period: float = 1,
+    algorithm: Literal['token_bucket', 'sliding_window'] = 'token_bucket',
+    blocking: bool = True,
+    key: Hashable | None = None,
+) -> Callable[..., Any]:
+    """
+    Decorator to limit the rate of calls to a function to the given number of calls per period.
+
+    With the token bucket algorithm bursts of up to calls are allowed and the bucket refills at calls / period tokens
+    per second. With the sliding window algorithm at most calls are allowed in any window of period seconds. When the
+    limit is reached the call waits until it is allowed, or with blocking False it fails fast with a
+    RateLimitExceededError. Coroutine functions wait with asyncio.sleep, so the event loop is never blocked. A call that
+    would have to wait past the deadline of an enclosing timeout fails fast too.
+
+    Every decorated function has its own limiter, unless a key is given, then the functions decorated with the same key
+    share the limiter created by the first of them.
+
+    Args:
+        calls (int, optional): Number of calls allowed per period. Defaults to 10.
+        period (float, optional): Length of the period in seconds. Defaults to 1.
+        algorithm (Literal['token_bucket', 'sliding_window'], optional): The rate limiting algorithm. Defaults to
+        'token_bucket'.
+        blocking (bool, optional): Whether to wait until the call is allowed instead of raising. Defaults to True.
+        key (Hashable | None, optional): Key of a limiter shared between decorated functions, if None the function has
+        its own limiter. Defaults to None.
+
+    Raises:
+        TypeError: If calls is not an integer.
+        ValueError: If calls is less than 1.
+        TypeError: If period is not a number.
+        ValueError: If period is not greater than 0.
+        ValueError: If algorithm is not 'token_bucket' or 'sliding_window'.
+        TypeError: If blocking is not a boolean.
+        TypeError: If key is not hashable.
+
+    Returns:
+        Callable[..., Any]: Decorator function.
+    """
+    if type(calls) is not int:
+        raise TypeError(f'The calls must be an integer. Got {type(calls).__name__} instead.')
+
+    if calls < 1:
+        raise ValueError(f'The calls must be greater than 0. Got {calls} instead.')
+
+    if type(period) not in [int, float]:
+        raise TypeError(f'The period must be a number. Got {type(period).__name__} instead.')
+
+    if period <= 0:
+        raise ValueError(f'The period must be greater than 0. Got {period} instead.')
+
+    if algorithm not in ('token_bucket', 'sliding_window'):
+        raise ValueError(f'The algorithm must be "token_bucket" or "sliding_window". Got {algorithm} instead.')
+
+    if type(blocking) is not bool:
+        raise TypeError(f'The blocking must be a boolean. Got {type(blocking).__name__} instead.')
+
+    if not isinstance(key, Hashable):
+        raise TypeError(f'The key must be hashable. Got {type(key).__name__} instead.')
+
+    def create_limiter() -> RateLimiter:
+        """
+        Creates the limiter of the configured algorithm.
+
+        Returns:
+            RateLimiter: The limiter.
+        """
+        if algorithm == 'sliding_window':
+            return SlidingWindow(limit=calls, period=period)
+
+        return TokenBucket(rate=calls / period, capacity=calls)
+
+    def wait_time(function: Callable[..., Any], limiter: RateLimiter) -> float:
+        """
+        Acquires a call, returning how long to wait before trying again.
+
+        Args:
+            function (Callable[..., Any]): The decorated function.
+            limiter (RateLimiter): The limiter of the function.
+
+        Raises:
+            RateLimitExceededError: If the limit is reached and the call does not block or can not wait long enough.
+
+        Returns:
+            float: 0 if the call was acquired, otherwise the number of seconds to wait before trying again.
+        """
+        wait = limiter.try_acquire()
+        if not wait:
+            return wait
+
+        if not blocking:
+            raise RateLimitExceededError(f'Function {function.__name__} exceeded the rate limit of {calls} calls per {period} seconds.', retry_after=wait)  # fmt: skip  # noqa: E501
+
+        remaining = remaining_time()
+        if remaining is not None and wait > remaining:
+            raise RateLimitExceededError(f'Function {function.__name__} can not wait {wait:.2f} seconds for the rate limit before the deadline.', retry_after=wait)  # fmt: skip  # noqa: E501
+
+        return wait
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Decorator to limit the rate of calls to a function.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+        limiter = create_limiter() if key is None else shared_limiter(key=key, factory=create_limiter)
+
+        @wraps(wrapped=function)
+        async def async_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+            """
+            Wrapper coroutine that waits without blocking the event loop until the call is allowed and awaits the
+            decorated coroutine function.
+
+            Args:
+                *args (tuple[Any]): Positional arguments passed to the decorated coroutine function.
+                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated coroutine function.
+
+            Raises:
+                RateLimitExceededError: If the limit is reached and the call does not block.
+
+            Returns:
+                Any: The result of the decorated coroutine function.
+            """
+            while wait := wait_time(function=function, limiter=limiter):
+                from asyncio import sleep as async_sleep  # already loaded while a coroutine runs
+
+                await async_sleep(wait)
+
+            return await function(*args, **kwargs)
+
+        if iscoroutinefunction(function):
+            return async_wrapper
+
+        namespace = {'limiter': limiter, 'sleep': sleep, 'wait_time': wait_time}
+        return specialized_wrapper(function=function, body=WRAPPER_BODY, namespace=namespace)
+
+    return decorator
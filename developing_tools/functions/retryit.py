@@ -4,34 +4,34 @@ This module contains a decorator that retries to execute a function a given numb
 
 from collections.abc import Callable
 from functools import wraps
-from random import SystemRandom
-from time import sleep
+from inspect import iscoroutinefunction
+from time import monotonic, sleep
 from typing import Any
 
+from developing_tools.utils.backoff import BackoffStrategy, ConstantBackoff, UniformBackoff
+from developing_tools.utils.deadline import remaining_time
+from developing_tools.utils.retry_budget import RetryBudget
 
-def retryit(  # noqa: C901
-    attempts: int | None = None,
-    delay: float | tuple[float, float] = 5,
-    raise_exception: bool = True,
-    valid_exceptions: tuple[type[Exception]] | None = None,
-) -> Callable[..., Any]:
+
+def validate_retry_arguments(  # noqa: C901
+    attempts: int | None,
+    delay: float | tuple[float, float] | BackoffStrategy,
+    raise_exception: bool,
+    valid_exceptions: tuple[type[Exception]] | None,
+) -> BackoffStrategy:
     """
-    Decorator that retries to execute a function a given number of times.
+    Validates the arguments shared by retryit and retryit_batch and returns the backoff strategy of the delay.
 
     Args:
-        attempts (int, optional): The number of attempts to execute the function, if None the function will be executed
-        indefinitely until it succeeds or the program is interrupted. Default is None.
-        delay (float | tuple[float, float], optional): The number of seconds to wait before each attempt, if a tuple is
-        provided, a random delay between the two values will be used (both included). Default is 5 seconds.
-        raise_exception (bool, optional): Whether to raise an exception if the function fails after all attempts.
-        Default is True.
-        valid_exceptions (tuple[type[Exception]], optional): A tuple of exceptions that should be caught and
-        retried. If None, all exceptions will be caught. Default is None. Exception subclasses are also caught.
+        attempts (int | None): The number of attempts to execute the function, None for unlimited attempts.
+        delay (float | tuple[float, float] | BackoffStrategy): The delay before each attempt.
+        raise_exception (bool): Whether to raise an exception if the function fails after all attempts.
+        valid_exceptions (tuple[type[Exception]] | None): The exceptions that are retried, None for all of them.
 
     Raises:
         TypeError: If the number of attempts is not an integer.
         ValueError: If the number of attempts is less than 1.
-        TypeError: If the delay is not a number or a tuple.
+        TypeError: If the delay is not a number, a tuple or a BackoffStrategy.
         ValueError: If the delay is less than 0.
         TypeError: If the delay tuple has elements that are not numbers.
         ValueError: If the delay tuple does not have 2 elements.
@@ -43,7 +43,7 @@ def retryit(  # noqa: C901
         TypeError: If the elements of valid_exceptions are not exception types.
 
     Returns:
-        Callable[..., Any]: The decorated function.
+        BackoffStrategy: The strategy that computes the delay before each retry.
     """
     if attempts is not None:
         if type(attempts) is not int:
@@ -52,8 +52,8 @@ def retryit(  # noqa: C901
         if attempts < 1:
             raise ValueError(f'The number of attempts must be greater than 0. Got {attempts} instead.')
 
-    if type(delay) not in [int, float, tuple]:
-        raise TypeError(f'The delay must be a number or a tuple. Got {type(delay).__name__} instead.')
+    if type(delay) not in [int, float, tuple] and not isinstance(delay, BackoffStrategy):
+        raise TypeError(f'The delay must be a number, a tuple or a BackoffStrategy. Got {type(delay).__name__} instead.')  # fmt: skip  # noqa: E501
 
     if type(delay) in [int, float] and delay < 0:  # type: ignore
         raise ValueError(f'The delay must be greater than or equal to 0. Got {delay} instead.')
@@ -86,7 +86,109 @@ def retryit(  # noqa: C901
             if not isinstance(exception, type) or not issubclass(exception, Exception):  # type: ignore
                 raise TypeError(f'All elements of valid_exceptions must be exception types. Got {type(exception).__name__} instead.')  # fmt: skip  # noqa: E501
 
-    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+    if isinstance(delay, BackoffStrategy):
+        return delay
+
+    if type(delay) is tuple:
+        return UniformBackoff(minimum=delay[0], maximum=delay[1])
+
+    return ConstantBackoff(seconds=delay)  # type: ignore[arg-type]
+
+
+def retryit(  # noqa: C901
+    attempts: int | None = None,
+    delay: float | tuple[float, float] | BackoffStrategy = 5,
+    raise_exception: bool = True,
+    valid_exceptions: tuple[type[Exception]] | None = None,
+    budget: RetryBudget | None = None,
+) -> Callable[..., Any]:
+    """
+    Decorator that retries to execute a function a given number of times. Coroutine functions are supported natively,
+    the decorated coroutine awaits each attempt and waits between attempts with asyncio.sleep, so the event loop is
+    never blocked.
+
+    Inside a timeout decorated call the deadline is respected, a failed attempt is not retried when the remaining time
+    can not cover the delay plus another attempt as long as the failed one, and the delay is shortened when it fits
+    only partially.
+
+    Args:
+        attempts (int, optional): The number of attempts to execute the function, if None the function will be executed
+        indefinitely until it succeeds or the program is interrupted. Default is None.
+        delay (float | tuple[float, float] | BackoffStrategy, optional): The number of seconds to wait before each
+        attempt, if a tuple is provided, a random delay between the two values will be used (both included). A
+        BackoffStrategy such as ExponentialBackoff, FullJitterBackoff or DecorrelatedJitterBackoff can be provided to
+        compute each delay. Default is 5 seconds.
+        raise_exception (bool, optional): Whether to raise an exception if the function fails after all attempts.
+        Default is True.
+        valid_exceptions (tuple[type[Exception]], optional): A tuple of exceptions that should be caught and
+        retried. If None, all exceptions will be caught. Default is None. Exception subclasses are also caught.
+        budget (RetryBudget | None, optional): Retry budget shared between decorated functions, each call deposits in it
+        and each retry withdraws from it, when it is exhausted the function is not retried. Default is None.
+
+    Raises:
+        TypeError: If the number of attempts is not an integer.
+        ValueError: If the number of attempts is less than 1.
+        TypeError: If the delay is not a number, a tuple or a BackoffStrategy.
+        ValueError: If the delay is less than 0.
+        TypeError: If the delay tuple has elements that are not numbers.
+        ValueError: If the delay tuple does not have 2 elements.
+        ValueError: If the delay tuple has elements that are less than 0.
+        ValueError: If the first element of the delay tuple is greater than or equal to the second element.
+        TypeError: If raise_exception is not a boolean.
+        TypeError: If valid_exceptions is not a tuple.
+        ValueError: If valid_exceptions is empty.
+        TypeError: If the elements of valid_exceptions are not exception types.
+        TypeError: If budget is not a RetryBudget.
+
+    Returns:
+        Callable[..., Any]: The decorated function.
+    """
+    strategy = validate_retry_arguments(
+        attempts=attempts,
+        delay=delay,
+        raise_exception=raise_exception,
+        valid_exceptions=valid_exceptions,
+    )
+
+    if budget is not None and not isinstance(budget, RetryBudget):
+        raise TypeError(f'budget must be a RetryBudget. Got {type(budget).__name__} instead.')
+
+    def retry_delay(attempt: int, previous_delay: float, attempt_duration: float, exception: Exception) -> float | None:  # fmt: skip  # noqa: E501
+        """
+        Decides whether a failed attempt is retried and computes the delay before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+            attempt_duration (float): Seconds the failed attempt took, used as the estimate of the next one.
+            exception (Exception): The exception raised by the failed attempt.
+
+        Returns:
+            float | None: The number of seconds to wait before the next attempt, None if there are no more attempts.
+        """
+        error_message = str(exception).rstrip('.')
+
+        if (attempt + 1) == attempts:
+            print(f'Function failed with error: "{error_message}". No more attempts.')
+            return None
+
+        if budget is not None and not budget.withdraw():
+            print(f'Function failed with error: "{error_message}". Retry budget exhausted, no more attempts.')
+            return None
+
+        _delay = strategy.delay(attempt=attempt, previous_delay=previous_delay)
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= attempt_duration:
+                print(f'Function failed with error: "{error_message}". Deadline too close for another attempt, no more attempts.')  # fmt: skip  # noqa: E501
+                return None
+
+            _delay = min(_delay, remaining - attempt_duration)
+
+        print(f'Function failed with error: "{error_message}". Retrying in {_delay:.2f} seconds ...')
+        return _delay
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:  # noqa: C901
         """
         Decorator that retries to execute a function a given number of times.
 
@@ -109,35 +211,77 @@ def retryit(  # noqa: C901
             Returns:
                 Any: The result of the decorated function.
             """
-            attempt = 0
-            _delay = delay
-            while attempts is None or attempts > 0:
-                if type(delay) is tuple:
-                    _delay = SystemRandom().uniform(a=delay[0], b=delay[1])
+            if budget is not None:
+                budget.deposit()
 
+            attempt = 0
+            _delay = 0.0
+            while True:
                 if attempts:
                     print(f'Attempt [{attempt + 1}/{attempts}] to execute function "{function.__name__}".')
                 else:
                     print(f'Attempt {attempt + 1} to execute function "{function.__name__}".')
 
+                start_time = monotonic()
                 try:
                     return function(*args, **kwargs)
 
                 except valid_exceptions or Exception as exception:  # noqa: B030
-                    error_message = str(exception).rstrip('.')
+                    next_delay = retry_delay(attempt=attempt, previous_delay=_delay, attempt_duration=monotonic() - start_time, exception=exception)  # fmt: skip  # noqa: E501
+                    if next_delay is None:
+                        if raise_exception:
+                            raise exception
 
-                    if (attempt + 1) == attempts:
-                        print(f'Function failed with error: "{error_message}". No more attempts.')
+                        return
+
+                    _delay = next_delay
+                    sleep(_delay)
+                    attempt += 1
+
+        @wraps(wrapped=function)
+        async def async_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+            """
+            Wrapper coroutine that retries to execute a coroutine function a given number of times without blocking
+            the event loop.
+
+            Args:
+                *args (tuple[Any]): Positional arguments passed to the decorated coroutine function.
+                **kwargs (dict[str, Any]): Keyword arguments passed to the decorated coroutine function.
+
+            Returns:
+                Any: The result of the decorated coroutine function.
+            """
+            if budget is not None:
+                budget.deposit()
+
+            attempt = 0
+            _delay = 0.0
+            while True:
+                if attempts:
+                    print(f'Attempt [{attempt + 1}/{attempts}] to execute function "{function.__name__}".')
+                else:
+                    print(f'Attempt {attempt + 1} to execute function "{function.__name__}".')
+
+                start_time = monotonic()
+                try:
+                    return await function(*args, **kwargs)
+
+                except valid_exceptions or Exception as exception:  # noqa: B030
+                    next_delay = retry_delay(attempt=attempt, previous_delay=_delay, attempt_duration=monotonic() - start_time, exception=exception)  # fmt: skip  # noqa: E501
+                    if next_delay is None:
                         if raise_exception:
                             raise exception
 
                         return
 
-                    print(f'Function failed with error: "{error_message}". Retrying in {_delay:.2f} seconds ...')
-                    sleep(_delay)  # type: ignore
+                    from asyncio import sleep as async_sleep  # already loaded while a coroutine runs
+
+                    _delay = next_delay
+                    await async_sleep(_delay)
                     attempt += 1
 
-            return
+        if iscoroutinefunction(function):
+            return async_wrapper
 
         return wrapper
 
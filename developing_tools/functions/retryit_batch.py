@@ -0,0 +1,398 @@
+"""
+This module contains a function that executes a function on a batch of items concurrently, retrying only the items that
+failed.
+"""
+
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Iterator
+from contextvars import copy_context
+from inspect import iscoroutinefunction
+from os import cpu_count
+from time import monotonic, sleep
+from typing import Any, overload
+
+from developing_tools.functions.retryit import validate_retry_arguments
+from developing_tools.utils.backoff import BackoffStrategy
+from developing_tools.utils.deadline import remaining_time
+from developing_tools.utils.override import override
+
+RETRYIT_BATCH_MAX_WORKERS = min(32, (cpu_count() or 1) + 4)
+
+
+class BatchResult:
+    """
+    Outcome of an item of a batch executed by retryit_batch.
+    """
+
+    __index: int
+    __item: Any
+    __value: Any
+    __exception: Exception | None
+    __attempts: int
+
+    def __init__(self, index: int, item: Any, value: Any, exception: Exception | None, attempts: int) -> None:
+        """
+        Initializes the BatchResult.
+
+        Args:
+            index (int): Position of the item in the batch.
+            item (Any): The item.
+            value (Any): The result of the function on the item, None if it failed.
+            exception (Exception | None): The exception of the last attempt, None if it succeeded.
+            attempts (int): Number of attempts executed on the item.
+        """
+        self.__index = index
+        self.__item = item
+        self.__value = value
+        self.__exception = exception
+        self.__attempts = attempts
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the result.
+
+        Returns:
+            str: The string representation of the result.
+        """
+        return f'BatchResult(index={self.index}, item={self.item!r}, value={self.value!r}, exception={self.exception!r}, attempts={self.attempts})'  # fmt: skip  # noqa: E501
+
+    @property
+    def index(self) -> int:
+        """
+        Returns the position of the item in the batch.
+
+        Returns:
+            int: The position of the item.
+        """
+        return self.__index
+
+    @property
+    def item(self) -> Any:
+        """
+        Returns the item.
+
+        Returns:
+            Any: The item.
+        """
+        return self.__item
+
+    @property
+    def value(self) -> Any:
+        """
+        Returns the result of the function on the item.
+
+        Returns:
+            Any: The result of the function, None if it failed.
+        """
+        return self.__value
+
+    @property
+    def exception(self) -> Exception | None:
+        """
+        Returns the exception of the last attempt on the item.
+
+        Returns:
+            Exception | None: The exception, None if the item succeeded.
+        """
+        return self.__exception
+
+    @property
+    def attempts(self) -> int:
+        """
+        Returns the number of attempts executed on the item.
+
+        Returns:
+            int: The number of attempts.
+        """
+        return self.__attempts
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Returns whether the function succeeded on the item.
+
+        Returns:
+            bool: True if the function succeeded.
+        """
+        return self.__exception is None
+
+
+@overload
+def retryit_batch(
+    function: Callable[[Any], Coroutine[Any, Any, Any]],
+    items: Iterable[Any],
+    attempts: int | None = None,
+    delay: float | tuple[float, float] | BackoffStrategy = 5,
+    raise_exception: bool = True,
+    valid_exceptions: tuple[type[Exception]] | None = None,
+    max_workers: int | None = None,
+) -> AsyncIterator[BatchResult]: ...
+
+
+@overload
+def retryit_batch(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    attempts: int | None = None,
+    delay: float | tuple[float, float] | BackoffStrategy = 5,
+    raise_exception: bool = True,
+    valid_exceptions: tuple[type[Exception]] | None = None,
+    max_workers: int | None = None,
+) -> Iterator[BatchResult]: ...
+
+
+def retryit_batch(  # noqa: C901
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    attempts: int | None = None,
+    delay: float | tuple[float, float] | BackoffStrategy = 5,
+    raise_exception: bool = True,
+    valid_exceptions: tuple[type[Exception]] | None = None,
+    max_workers: int | None = None,
+) -> Iterator[BatchResult] | AsyncIterator[BatchResult]:
+    """
+    Executes a function on every item of a batch with the retryit semantics, but instead of retrying each item serially
+    the items run concurrently in rounds: every round executes the pending items on a bounded thread pool, or as
+    asyncio tasks for coroutine functions, and only the items that failed with a valid exception are retried in the
+    next round, after a single delay.
+
+    The results are streamed as they complete, each one a BatchResult with the item, its value or the exception of its
+    last attempt, and the number of attempts. Items that failed with an exception that is not valid are not retried,
+    the rest are given up when there are no more attempts or the deadline of an enclosing timeout can not cover
+    another round. Iterate with 'for' for functions and with 'async for' for coroutine functions.
+
+    Args:
+        function (Callable[[Any], Any]): Function or coroutine function called with each item.
+        items (Iterable[Any]): The items, they are consumed when the iteration starts.
+        attempts (int, optional): The number of attempts on each item, if None the failed items are retried until they
+        succeed. Default is None.
+        delay (float | tuple[float, float] | BackoffStrategy, optional): The number of seconds to wait before each
+        round of retries, a tuple for a random delay between the two values or a BackoffStrategy. Default is 5 seconds.
+        raise_exception (bool, optional): Whether to raise an ExceptionGroup with the exceptions of the failed items
+        once every result has been streamed. Default is True.
+        valid_exceptions (tuple[type[Exception]], optional): A tuple of exceptions that should be caught and retried. If
+        None, all exceptions will be caught. Default is None. Exception subclasses are also caught.
+        max_workers (int | None, optional): Maximum number of items executed at the same time, if None it is
+        min(32, cpu_count + 4). Default is None.
+
+    Raises:
+        TypeError: If function is not callable.
+        TypeError: If max_workers is not an integer or None.
+        ValueError: If max_workers is less than 1.
+        TypeError: If the retry arguments are not valid, see retryit.
+        ValueError: If the retry arguments are not valid, see retryit.
+
+    Returns:
+        Iterator[BatchResult] | AsyncIterator[BatchResult]: The results of the items, in completion order.
+    """
+    if not callable(function):
+        raise TypeError(f'The function must be callable. Got {type(function).__name__} instead.')
+
+    strategy = validate_retry_arguments(
+        attempts=attempts,
+        delay=delay,
+        raise_exception=raise_exception,
+        valid_exceptions=valid_exceptions,
+    )
+
+    if max_workers is not None:
+        if type(max_workers) is not int:
+            raise TypeError(f'The max_workers must be an integer. Got {type(max_workers).__name__} instead.')
+
+        if max_workers < 1:
+            raise ValueError(f'The max_workers must be greater than 0. Got {max_workers} instead.')
+
+    workers = max_workers or RETRYIT_BATCH_MAX_WORKERS
+    retried_exceptions = valid_exceptions or Exception
+
+    def round_message(attempt: int, size: int) -> str:
+        """
+        Returns the message printed when a round starts.
+
+        Args:
+            attempt (int): Number of the round, starting at 0.
+            size (int): Number of items of the round.
+
+        Returns:
+            str: The message.
+        """
+        if attempts:
+            return f'Attempt [{attempt + 1}/{attempts}] to execute function "{function.__name__}" on {size} items.'
+
+        return f'Attempt {attempt + 1} to execute function "{function.__name__}" on {size} items.'
+
+    def retry_delay(attempt: int, previous_delay: float, round_duration: float, failed: int) -> float | None:
+        """
+        Decides whether the failed items of a round are retried and computes the delay before the next round.
+
+        Args:
+            attempt (int): Number of the round, starting at 0.
+            previous_delay (float): Delay used before the round, 0 for the first one.
+            round_duration (float): Seconds the round took, used as the estimate of the next one.
+            failed (int): Number of items that failed with a valid exception.
+
+        Returns:
+            float | None: The number of seconds to wait before the next round, None if the items are not retried.
+        """
+        if not failed:
+            return None
+
+        if (attempt + 1) == attempts:
+            print(f'Function failed on {failed} items. No more attempts.')
+            return None
+
+        _delay = strategy.delay(attempt=attempt, previous_delay=previous_delay)
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= round_duration:
+                print(f'Function failed on {failed} items. Deadline too close for another attempt, no more attempts.')
+                return None
+
+            _delay = min(_delay, remaining - round_duration)
+
+        print(f'Function failed on {failed} items. Retrying in {_delay:.2f} seconds ...')
+        return _delay
+
+    def raise_failures(failures: list[Exception]) -> None:
+        """
+        Raises the exceptions of the failed items when raise_exception is True.
+
+        Args:
+            failures (list[Exception]): The exceptions of the failed items.
+
+        Raises:
+            ExceptionGroup: If any item failed and raise_exception is True.
+        """
+        if failures and raise_exception:
+            raise ExceptionGroup(f'Function {function.__name__} failed on {len(failures)} items.', failures)
+
+    def thread_batch() -> Iterator[BatchResult]:
+        """
+        Executes the batch on a bounded thread pool.
+
+        Yields:
+            BatchResult: The result of each item, as it completes.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        pending = list(enumerate(items))
+        failures: list[Exception] = []
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='retryit_batch')
+        try:
+            attempt = 0
+            _delay = 0.0
+            while pending:
+                print(round_message(attempt=attempt, size=len(pending)))
+
+                start_time = monotonic()
+                futures = {executor.submit(copy_context().run, function, item): (index, item) for index, item in pending}  # fmt: skip  # noqa: E501
+                failed: list[tuple[int, Any, Exception]] = []
+                for future in as_completed(futures):
+                    index, item = futures[future]
+                    try:
+                        value = future.result()
+
+                    except retried_exceptions as exception:
+                        failed.append((index, item, exception))
+                        continue
+
+                    except Exception as exception:
+                        failures.append(exception)
+                        yield BatchResult(index=index, item=item, value=None, exception=exception, attempts=attempt + 1)  # fmt: skip  # noqa: E501
+                        continue
+
+                    yield BatchResult(index=index, item=item, value=value, exception=None, attempts=attempt + 1)
+
+                next_delay = retry_delay(attempt=attempt, previous_delay=_delay, round_duration=monotonic() - start_time, failed=len(failed))  # fmt: skip  # noqa: E501
+                if next_delay is None:
+                    for index, item, error in failed:
+                        failures.append(error)
+                        yield BatchResult(index=index, item=item, value=None, exception=error, attempts=attempt + 1)  # fmt: skip  # noqa: E501
+
+                    break
+
+                _delay = next_delay
+                sleep(_delay)
+                pending = [(index, item) for index, item, _ in failed]
+                attempt += 1
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        raise_failures(failures=failures)
+
+    async def async_batch() -> AsyncIterator[BatchResult]:
+        """
+        Executes the batch as asyncio tasks, at most max_workers at the same time.
+
+        Yields:
+            BatchResult: The result of each item, as it completes.
+        """
+        from asyncio import Semaphore, as_completed, create_task, sleep as async_sleep
+
+        semaphore = Semaphore(value=workers)
+
+        async def execute(index: int, item: Any) -> tuple[int, Any, Any, Exception | None]:
+            """
+            Executes the coroutine function on an item once a worker slot is free.
+
+            Args:
+                index (int): Position of the item in the batch.
+                item (Any): The item.
+
+            Returns:
+                tuple[int, Any, Any, Exception | None]: The index, the item, the result and the exception raised.
+            """
+            async with semaphore:
+                try:
+                    return index, item, await function(item), None
+
+                except Exception as exception:
+                    return index, item, None, exception
+
+        pending = list(enumerate(items))
+        failures: list[Exception] = []
+        attempt = 0
+        _delay = 0.0
+        while pending:
+            print(round_message(attempt=attempt, size=len(pending)))
+
+            start_time = monotonic()
+            tasks = [create_task(execute(index=index, item=item)) for index, item in pending]
+            failed: list[tuple[int, Any, Exception]] = []
+            try:
+                for next_completed in as_completed(tasks):
+                    index, item, value, exception = await next_completed
+                    if exception is None:
+                        yield BatchResult(index=index, item=item, value=value, exception=None, attempts=attempt + 1)
+
+                    elif isinstance(exception, retried_exceptions):
+                        failed.append((index, item, exception))
+
+                    else:
+                        failures.append(exception)
+                        yield BatchResult(index=index, item=item, value=None, exception=exception, attempts=attempt + 1)  # fmt: skip  # noqa: E501
+
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            next_delay = retry_delay(attempt=attempt, previous_delay=_delay, round_duration=monotonic() - start_time, failed=len(failed))  # fmt: skip  # noqa: E501
+            if next_delay is None:
+                for index, item, error in failed:
+                    failures.append(error)
+                    yield BatchResult(index=index, item=item, value=None, exception=error, attempts=attempt + 1)
+
+                break
+
+            _delay = next_delay
+            await async_sleep(_delay)
+            pending = [(index, item) for index, item, _ in failed]
+            attempt += 1
+
+        raise_failures(failures=failures)
+
+    if iscoroutinefunction(function):
+        return async_batch()
+
+    return thread_batch()
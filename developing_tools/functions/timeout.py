@@ -2,44 +2,252 @@
 Decorator to set a timeout for a function.
 """
 
+import signal
 from collections.abc import Callable
+from contextvars import copy_context
 from functools import wraps
-from threading import Thread
-from typing import Any
+from os import cpu_count
+from threading import Lock, current_thread, main_thread
+from time import monotonic
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Literal
 
+from developing_tools.utils.deadline import deadline_scope
 
-def function_execution(
-    function_output: list[Any],
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import ThreadPoolExecutor
+
+    from developing_tools.utils.process_pool import ProcessPool
+
+TIMEOUT_MAX_WORKERS = min(32, (cpu_count() or 1) + 4)
+TIMEOUT_MAX_PROCESSES = cpu_count() or 1
+
+_executor: 'ThreadPoolExecutor | None' = None
+_executor_lock = Lock()
+_process_pool: 'ProcessPool | None' = None
+_process_pool_lock = Lock()
+_process_references: dict[Callable[..., Any], bytes] = {}
+
+
+def get_executor() -> 'ThreadPoolExecutor':
+    """
+    Returns the bounded thread pool shared by every function decorated with the thread isolation, creating it on first
+    use. concurrent.futures is only imported then, so it is not paid at import time.
+
+    Returns:
+        ThreadPoolExecutor: The shared thread pool.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _executor = ThreadPoolExecutor(max_workers=TIMEOUT_MAX_WORKERS, thread_name_prefix='timeout')
+
+    return _executor
+
+
+def get_process_pool() -> 'ProcessPool':
+    """
+    Returns the bounded pool of worker processes shared by every function decorated with the process isolation,
+    creating it on first use. multiprocessing is only imported then, so it is not paid at import time.
+
+    Returns:
+        ProcessPool: The shared process pool.
+    """
+    global _process_pool
+
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                from developing_tools.utils.process_pool import ProcessPool
+
+                _process_pool = ProcessPool(max_workers=TIMEOUT_MAX_PROCESSES)
+
+    return _process_pool
+
+
+def thread_execution(
+    function: Callable[..., Any],
+    seconds: float,
+    remaining: float,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """
+    Execute the function in the shared thread pool and wait for it at most the remaining seconds. The function
+    runs in a copy of the caller context, so it sees the caller deadline.
+
+    Args:
+        function (Callable[..., Any]): Function to execute.
+        seconds (float): Configured timeout in seconds, reported in the TimeoutError.
+        remaining (float): Seconds to wait, the configured timeout or less when an enclosing deadline is closer.
+        args (tuple[Any, ...]): Function positional arguments.
+        kwargs (dict[str, Any]): Function keyword arguments.
+
+    Raises:
+        TimeoutError: If the function execution exceeds the timeout.
+        Exception: If the function raises an exception.
+
+    Returns:
+        Any: The result of the function.
+    """
+    future = get_executor().submit(copy_context().run, function, *args, **kwargs)
+
+    try:
+        return future.result(timeout=remaining)
+
+    except TimeoutError:
+        if future.done():  # the function raised TimeoutError itself or finished right at the deadline
+            return future.result()
+
+        future.cancel()  # only succeeds if the call is still queued, a running call is abandoned
+        raise TimeoutError(f'Function {function.__name__} exceeded the {seconds} seconds timeout.') from None
+
+
+def signal_execution(
     function: Callable[..., Any],
-    args: tuple[Any],
+    seconds: float,
+    remaining: float,
+    args: tuple[Any, ...],
     kwargs: dict[str, Any],
-) -> None:
+) -> Any:
     """
-    Execute the function and store the result in the function_output list.
+    Execute the function in the current thread and interrupt it with a SIGALRM signal when the timeout expires. An
+    enclosing signal timeout is kept, its timer is restored when the function finishes and it fires right away if it
+    expired meanwhile.
 
     Args:
-        function_output (list[Any]): List to store the function result.
         function (Callable[..., Any]): Function to execute.
-        args (tuple[Any]): Function positional arguments.
+        seconds (float): Configured timeout in seconds, reported in the TimeoutError.
+        remaining (float): Seconds to wait, the configured timeout or less when an enclosing deadline is closer.
+        args (tuple[Any, ...]): Function positional arguments.
         kwargs (dict[str, Any]): Function keyword arguments.
+
+    Raises:
+        RuntimeError: If it is not called from the main thread.
+        TimeoutError: If the function execution exceeds the timeout.
+        Exception: If the function raises an exception.
+
+    Returns:
+        Any: The result of the function.
     """
+    if current_thread() is not main_thread():
+        raise RuntimeError(f'Signal timeout can only be used from the main thread. Got {current_thread().name} instead.')  # fmt: skip  # noqa: E501
+
+    def handler(signum: int, frame: FrameType | None) -> None:
+        """
+        Signal handler that interrupts the function execution, or runs the handler of the enclosing signal timeout if
+        it is the one that expired.
+
+        Args:
+            signum (int): Signal number.
+            frame (FrameType | None): Current stack frame.
+
+        Raises:
+            TimeoutError: Always, the function exceeded the timeout.
+        """
+        enclosing_expired = not armed or previous_remaining <= remaining  # before arming only the enclosing timer runs
+        if previous_remaining > 0 and enclosing_expired and callable(previous_handler):
+            expired.append(True)
+            previous_handler(signum, frame)
+
+        raise TimeoutError(f'Function {function.__name__} exceeded the {seconds} seconds timeout.')
+
+    expired: list[bool] = []
+    armed: list[bool] = []
+    previous_handler = signal.getsignal(signal.SIGALRM)  # read before the handler can run, it uses both of them
+    previous_remaining, previous_interval = signal.getitimer(signal.ITIMER_REAL)
+    started_at = monotonic()
     try:
-        function_output.append(function(*args, **kwargs))
+        signal.signal(signal.SIGALRM, handler)
+        if 0 < previous_remaining <= remaining:  # the enclosing signal timeout expires first
+            signal.setitimer(signal.ITIMER_REAL, max(previous_remaining - (monotonic() - started_at), 1e-6))
+
+        else:
+            signal.setitimer(signal.ITIMER_REAL, remaining)
+
+        armed.append(True)
+        return function(*args, **kwargs)
+
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        if previous_remaining > 0 and not expired:  # re-arm the enclosing signal timeout with the time it has left
+            left = previous_remaining - (monotonic() - started_at)
+            if left > 0:
+                signal.setitimer(signal.ITIMER_REAL, left, previous_interval)
+
+            else:
+                signal.raise_signal(signal.SIGALRM)
 
-    except Exception as exception:
-        function_output.append(exception)
 
+def process_execution(
+    function: Callable[..., Any],
+    seconds: float,
+    remaining: float,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """
+    Execute the function in a warm worker process and terminate the process when the timeout expires.
+
+    Args:
+        function (Callable[..., Any]): Function to execute, it, its arguments and its result must be picklable.
+        seconds (float): Configured timeout in seconds, reported in the TimeoutError.
+        remaining (float): Seconds to wait, the configured timeout or less when an enclosing deadline is closer.
+        args (tuple[Any, ...]): Function positional arguments.
+        kwargs (dict[str, Any]): Function keyword arguments.
+
+    Raises:
+        TimeoutError: If the function execution exceeds the timeout.
+        RuntimeError: If the worker process dies while executing the function.
+        Exception: If the function raises an exception.
 
-def timeout(seconds: int | float = 10) -> Callable[..., Any]:
+    Returns:
+        Any: The result of the function.
+    """
+    reference = _process_references.get(function)
+    if reference is None:
+        from developing_tools.utils.process_pool import function_reference
+
+        reference = _process_references.setdefault(function, function_reference(function=function))
+
+    return get_process_pool().execute(function=function, reference=reference, seconds=seconds, remaining=remaining, args=args, kwargs=kwargs)  # fmt: skip  # noqa: E501
+
+
+def timeout(
+    seconds: int | float = 10,
+    isolation: Literal['thread', 'signal', 'process'] = 'thread',
+) -> Callable[..., Any]:
     """
     Decorator to set a timeout for a function.
 
+    With the thread isolation the function runs in a bounded thread pool shared by every decorated function and the
+    caller gets the TimeoutError as soon as the timeout expires, the abandoned call keeps running in its worker thread
+    until it finishes. With the signal isolation no thread is used at all, the function runs in the caller thread and
+    is interrupted with SIGALRM, it is only available on Unix and from the main thread. With the process isolation the
+    function runs in a reusable worker process from a warm pool, when the timeout expires the worker is terminated and
+    replaced, so CPU-bound calls are really stopped, the function, its arguments and its result must be picklable.
+
+    The timeout sets the deadline of the call, available to the function through remaining_time from
+    developing_tools.utils.deadline. Nested timeout and
+    retryit decorated calls respect it: a nested timeout never waits past it and retryit does not retry when the
+    remaining time can not cover another attempt. The deadline does not reach the worker processes of the process
+    isolation.
+
     Args:
         seconds (int, float, optional): Timeout in seconds. Defaults to 10.
+        isolation (Literal['thread', 'signal', 'process'], optional): How the function is executed and interrupted.
+        Defaults to 'thread'.
 
     Raises:
         TypeError: If the timeout seconds is not an integer or a float.
         ValueError: If the timeout seconds is less than or equal to zero.
+        ValueError: If the isolation is not 'thread', 'signal' or 'process'.
+        ValueError: If the signal isolation is not supported on this platform.
 
     Returns:
         Callable[..., Any]: Decorator function.
@@ -50,6 +258,14 @@ def timeout(seconds: int | float = 10) -> Callable[..., Any]:
     if seconds <= 0:
         raise ValueError('Timeout seconds must be greater than zero.')
 
+    if isolation not in ('thread', 'signal', 'process'):
+        raise ValueError(f'Timeout isolation must be "thread", "signal" or "process". Got {isolation} instead.')
+
+    if isolation == 'signal' and not hasattr(signal, 'setitimer'):
+        raise ValueError('Timeout signal isolation is not supported on this platform.')
+
+    execution = {'thread': thread_execution, 'signal': signal_execution, 'process': process_execution}[isolation]
+
     def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
         """
         Decorator to set a timeout for a function.
@@ -71,25 +287,23 @@ def timeout(seconds: int | float = 10) -> Callable[..., Any]:
                 **kwargs (dict[str, Any]): Keyword arguments passed to the decorated function.
 
             Raises:
+                TimeoutError: If the deadline of the caller has already expired.
                 TimeoutError: If the function execution exceeds the timeout.
                 Exception: If the decorated function raises an exception.
 
             Returns:
                 Any: The result of the decorated function.
             """
-            result: list[Any] = []  # It must be a list to be mutable inside the thread.
-            thread = Thread(target=function_execution, args=(result, function, args, kwargs))
-            thread.start()
+            with deadline_scope(seconds=seconds) as remaining:
+                if remaining <= 0:
+                    raise TimeoutError(f'Function {function.__name__} was not executed, the deadline has already expired.')  # fmt: skip  # noqa: E501
 
-            thread.join(timeout=seconds)
-            if thread.is_alive():
-                thread.join()
-                raise TimeoutError(f'Function {function.__name__} exceeded the {seconds} seconds timeout.')
+                return execution(function, seconds, remaining, args, kwargs)
 
-            if isinstance(result[0], Exception):
-                raise result[0]
+        if isolation == 'process':
+            from developing_tools.utils.process_pool import PROCESS_TARGET_ATTRIBUTE
 
-            return result[0]
+            setattr(wrapper, PROCESS_TARGET_ATTRIBUTE, function)  # lets worker processes find the undecorated function
 
         return wrapper
 
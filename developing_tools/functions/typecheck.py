@@ -0,0 +1,240 @@
+"""
+Decorator to validate the arguments and return value of a function against its type annotations.
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from inspect import Parameter, iscoroutinefunction, signature
+from typing import Any, get_type_hints
+
+from developing_tools.utils.specialized_wrapper import specialized_wrapper, wrapper_signature
+from developing_tools.utils.type_validator import TYPECHECK_SAMPLE_SIZE, accept, compile_validator, type_name
+
+RETURN_BODY = """\
+result = {call}
+if not validate_return(result):
+    fail('return value', result, 'return')
+
+return result
+"""
+
+
+def typecheck(  # noqa: C901
+    check_return: bool = True,
+    sample_size: int | None = TYPECHECK_SAMPLE_SIZE,
+) -> Callable[..., Any]:
+    """
+    Decorator to validate the arguments and return value of a function against its type annotations, raising a
+    TypeError when they do not match.
+
+    Every annotation is compiled once into a cached validator, at decoration time or on the first call when an
+    annotation references a name that is not defined yet, like the class being defined. Plain classes, None, Any,
+    unions, Optional, Literal, Annotated, NewType, TypeVar, type[C], Callable, tuples and generic collections, mappings
+    and iterables are supported, other annotations accept every value. The wrapper is generated with the signature of
+    the function, so it only runs the checks of the annotated parameters and the defaults are not validated, see
+    specialized_wrapper.
+
+    Collections larger than sample_size are validated by sampling sample_size elements, evenly spaced in sequences,
+    and iterators and generators are never consumed, only their class is validated. The return value of coroutine
+    functions is the awaited value.
+
+    Args:
+        check_return (bool, optional): Whether to validate the return value. Default is True.
+        sample_size (int | None, optional): Maximum number of elements validated of each collection, if None every
+        element is validated. Default is TYPECHECK_SAMPLE_SIZE.
+
+    Raises:
+        TypeError: If check_return is not a boolean.
+        TypeError: If sample_size is not an integer or None.
+        ValueError: If sample_size is less than 1.
+
+    Returns:
+        Callable[..., Any]: Decorator function.
+    """
+    if type(check_return) is not bool:
+        raise TypeError(f'The check_return must be a boolean. Got {type(check_return).__name__} instead.')
+
+    if sample_size is not None:
+        if type(sample_size) is not int:
+            raise TypeError(f'The sample_size must be an integer. Got {type(sample_size).__name__} instead.')
+
+        if sample_size < 1:
+            raise ValueError(f'The sample_size must be greater than 0. Got {sample_size} instead.')
+
+    def compile_wrapper(function: Callable[..., Any], hints: dict[str, Any]) -> Callable[..., Any]:
+        """
+        Compiles the validators of the resolved annotations of a function and generates its wrapper.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+            hints (dict[str, Any]): The resolved annotations of the function.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+        validators = {name: compile_validator(annotation=hint, sample_size=sample_size) for name, hint in hints.items()}  # fmt: skip  # noqa: E501
+        validators = {name: validator for name, validator in validators.items() if validator is not accept}
+        validate_return = validators.pop('return', accept) if check_return else accept
+        validators.pop('return', None)
+
+        function_signature = signature(function)
+        variable_kinds = {name: parameter.kind for name, parameter in function_signature.parameters.items() if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)}  # fmt: skip  # noqa: E501
+
+        def fail(name: str, value: Any, annotation_name: str) -> None:
+            """
+            Raises the error of an argument or return value that does not match its annotation.
+
+            Args:
+                name (str): Description of the value.
+                value (Any): The value.
+                annotation_name (str): Name of the parameter, or return, whose annotation is not matched.
+
+            Raises:
+                TypeError: Always.
+            """
+            raise TypeError(f'The {name} of function {function.__qualname__} must be {type_name(annotation=hints[annotation_name])}. Got {type(value).__name__} instead.')  # fmt: skip  # noqa: E501
+
+        def check_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+            """
+            Validates the arguments of a call received as *args and **kwargs.
+
+            Args:
+                args (tuple[Any, ...]): Positional arguments of the call.
+                kwargs (dict[str, Any]): Keyword arguments of the call.
+
+            Raises:
+                TypeError: If the arguments do not match the signature or an argument does not match its annotation.
+            """
+            for name, value in function_signature.bind(*args, **kwargs).arguments.items():
+                validator = validators.get(name)
+                if validator is None:
+                    continue
+
+                kind = variable_kinds.get(name)
+                values = value if kind is Parameter.VAR_POSITIONAL else value.values() if kind is Parameter.VAR_KEYWORD else (value,)  # fmt: skip  # noqa: E501
+                for element in values:
+                    if not validator(element):
+                        fail(f'argument {name}', element, name)
+
+        # the specialized wrapper checks each annotated parameter in place, the defaults are not validated
+        parameters = getattr(wrapper_signature(function=function), 'parameters', {})
+        names = [name for name in validators if name in parameters]
+        tracked = [name for name in names if parameters[name].default is not Parameter.empty]
+
+        namespace: dict[str, Any] = {'check_arguments': check_arguments, 'fail': fail, 'validate_return': validate_return}  # fmt: skip  # noqa: E501
+        checks = ''
+        for index, name in enumerate(names):
+            namespace[f'_validate_{index}'] = validators[name]
+            missing = f'{name} is not MISSING and ' if name in tracked else ''
+            checks += f"if {missing}not _validate_{index}({name}):\n    fail('argument {name}', {name}, '{name}')\n\n"  # fmt: skip  # noqa: E501
+
+        call = 'await {call}' if iscoroutinefunction(function) else '{call}'
+        if validate_return is accept:
+            body = generic_body = f'return {call}\n'
+
+        else:
+            body = generic_body = RETURN_BODY.replace('{call}', call)
+
+        if validators:
+            generic_body = f'check_arguments(args, kwargs)\n{generic_body}'
+
+        return specialized_wrapper(
+            function=function,
+            body=checks + body,
+            namespace=namespace,
+            tracked=tracked,
+            generic_body=generic_body,
+            asynchronous=iscoroutinefunction(function),
+            reads=names,
+        )
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Decorator to validate the arguments and return value of a function. Annotations that can not be resolved yet,
+        like forward references to the class being defined, are resolved on the first call.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+        try:
+            hints = get_type_hints(function, include_extras=True)
+
+        except NameError:
+            return lazy_wrapper(function=function)
+
+        return compile_wrapper(function=function, hints=hints)
+
+    def lazy_wrapper(function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Returns a wrapper that resolves the annotations of the function on its first call, compiles the wrapper once
+        and delegates every call to it.
+
+        Args:
+            function (Callable[..., Any]): Function to decorate.
+
+        Returns:
+            Callable[..., Any]: Wrapper function.
+        """
+        compiled: list[Callable[..., Any]] = []
+
+        def resolve() -> Callable[..., Any]:
+            """
+            Returns the compiled wrapper, compiling it on the first call.
+
+            Raises:
+                NameError: If an annotation can not be resolved.
+
+            Returns:
+                Callable[..., Any]: The compiled wrapper.
+            """
+            if not compiled:
+                compiled.append(compile_wrapper(function=function, hints=get_type_hints(function, include_extras=True)))  # fmt: skip  # noqa: E501
+
+            return compiled[0]
+
+        if iscoroutinefunction(function):
+
+            @wraps(wrapped=function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                """
+                Wrapper function to validate the arguments and awaited value of the decorated coroutine function.
+
+                Args:
+                    *args (Any): Positional arguments passed to the decorated function.
+                    **kwargs (Any): Keyword arguments passed to the decorated function.
+
+                Raises:
+                    NameError: If an annotation can not be resolved.
+                    TypeError: If an argument or the awaited value does not match its annotation.
+
+                Returns:
+                    Any: The awaited value of the decorated function.
+                """
+                return await resolve()(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(wrapped=function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """
+            Wrapper function to validate the arguments and return value of the decorated function.
+
+            Args:
+                *args (Any): Positional arguments passed to the decorated function.
+                **kwargs (Any): Keyword arguments passed to the decorated function.
+
+            Raises:
+                NameError: If an annotation can not be resolved.
+                TypeError: If an argument or the return value does not match its annotation.
+
+            Returns:
+                Any: The result of the decorated function.
+            """
+            return resolve()(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,3 +1,22 @@
-from .singleton_pattern import SingletonPattern
+from typing import TYPE_CHECKING
 
-__all__ = ('SingletonPattern',)
+from developing_tools.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .multiton_pattern import MultitonPattern, MultitonRegistry
+    from .singleton_pattern import SingletonPattern
+
+__all__ = (
+    'MultitonPattern',
+    'MultitonRegistry',
+    'SingletonPattern',
+)
+
+__getattr__, __dir__ = lazy_exports(
+    package=__name__,
+    exports={
+        'MultitonPattern': 'multiton_pattern',
+        'MultitonRegistry': 'multiton_pattern',
+        'SingletonPattern': 'singleton_pattern',
+    },
+)
@@ -0,0 +1,552 @@
+"""
+Multiton Pattern metaclass and registry to be used in the creation of one instance per key, like per-tenant clients or
+per-DSN connection handles.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import partial
+from inspect import Parameter, Signature, signature
+from threading import get_ident
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+from weakref import ref
+
+from developing_tools.utils.cache import ABANDONED, CacheShard, CacheStatistics, make_key, make_shards
+from developing_tools.utils.override import override
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
+MULTITON_OPTIONS = ('max_size', 'ttl', 'weak', 'key', 'on_evict')
+POSITIONAL_KINDS = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def signature_key(function_signature: Signature | None) -> Callable[..., Hashable]:
+    """
+    Returns the default key function of the constructor arguments of the given signature. The arguments are bound to
+    the signature with their defaults applied, so passing an argument by position, by keyword or omitting it when it
+    has its default value give the same key.
+
+    Args:
+        function_signature (Signature | None): Signature of the constructor, if None the positional and keyword
+        arguments are used as given.
+
+    Returns:
+        Callable[..., Hashable]: The key function, the arguments must be hashable.
+    """
+    if function_signature is None:
+        return make_key
+
+    parameters = tuple(function_signature.parameters.values())
+    positional = all(parameter.kind in POSITIONAL_KINDS for parameter in parameters)
+
+    def key(*args: Any, **kwargs: Any) -> Hashable:
+        """
+        Returns the key of the constructor arguments.
+
+        Args:
+            *args (Any): Positional arguments of the constructor.
+            **kwargs (Any): Keyword arguments of the constructor.
+
+        Returns:
+            Hashable: The key of the arguments.
+        """
+        if positional and not kwargs and len(args) == len(parameters):  # already bound, skip the binding
+            return args
+
+        try:
+            bound = function_signature.bind(*args, **kwargs)
+
+        except TypeError:  # the constructor raises the error
+            return make_key(*args, **kwargs)
+
+        bound.apply_defaults()
+        return make_key(*bound.args, **bound.kwargs)
+
+    return key
+
+
+def constructor_signature(cls: type) -> Signature | None:
+    """
+    Returns the signature of the __init__ method of a class without its self parameter.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        Signature | None: The signature of the constructor, None if it can not be inspected.
+    """
+    try:
+        parameters = tuple(signature(cls.__init__).parameters.values())  # type: ignore[misc]
+
+    except (TypeError, ValueError):
+        return None
+
+    return Signature(parameters=parameters[1:])
+
+
+class MultitonRegistry:
+    """
+    Thread-safe registry of one instance per key, the key is derived from the constructor arguments. The registry can
+    be bounded, evicting the least recently used instance, instances can expire after being idle for ttl seconds and
+    they can be held through weak references, so instances that are no longer used elsewhere are freed.
+
+    Instances are split in shards by key hash, each shard has its own lock so there is no lock shared by every key, and
+    the factory runs outside of the locks, concurrent creations with the same key wait for the first one instead of
+    creating another instance. Bounded registries are split as caches are, see make_shards.
+    """
+
+    __factory: Callable[..., Any]
+    __max_size: int | None
+    __ttl: float | None
+    __weak: bool
+    __key: Callable[..., Hashable]
+    __on_evict: Callable[[Hashable, Any], Any] | None
+    __shards: tuple[CacheShard, ...]
+
+    def __init__(  # noqa: C901
+        self,
+        factory: Callable[..., Any],
+        max_size: int | None = None,
+        ttl: float | None = None,
+        weak: bool = False,
+        key: Callable[..., Hashable] | None = None,
+        on_evict: Callable[[Hashable, Any], Any] | None = None,
+    ) -> None:
+        """
+        Initializes an empty MultitonRegistry.
+
+        Args:
+            factory (Callable[..., Any]): Function that receives the constructor arguments and creates the instance.
+            max_size (int | None, optional): Maximum number of instances, the least recently used instance is evicted
+            when the registry is full, if None the registry is unbounded. Defaults to None.
+            ttl (float | None, optional): Seconds an instance stays registered without being requested, if None
+            instances never expire. Defaults to None.
+            weak (bool, optional): Whether the instances are held through weak references, so they are freed once they
+            are no longer used elsewhere. Defaults to False.
+            key (Callable[..., Hashable] | None, optional): Function that receives the constructor arguments and returns
+            the key of the instance, if None the arguments bound to the signature of the factory with their defaults
+            applied are used, so they must be hashable. Defaults to None.
+            on_evict (Callable[[Hashable, Any], Any] | None, optional): Function called with the key and the instance
+            of every instance evicted, expired or removed, for example to close it. It is not called for instances
+            freed by the garbage collector. Defaults to None.
+
+        Raises:
+            TypeError: If factory is not callable.
+            TypeError: If max_size is not an integer or None.
+            ValueError: If max_size is less than 1.
+            TypeError: If ttl is not a number or None.
+            ValueError: If ttl is not greater than 0.
+            TypeError: If weak is not a boolean.
+            TypeError: If key is not callable or None.
+            TypeError: If on_evict is not callable or None.
+        """
+        if not callable(factory):
+            raise TypeError(f'The factory must be callable. Got {type(factory).__name__} instead.')
+
+        if max_size is not None:
+            if type(max_size) is not int:
+                raise TypeError(f'The max_size must be an integer. Got {type(max_size).__name__} instead.')
+
+            if max_size < 1:
+                raise ValueError(f'The max_size must be greater than 0. Got {max_size} instead.')
+
+        if ttl is not None:
+            if type(ttl) not in [int, float]:
+                raise TypeError(f'The ttl must be a number. Got {type(ttl).__name__} instead.')
+
+            if ttl <= 0:
+                raise ValueError(f'The ttl must be greater than 0. Got {ttl} instead.')
+
+        if type(weak) is not bool:
+            raise TypeError(f'The weak must be a boolean. Got {type(weak).__name__} instead.')
+
+        if key is not None and not callable(key):
+            raise TypeError(f'The key must be callable. Got {type(key).__name__} instead.')
+
+        if on_evict is not None and not callable(on_evict):
+            raise TypeError(f'The on_evict must be callable. Got {type(on_evict).__name__} instead.')
+
+        self.__factory = factory
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__weak = weak
+        if key is None:
+            try:
+                key = signature_key(function_signature=signature(factory))
+
+            except (TypeError, ValueError):
+                key = make_key
+
+        self.__key = key
+        self.__on_evict = on_evict
+
+        self.__shards = make_shards(max_size=max_size)
+
+    @property
+    def max_size(self) -> int | None:
+        """
+        Returns the maximum number of instances.
+
+        Returns:
+            int | None: The maximum number of instances, None if the registry is unbounded.
+        """
+        return self.__max_size
+
+    @property
+    def ttl(self) -> float | None:
+        """
+        Returns the idle time to live of the instances.
+
+        Returns:
+            float | None: The idle time to live in seconds, None if instances never expire.
+        """
+        return self.__ttl
+
+    @property
+    def weak(self) -> bool:
+        """
+        Returns whether the instances are held through weak references.
+
+        Returns:
+            bool: Whether the instances are held through weak references.
+        """
+        return self.__weak
+
+    def key(self, *args: Any, **kwargs: Any) -> Hashable:
+        """
+        Returns the key of the instance created with the given constructor arguments.
+
+        Args:
+            *args (Any): Positional arguments of the constructor.
+            **kwargs (Any): Keyword arguments of the constructor.
+
+        Returns:
+            Hashable: The key of the instance.
+        """
+        return self.__key(*args, **kwargs)
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns the instance of the key of the given constructor arguments, creating it with the factory if it is not
+        registered, it expired or it was freed. If the factory raises, nothing is registered and the calls waiting for
+        it raise the same exception, unless it is not an Exception, such as a KeyboardInterrupt, then one of the
+        waiting calls creates the instance instead.
+
+        Args:
+            *args (Any): Positional arguments of the constructor.
+            **kwargs (Any): Keyword arguments of the constructor.
+
+        Raises:
+            RuntimeError: If the factory requests the instance of the key it is creating, which would wait for itself.
+
+        Returns:
+            Any: The instance of the key.
+        """
+        key = self.__key(*args, **kwargs)
+        shard = self.__shards[hash(key) % len(self.__shards)]
+        while True:
+            evicted: list[tuple[Hashable, Any]] = []
+            with shard.lock:
+                instance, found = self.__lookup(shard=shard, key=key, evicted=evicted)
+                if found:
+                    return instance
+
+                future, owner = self.__join(shard=shard, key=key)
+
+            self.__notify(evicted=evicted)
+            if future is None:
+                raise RuntimeError(f'The instance of the key {key!r} was requested while it is being created in the same thread.')  # fmt: skip  # noqa: E501
+
+            if owner:
+                break
+
+            instance = future.result()
+            if instance is not ABANDONED:
+                return instance
+
+        try:
+            instance = self.__factory(*args, **kwargs)
+
+        except BaseException as exception:
+            with shard.lock:
+                shard.in_flight.pop(key)
+
+            if isinstance(exception, Exception):
+                future.set_exception(exception)
+            else:
+                future.set_result(ABANDONED)  # an interruption of this call, a waiting call creates the instance
+
+            raise
+
+        evicted = []
+        with shard.lock:
+            shard.in_flight.pop(key)
+            self.__store(shard=shard, key=key, instance=instance, evicted=evicted)
+
+        future.set_result(instance)
+        self.__notify(evicted=evicted)
+        return instance
+
+    def evict(self, *args: Any, **kwargs: Any) -> bool:
+        """
+        Removes the instance of the key of the given constructor arguments, calling on_evict with it.
+
+        Args:
+            *args (Any): Positional arguments of the constructor.
+            **kwargs (Any): Keyword arguments of the constructor.
+
+        Returns:
+            bool: True if an instance was registered with the key.
+        """
+        key = self.__key(*args, **kwargs)
+        shard = self.__shards[hash(key) % len(self.__shards)]
+        with shard.lock:
+            entry = shard.entries.pop(key, None)
+
+        if entry is None:
+            return False
+
+        instance = self.__instance(reference=entry[0])
+        self.__notify(evicted=[(key, instance)])
+        return instance is not None
+
+    def clear(self) -> None:
+        """
+        Removes every instance, calling on_evict with each of them. The statistics are kept.
+        """
+        evicted: list[tuple[Hashable, Any]] = []
+        for shard in self.__shards:
+            with shard.lock:
+                evicted.extend((key, self.__instance(reference=reference)) for key, (reference, _) in shard.entries.items())  # fmt: skip  # noqa: E501
+                shard.entries.clear()
+
+        self.__notify(evicted=evicted)
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Returns the statistics of the registry, hits are the calls that got a registered instance or waited for a
+        concurrent creation and misses are the creations.
+
+        Returns:
+            CacheStatistics: The statistics of the registry.
+        """
+        hits = misses = evictions = expirations = size = 0
+        for shard in self.__shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                expirations += shard.expirations
+                size += len(shard.entries)
+
+        return CacheStatistics(hits=hits, misses=misses, evictions=evictions, expirations=expirations, size=size)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of registered instances, weakly held instances already freed are counted until they are
+        requested again or evicted.
+
+        Returns:
+            int: The number of registered instances.
+        """
+        return sum(len(shard.entries) for shard in self.__shards)
+
+    def __instance(self, reference: Any) -> Any:
+        """
+        Returns the instance held by an entry.
+
+        Args:
+            reference (Any): The instance or its weak reference.
+
+        Returns:
+            Any: The instance, None if it was freed.
+        """
+        return reference() if self.__weak else reference
+
+    def __lookup(self, shard: CacheShard, key: Hashable, evicted: list[tuple[Hashable, Any]]) -> tuple[Any, bool]:
+        """
+        Looks a key up in its shard, removing its entry if it expired or it was freed. It must be called holding the
+        lock of the shard.
+
+        Args:
+            shard (CacheShard): The shard of the key.
+            key (Hashable): The key.
+            evicted (list[tuple[Hashable, Any]]): List where the expired instance is appended.
+
+        Returns:
+            tuple[Any, bool]: The instance and whether it was found.
+        """
+        entry = shard.entries.get(key)
+        if entry is None:
+            return None, False
+
+        reference, accessed_at = entry
+        instance = self.__instance(reference=reference)
+        if instance is None:
+            del shard.entries[key]
+            return None, False
+
+        if accessed_at is not None:
+            now = monotonic()
+            if now - accessed_at > self.__ttl:  # type: ignore[operator]
+                del shard.entries[key]
+                shard.expirations += 1
+                evicted.append((key, instance))
+                return None, False
+
+            shard.entries[key] = (reference, now)
+
+        shard.entries.move_to_end(key)
+        shard.hits += 1
+        return instance, True
+
+    def __join(self, shard: CacheShard, key: Hashable) -> 'tuple[Future[Any] | None, bool]':
+        """
+        Returns the future of the creation of a key, starting it if no creation with the key is in flight. It must be
+        called holding the lock of the shard.
+
+        Args:
+            shard (CacheShard): The shard of the key.
+            key (Hashable): The key.
+
+        Returns:
+            tuple[Future[Any] | None, bool]: The future of the creation, None if the creation in flight runs in the
+            current thread, and whether the caller owns the creation and must complete it.
+        """
+        in_flight = shard.in_flight.get(key)
+        if in_flight is not None:
+            future, owner = in_flight
+            if owner == get_ident():
+                return None, False
+
+            shard.hits += 1
+            return future, False
+
+        from concurrent.futures import Future  # imported on the first creation, not at import time
+
+        future = Future()
+        shard.in_flight[key] = (future, get_ident())
+        shard.misses += 1
+        return future, True
+
+    def __store(self, shard: CacheShard, key: Hashable, instance: Any, evicted: list[tuple[Hashable, Any]]) -> None:
+        """
+        Registers an instance in its shard, evicting the least recently used instances while the shard is full. Weakly
+        held instances already freed are discarded before evicting live ones. It must be called holding the lock of the
+        shard.
+
+        Args:
+            shard (CacheShard): The shard of the key.
+            key (Hashable): The key.
+            instance (Any): The instance.
+            evicted (list[tuple[Hashable, Any]]): List where the evicted instances are appended.
+
+        Raises:
+            TypeError: If weak is True and the instance does not support weak references.
+        """
+        reference = ref(instance) if self.__weak else instance
+        shard.entries[key] = (reference, None if self.__ttl is None else monotonic())
+        shard.entries.move_to_end(key)
+        if shard.capacity is None or len(shard.entries) <= shard.capacity:
+            return
+
+        if self.__weak:
+            for freed in [freed for freed, (reference, _) in shard.entries.items() if reference() is None]:
+                del shard.entries[freed]
+
+        while len(shard.entries) > shard.capacity:
+            evicted_key, (reference, _) = shard.entries.popitem(last=False)
+            shard.evictions += 1
+            evicted.append((evicted_key, self.__instance(reference=reference)))
+
+    def __notify(self, evicted: list[tuple[Hashable, Any]]) -> None:
+        """
+        Calls on_evict with every removed instance that was not freed, outside of the locks of the shards.
+
+        Args:
+            evicted (list[tuple[Hashable, Any]]): The keys and instances removed.
+        """
+        if self.__on_evict is None:
+            return
+
+        for key, instance in evicted:
+            if instance is not None:
+                self.__on_evict(key, instance)
+
+
+class MultitonPattern(type):
+    """
+    Multiton Pattern metaclass to be used in the creation of one instance per key (thread-safe). The instances of each
+    class are kept in their own MultitonRegistry, configured with the class keyword arguments max_size, ttl, weak, key
+    and on_evict, subclasses inherit the options they do not set. By default the key is made of the constructor
+    arguments bound to the signature of __init__ with their defaults applied.
+
+    Example:
+    ```python
+    class Client(metaclass=MultitonPattern, max_size=100, ttl=300):
+        def __init__(self, tenant: str) -> None:
+            self.tenant = tenant
+
+
+    assert Client('acme') is Client('acme')
+    ```
+    """
+
+    __registry: MultitonRegistry
+    __options: dict[str, Any]
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> 'MultitonPattern':  # fmt: skip  # noqa: E501
+        """
+        Creates a multiton class with its own MultitonRegistry.
+
+        Args:
+            name (str): Name of the class.
+            bases (tuple[type, ...]): Bases of the class.
+            namespace (dict[str, Any]): Namespace of the class.
+            **kwargs (Any): Options of the registry (max_size, ttl, weak, key and on_evict) and keyword arguments of
+            the class.
+
+        Raises:
+            TypeError: If an option is not valid, see MultitonRegistry.
+
+        Returns:
+            MultitonPattern: The multiton class.
+        """
+        options: dict[str, Any] = {}
+        for base in reversed(bases):
+            if isinstance(base, MultitonPattern):
+                options.update(base.__options)
+
+        options.update({option: kwargs.pop(option) for option in MULTITON_OPTIONS if option in kwargs})
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls.__options = options
+        key = options.get('key') or signature_key(function_signature=constructor_signature(cls=cls))
+        cls.__registry = MultitonRegistry(factory=partial(super(MultitonPattern, cls).__call__), **{**options, 'key': key})  # fmt: skip  # noqa: E501
+        return cls
+
+    @override
+    def __call__(cls, *args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
+        """
+        Returns the instance of the key derived from the provided arguments. If the instance does not exist, it creates
+        a new one using the provided arguments, subsequent calls with the same key return the previously created
+        instance until it is evicted, expires or is freed.
+
+        Args:
+            *args (tuple[Any]): Positional arguments to be used in the creation of the instance.
+            **kwargs (dict[str, Any]): Keyword arguments to be used in the creation of the instance.
+
+        Returns:
+            Any: The instance of the key.
+        """
+        return cls.__registry.get(*args, **kwargs)
+
+    def multiton_registry(cls) -> MultitonRegistry:
+        """
+        Returns the registry of the instances of the class, to evict instances or read its statistics.
+
+        Returns:
+            MultitonRegistry: The registry of the class.
+        """
+        return cls.__registry
@@ -4,7 +4,8 @@ Singleton Pattern metaclass to be used in the creation of singletons.
 
 from threading import Lock
 from typing import Any, ClassVar
-from typing_extensions import override
+
+from developing_tools.utils.override import override
 
 
 class SingletonPattern(type):
@@ -12,7 +13,8 @@ class SingletonPattern(type):
     Singleton Pattern metaclass to be used in the creation of singletons (thread-safe).
     """
 
-    __instances: ClassVar = {}
+    __instances: ClassVar[dict[type, Any]] = {}
+    __locks: ClassVar[dict[type, Lock]] = {}
     __lock: Lock = Lock()
 
     @override
@@ -22,6 +24,9 @@ class SingletonPattern(type):
         provided arguments. Subsequent calls to this method will return the previously created instance,
         ignoring any arguments provided.
 
+        Once the instance exists it is returned without acquiring any lock, the creation is guarded by a lock per class
+        so unrelated singletons never contend with each other.
+
         Args:
             *args (tuple[Any]): Positional arguments to be used in the creation of the singleton instance.
             **kwargs (dict[str, Any]): Keyword arguments to be used in the creation of the singleton instance.
@@ -29,8 +34,28 @@ class SingletonPattern(type):
         Returns:
             Any: The singleton instance of the class.
         """
-        with cls.__lock:
+        try:
+            return cls.__instances[cls]
+
+        except KeyError:
+            pass
+
+        with cls.__class_lock():
             if cls not in cls.__instances:
                 cls.__instances[cls] = super().__call__(*args, **kwargs)
 
         return cls.__instances[cls]
+
+    def __class_lock(cls) -> Lock:
+        """
+        Returns the creation lock of the class, creating it if it does not exist.
+
+        Returns:
+            Lock: The creation lock of the class.
+        """
+        lock = cls.__locks.get(cls)
+        if lock is None:
+            with cls.__lock:
+                lock = cls.__locks.setdefault(cls, Lock())
+
+        return lock
@@ -0,0 +1,256 @@
+"""
+This module contains the helpers that time asyncio code: an awaitable that times every step of a coroutine, and a
+heartbeat that measures how long the event loop is blocked.
+"""
+
+from collections.abc import Coroutine, Generator
+from threading import Lock
+from time import perf_counter_ns, thread_time_ns
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:  # pragma: no cover
+    from asyncio import AbstractEventLoop, TimerHandle
+
+LOOP_HEARTBEAT_INTERVAL = 0.001
+
+
+class TimedCoroutine:
+    """
+    Awaitable that drives a coroutine step by step, timing every step. A step is the code a coroutine runs between two
+    suspensions, while it runs the event loop can not run anything else, so the longest step is the longest time the
+    coroutine held the event loop and the sum of the steps CPU time is the CPU time of the coroutine alone.
+    """
+
+    __coroutine: Coroutine[Any, Any, Any]
+    __steps: int
+    __cpu_time: int
+    __loop_hold_time: int
+
+    def __init__(self, coroutine: Coroutine[Any, Any, Any]) -> None:
+        """
+        Initializes the TimedCoroutine.
+
+        Args:
+            coroutine (Coroutine[Any, Any, Any]): Coroutine to time.
+        """
+        self.__coroutine = coroutine
+        self.__steps = 0
+        self.__cpu_time = 0
+        self.__loop_hold_time = 0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """
+        Runs the coroutine, forwarding the values and exceptions sent by the event loop.
+
+        Returns:
+            Any: The result of the coroutine.
+
+        Yields:
+            Any: The values yielded by the coroutine to the event loop.
+        """
+        coroutine = self.__coroutine
+        value: Any = None
+        exception: BaseException | None = None
+        while True:
+            start_time = perf_counter_ns()
+            start_cpu_time = thread_time_ns()
+            try:
+                yielded = coroutine.send(value) if exception is None else coroutine.throw(exception)
+
+            except StopIteration as stop:
+                self.__step(start_time=start_time, start_cpu_time=start_cpu_time)
+                return stop.value
+
+            except BaseException:
+                self.__step(start_time=start_time, start_cpu_time=start_cpu_time)
+                raise
+
+            self.__step(start_time=start_time, start_cpu_time=start_cpu_time)
+            try:
+                value, exception = (yield yielded), None
+
+            except GeneratorExit:
+                coroutine.close()
+                raise
+
+            except BaseException as thrown:
+                value, exception = None, thrown
+
+    def __step(self, start_time: int, start_cpu_time: int) -> None:
+        """
+        Records a step of the coroutine.
+
+        Args:
+            start_time (int): perf_counter_ns value when the step started.
+            start_cpu_time (int): thread_time_ns value when the step started.
+        """
+        self.__steps += 1
+        self.__cpu_time += thread_time_ns() - start_cpu_time
+        self.__loop_hold_time = max(self.__loop_hold_time, perf_counter_ns() - start_time)
+
+    @property
+    def steps(self) -> int:
+        """
+        Returns the number of steps the coroutine ran.
+
+        Returns:
+            int: The number of steps.
+        """
+        return self.__steps
+
+    @property
+    def cpu_time(self) -> float:
+        """
+        Returns the CPU time of the coroutine steps.
+
+        Returns:
+            float: The CPU time in seconds.
+        """
+        return self.__cpu_time / 1e9
+
+    @property
+    def loop_hold_time(self) -> float:
+        """
+        Returns the longest step of the coroutine, the longest time it held the event loop without yielding.
+
+        Returns:
+            float: The longest step in seconds.
+        """
+        return self.__loop_hold_time / 1e9
+
+
+class LoopHoldWatch:
+    """
+    Measures the longest time the event loop was blocked since the watch started, fed by the shared LoopHeartbeat of
+    the loop.
+    """
+
+    __heartbeat: 'LoopHeartbeat'
+    __start_time: int
+    __loop_hold_time: int
+
+    def __init__(self, heartbeat: 'LoopHeartbeat') -> None:
+        """
+        Initializes the LoopHoldWatch.
+
+        Args:
+            heartbeat (LoopHeartbeat): The heartbeat of the running event loop.
+        """
+        self.__heartbeat = heartbeat
+        self.__start_time = perf_counter_ns()
+        self.__loop_hold_time = 0
+
+    def beat(self, due_time: int, time: int) -> None:
+        """
+        Records a beat of the heartbeat, only the part of its delay after the watch started is taken into account.
+
+        Args:
+            due_time (int): perf_counter_ns value when the beat was due.
+            time (int): perf_counter_ns value when the beat ran.
+        """
+        self.__loop_hold_time = max(self.__loop_hold_time, time - max(due_time, self.__start_time))
+
+    def stop(self) -> float:
+        """
+        Stops the watch. The pending beat delay is also taken into account, so a block that never yields is detected.
+
+        Returns:
+            float: The longest time the event loop was blocked in seconds.
+        """
+        self.__heartbeat.release(watch=self)
+        return self.__loop_hold_time / 1e9
+
+
+class LoopHeartbeat:
+    """
+    Callback rescheduled on the event loop every LOOP_HEARTBEAT_INTERVAL seconds, the delay of each beat over its
+    schedule is the time the event loop was blocked. Blocks shorter than the interval may not be detected.
+
+    There is one heartbeat per event loop, see loop_heartbeat, shared by all its active watches. It only beats while
+    at least one watch is active, so a loop runs a single timer however many blocks are measured at once.
+    """
+
+    __due_time: int
+    __watches: set[LoopHoldWatch]
+    __handle: 'TimerHandle | None'
+
+    def __init__(self) -> None:
+        """
+        Initializes the LoopHeartbeat, stopped until its first watch.
+        """
+        self.__due_time = 0
+        self.__watches = set()
+        self.__handle = None
+
+    def watch(self) -> LoopHoldWatch:
+        """
+        Starts a watch of the event loop blocks, starting the heartbeat if it was stopped. It must be called from the
+        event loop of the heartbeat.
+
+        Returns:
+            LoopHoldWatch: The watch, that must be stopped when the measured code finishes.
+        """
+        watch = LoopHoldWatch(heartbeat=self)
+        if self.__handle is None:
+            self.__schedule()
+
+        self.__watches.add(watch)
+        return watch
+
+    def release(self, watch: LoopHoldWatch) -> None:
+        """
+        Records the pending beat delay in the watch and removes it, stopping the heartbeat after its last watch.
+
+        Args:
+            watch (LoopHoldWatch): The watch to remove.
+        """
+        watch.beat(due_time=self.__due_time, time=perf_counter_ns())
+        self.__watches.discard(watch)
+        if not self.__watches and self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+
+    def __schedule(self) -> None:
+        """
+        Schedules the next beat.
+        """
+        from asyncio import get_running_loop  # already loaded while the event loop runs
+
+        self.__due_time = perf_counter_ns() + int(LOOP_HEARTBEAT_INTERVAL * 1e9)
+        self.__handle = get_running_loop().call_later(LOOP_HEARTBEAT_INTERVAL, self.__beat)
+
+    def __beat(self) -> None:
+        """
+        Records the delay of the beat in every watch and schedules the next one.
+        """
+        time = perf_counter_ns()
+        for watch in self.__watches:
+            watch.beat(due_time=self.__due_time, time=time)
+
+        self.__schedule()
+
+
+_heartbeats: 'WeakKeyDictionary[AbstractEventLoop, LoopHeartbeat]' = WeakKeyDictionary()
+_heartbeats_lock = Lock()
+
+
+def loop_heartbeat() -> LoopHeartbeat:
+    """
+    Returns the heartbeat of the running event loop, creating it the first time.
+
+    Raises:
+        RuntimeError: If there is no running event loop.
+
+    Returns:
+        LoopHeartbeat: The heartbeat of the running event loop.
+    """
+    from asyncio import get_running_loop  # already loaded while the event loop runs
+
+    loop = get_running_loop()
+    with _heartbeats_lock:
+        heartbeat = _heartbeats.get(loop)
+        if heartbeat is None:
+            heartbeat = _heartbeats[loop] = LoopHeartbeat()
+
+    return heartbeat
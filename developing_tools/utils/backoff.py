@@ -0,0 +1,274 @@
+"""
+This module contains the backoff strategies that compute the delay between the attempts of the retryit decorator.
+"""
+
+from abc import ABC, abstractmethod
+from random import SystemRandom
+
+from developing_tools.utils.override import override
+
+_random = SystemRandom()
+
+
+def validate_seconds(name: str, value: float | None, allow_none: bool = False) -> None:
+    """
+    Validates that a backoff parameter is a non-negative number of seconds.
+
+    Args:
+        name (str): Name of the parameter, used in the error messages.
+        value (float | None): Value of the parameter.
+        allow_none (bool, optional): Whether None is a valid value. Defaults to False.
+
+    Raises:
+        TypeError: If the value is not a number (or None when allowed).
+        ValueError: If the value is less than 0.
+    """
+    if value is None and allow_none:
+        return
+
+    if type(value) not in [int, float]:
+        raise TypeError(f'{name} must be a number. Got {type(value).__name__} instead.')
+
+    if value < 0:  # type: ignore[operator]
+        raise ValueError(f'{name} must be greater than or equal to 0. Got {value} instead.')
+
+
+class BackoffStrategy(ABC):
+    """
+    Base class of the strategies that compute the delay before each retry.
+    """
+
+    @abstractmethod
+    def delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+
+
+class ConstantBackoff(BackoffStrategy):
+    """
+    Waits the same number of seconds before every retry.
+    """
+
+    __seconds: float
+
+    def __init__(self, seconds: float) -> None:
+        """
+        Initializes the ConstantBackoff strategy.
+
+        Args:
+            seconds (float): Number of seconds to wait before every retry.
+
+        Raises:
+            TypeError: If seconds is not a number.
+            ValueError: If seconds is less than 0.
+        """
+        validate_seconds(name='seconds', value=seconds)
+        self.__seconds = seconds
+
+    @override
+    def delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        return self.__seconds
+
+
+class UniformBackoff(BackoffStrategy):
+    """
+    Waits a random number of seconds between a minimum and a maximum (both included) before every retry.
+    """
+
+    __minimum: float
+    __maximum: float
+
+    def __init__(self, minimum: float, maximum: float) -> None:
+        """
+        Initializes the UniformBackoff strategy.
+
+        Args:
+            minimum (float): Minimum number of seconds to wait.
+            maximum (float): Maximum number of seconds to wait.
+
+        Raises:
+            TypeError: If minimum or maximum are not numbers.
+            ValueError: If minimum or maximum are less than 0.
+            ValueError: If minimum is greater than or equal to maximum.
+        """
+        validate_seconds(name='minimum', value=minimum)
+        validate_seconds(name='maximum', value=maximum)
+
+        if minimum >= maximum:
+            raise ValueError(f'minimum must be less than maximum. Got {minimum} and {maximum} instead.')
+
+        self.__minimum = minimum
+        self.__maximum = maximum
+
+    @override
+    def delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        return _random.uniform(a=self.__minimum, b=self.__maximum)
+
+
+class ExponentialBackoff(BackoffStrategy):
+    """
+    Waits base * factor ** attempt seconds before every retry, capped to a maximum.
+    """
+
+    __base: float
+    __factor: float
+    __maximum: float | None
+
+    def __init__(self, base: float, factor: float = 2, maximum: float | None = None) -> None:
+        """
+        Initializes the ExponentialBackoff strategy.
+
+        Args:
+            base (float): Number of seconds to wait before the first retry.
+            factor (float, optional): Multiplier applied to the delay after each retry. Defaults to 2.
+            maximum (float | None, optional): Maximum number of seconds to wait, if None the delay is not capped.
+            Defaults to None.
+
+        Raises:
+            TypeError: If base, factor or maximum are not numbers.
+            ValueError: If base or maximum are less than 0.
+            ValueError: If factor is less than 1.
+        """
+        validate_seconds(name='base', value=base)
+        validate_seconds(name='factor', value=factor)
+        validate_seconds(name='maximum', value=maximum, allow_none=True)
+
+        if factor < 1:
+            raise ValueError(f'factor must be greater than or equal to 1. Got {factor} instead.')
+
+        self.__base = base
+        self.__factor = factor
+        self.__maximum = maximum
+
+    @override
+    def delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        try:
+            seconds = float(self.__base * self.__factor**attempt)
+
+        except OverflowError:
+            seconds = float('inf')
+
+        return seconds if self.__maximum is None else min(self.__maximum, seconds)
+
+
+class FullJitterBackoff(BackoffStrategy):
+    """
+    Waits a random number of seconds between 0 and the capped exponential delay before every retry, spreading the
+    retries of concurrent clients so they do not retry in lockstep.
+    """
+
+    __exponential: ExponentialBackoff
+
+    def __init__(self, base: float, maximum: float, factor: float = 2) -> None:
+        """
+        Initializes the FullJitterBackoff strategy.
+
+        Args:
+            base (float): Upper bound of the delay before the first retry.
+            maximum (float): Maximum number of seconds to wait.
+            factor (float, optional): Multiplier applied to the upper bound after each retry. Defaults to 2.
+
+        Raises:
+            TypeError: If base, maximum or factor are not numbers.
+            ValueError: If base or maximum are less than 0.
+            ValueError: If factor is less than 1.
+        """
+        self.__exponential = ExponentialBackoff(base=base, factor=factor, maximum=maximum)
+
+    @override
+    def delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        return _random.uniform(a=0, b=self.__exponential.delay(attempt=attempt, previous_delay=previous_delay))
+
+
+class DecorrelatedJitterBackoff(BackoffStrategy):
+    """
+    Waits a random number of seconds between base and three times the previous delay before every retry, capped to a
+    maximum.
+    """
+
+    __base: float
+    __maximum: float
+
+    def __init__(self, base: float, maximum: float) -> None:
+        """
+        Initializes the DecorrelatedJitterBackoff strategy.
+
+        Args:
+            base (float): Minimum number of seconds to wait.
+            maximum (float): Maximum number of seconds to wait.
+
+        Raises:
+            TypeError: If base or maximum are not numbers.
+            ValueError: If base or maximum are less than 0.
+            ValueError: If base is greater than maximum.
+        """
+        validate_seconds(name='base', value=base)
+        validate_seconds(name='maximum', value=maximum)
+
+        if base > maximum:
+            raise ValueError(f'base must be less than or equal to maximum. Got {base} and {maximum} instead.')
+
+        self.__base = base
+        self.__maximum = maximum
+
+    @override
+    def delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            previous_delay (float): Delay used before the failed attempt, 0 for the first one.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        return min(self.__maximum, _random.uniform(a=self.__base, b=max(self.__base, 3 * previous_delay)))
@@ -0,0 +1,217 @@
+"""
+This module contains the BoundedRepr class, that formats values for print_parameters in an amount of time and memory
+bounded by its limits, whatever the size of the value.
+"""
+
+from itertools import islice
+from reprlib import Repr
+from typing import Any
+
+from developing_tools.utils.override import override
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+
+class BoundedRepr(Repr):
+    """
+    reprlib.Repr with a single set of limits. Strings, numbers and other objects are cut to max_length characters,
+    containers show at most max_elements elements and max_depth nesting levels, without sorting sets and dictionaries.
+    Byte buffers longer than max_length and array-like objects (with a shape and dtype or dtypes, like NumPy arrays or
+    pandas data frames) with more than max_elements elements are summarized by their type and length or shape.
+    """
+
+    def __init__(self, max_length: int = 200, max_depth: int = 3, max_elements: int = 10) -> None:
+        """
+        Initializes the BoundedRepr.
+
+        Args:
+            max_length (int, optional): Maximum number of characters of a string, number or other object. Defaults to
+            200.
+            max_depth (int, optional): Maximum nesting level of containers. Defaults to 3.
+            max_elements (int, optional): Maximum number of elements shown of a container. Defaults to 10.
+
+        Raises:
+            TypeError: If max_length is not an integer.
+            ValueError: If max_length is less than 10.
+            TypeError: If max_depth is not an integer.
+            ValueError: If max_depth is less than 1.
+            TypeError: If max_elements is not an integer.
+            ValueError: If max_elements is less than 1.
+        """
+        if type(max_length) is not int:
+            raise TypeError(f'max_length must be an integer, got {type(max_length).__name__} instead.')
+
+        if max_length < 10:
+            raise ValueError(f'max_length must be greater than or equal to 10, got {max_length} instead.')
+
+        if type(max_depth) is not int:
+            raise TypeError(f'max_depth must be an integer, got {type(max_depth).__name__} instead.')
+
+        if max_depth < 1:
+            raise ValueError(f'max_depth must be greater than 0, got {max_depth} instead.')
+
+        if type(max_elements) is not int:
+            raise TypeError(f'max_elements must be an integer, got {type(max_elements).__name__} instead.')
+
+        if max_elements < 1:
+            raise ValueError(f'max_elements must be greater than 0, got {max_elements} instead.')
+
+        super().__init__()
+        self.maxlevel = max_depth
+        self.maxstring = self.maxlong = self.maxother = max_length
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdict = max_elements
+        self.maxset = self.maxfrozenset = self.maxdeque = max_elements
+
+    def format(self, value: Any) -> str:
+        """
+        Returns the bounded text of a value. Strings and other objects are shown as str would show them, large
+        containers are followed by their type and length.
+
+        Args:
+            value (Any): The value to format.
+
+        Returns:
+            str: The bounded text of the value.
+        """
+        if isinstance(value, str):
+            if len(value) <= self.maxstring:
+                return value
+
+            return f'{value[: self.maxstring]}{self.fillvalue} (str of {len(value)} characters)'
+
+        text = self.repr(value)
+        if isinstance(value, CONTAINER_TYPES) and len(value) > self.maxlist:
+            return f'{text} ({type(value).__name__} of {len(value)} items)'
+
+        return text
+
+    @override
+    def repr1(self, x: Any, level: int) -> str:
+        """
+        Returns the bounded representation of a value at the given remaining nesting level.
+
+        Args:
+            x (Any): The value.
+            level (int): Remaining nesting levels.
+
+        Returns:
+            str: The bounded representation of the value.
+        """
+        if isinstance(x, BYTES_TYPES) and len(x) > self.maxstring:
+            return f'{type(x).__name__}(len={len(x)})'
+
+        shape = getattr(x, 'shape', None)
+        if shape is not None and getattr(x, 'size', 0) > self.maxlist:
+            if hasattr(x, 'dtype'):
+                return f'{type(x).__name__}(shape={tuple(shape)}, dtype={x.dtype})'
+
+            if hasattr(x, 'dtypes'):  # data frames have one dtype per column
+                return f'{type(x).__name__}(shape={tuple(shape)})'
+
+        for container_type in CONTAINER_TYPES:
+            if type(x) is not container_type and isinstance(x, container_type):  # subclasses are bounded as well
+                return getattr(self, f'repr_{container_type.__name__}')(x, level)  # type: ignore[no-any-return]
+
+        return super().repr1(x, level)
+
+    @override
+    def repr_int(self, x: int, level: int) -> str:
+        """
+        Returns the bounded representation of an integer, integers too large to be converted to text are summarized
+        by their number of bits.
+
+        Args:
+            x (int): The integer.
+            level (int): Remaining nesting levels.
+
+        Returns:
+            str: The bounded representation of the integer.
+        """
+        try:
+            return super().repr_int(x, level)
+
+        except ValueError:
+            return f'{type(x).__name__}(bits={x.bit_length()})'
+
+    @override
+    def repr_set(self, x: set[Any], level: int) -> str:
+        """
+        Returns the bounded representation of a set in iteration order, reprlib sorts the whole set.
+
+        Args:
+            x (set[Any]): The set.
+            level (int): Remaining nesting levels.
+
+        Returns:
+            str: The bounded representation of the set.
+        """
+        if not x:
+            return 'set()'
+
+        return self._repr_iterable(x, level, '{', '}', self.maxset)  # type: ignore[attr-defined, no-any-return]
+
+    @override
+    def repr_frozenset(self, x: frozenset[Any], level: int) -> str:
+        """
+        Returns the bounded representation of a frozenset in iteration order, reprlib sorts the whole frozenset.
+
+        Args:
+            x (frozenset[Any]): The frozenset.
+            level (int): Remaining nesting levels.
+
+        Returns:
+            str: The bounded representation of the frozenset.
+        """
+        if not x:
+            return 'frozenset()'
+
+        return self._repr_iterable(x, level, 'frozenset({', '})', self.maxfrozenset)  # type: ignore[attr-defined, no-any-return]  # fmt: skip
+
+    @override
+    def repr_dict(self, x: dict[Any, Any], level: int) -> str:
+        """
+        Returns the bounded representation of a dictionary in insertion order, reprlib sorts every key.
+
+        Args:
+            x (dict[Any, Any]): The dictionary.
+            level (int): Remaining nesting levels.
+
+        Returns:
+            str: The bounded representation of the dictionary.
+        """
+        if not x:
+            return '{}'
+
+        if level <= 0:
+            return f'{{{self.fillvalue}}}'
+
+        pieces = [f'{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}' for key, value in islice(x.items(), self.maxdict)]  # fmt: skip  # noqa: E501
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+
+        return f'{{{", ".join(pieces)}}}'
+
+    @override
+    def repr_instance(self, x: Any, level: int) -> str:
+        """
+        Returns the bounded representation of any other object, str is used at the top level and repr when nested, as
+        str does for containers.
+
+        Args:
+            x (Any): The object.
+            level (int): Remaining nesting levels.
+
+        Returns:
+            str: The bounded representation of the object.
+        """
+        try:
+            text = str(x) if level == self.maxlevel else repr(x)
+
+        except Exception:
+            return f'<{type(x).__name__} instance at {id(x):#x}>'
+
+        if len(text) > self.maxother:
+            return f'{text[: self.maxother]}{self.fillvalue}'
+
+        return text
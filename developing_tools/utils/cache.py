@@ -0,0 +1,357 @@
+"""
+This module contains the bounded LRU and TTL cache used by the cacheit decorator.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from developing_tools.utils.override import override
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
+CACHE_SHARDS = 16
+CACHE_SHARD_MIN_SIZE = 64  # bounded caches smaller than CACHE_SHARDS times this use a single shard
+KWARGS_MARK = object()
+ABANDONED = object()  # result handed to the calls waiting for a computation interrupted without an Exception
+
+
+def make_key(*args: Any, **kwargs: Any) -> Hashable:
+    """
+    Returns the default cache key of a call, keyword arguments given in a different order are different keys.
+
+    Args:
+        *args (Any): Positional arguments of the call.
+        **kwargs (Any): Keyword arguments of the call.
+
+    Returns:
+        Hashable: The cache key.
+    """
+    if not kwargs:
+        return args
+
+    return (*args, KWARGS_MARK, *kwargs.items())
+
+
+class CacheShard:
+    """
+    A slice of the cache with its own lock and LRU order, calls whose keys fall in different shards never contend.
+    """
+
+    __slots__ = ('capacity', 'entries', 'evictions', 'expirations', 'hits', 'in_flight', 'lock', 'misses')
+
+    capacity: int | None
+    entries: OrderedDict[Hashable, tuple[Any, float | None]]
+    evictions: int
+    expirations: int
+    hits: int
+    in_flight: 'dict[Hashable, tuple[Future[Any], Hashable]]'
+    lock: Lock
+    misses: int
+
+    def __init__(self, capacity: int | None) -> None:
+        """
+        Initializes an empty CacheShard.
+
+        Args:
+            capacity (int | None): Maximum number of entries of the shard, if None it is unbounded.
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+        self.hits = 0
+        self.in_flight = {}
+        self.lock = Lock()
+        self.misses = 0
+
+
+class CacheStatistics:
+    """
+    Immutable snapshot of the statistics of a Cache.
+    """
+
+    __hits: int
+    __misses: int
+    __evictions: int
+    __expirations: int
+    __size: int
+
+    def __init__(self, hits: int, misses: int, evictions: int, expirations: int, size: int) -> None:
+        """
+        Initializes the CacheStatistics snapshot.
+
+        Args:
+            hits (int): Number of calls answered from the cache.
+            misses (int): Number of calls that executed the function.
+            evictions (int): Number of entries removed to respect the maximum size.
+            expirations (int): Number of entries removed because their time to live elapsed.
+            size (int): Number of cached entries.
+        """
+        self.__hits = hits
+        self.__misses = misses
+        self.__evictions = evictions
+        self.__expirations = expirations
+        self.__size = size
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the snapshot.
+
+        Returns:
+            str: The string representation of the snapshot.
+        """
+        return f'CacheStatistics(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, expirations={self.expirations}, size={self.size})'  # fmt: skip  # noqa: E501
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of calls answered from the cache, including the calls that waited for a concurrent call
+        with the same key.
+
+        Returns:
+            int: The number of hits.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of calls that executed the function.
+
+        Returns:
+            int: The number of misses.
+        """
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        Returns the number of least recently used entries removed to respect the maximum size.
+
+        Returns:
+            int: The number of evictions.
+        """
+        return self.__evictions
+
+    @property
+    def expirations(self) -> int:
+        """
+        Returns the number of entries removed because their time to live elapsed.
+
+        Returns:
+            int: The number of expirations.
+        """
+        return self.__expirations
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of cached entries.
+
+        Returns:
+            int: The number of cached entries.
+        """
+        return self.__size
+
+
+def make_shards(max_size: int | None) -> tuple[CacheShard, ...]:
+    """
+    Returns the shards of a cache. Bounded caches smaller than CACHE_SHARDS * CACHE_SHARD_MIN_SIZE entries use a single
+    shard, so the least recently used entry of the whole cache is evicted. Larger and unbounded caches use CACHE_SHARDS
+    shards, then each shard evicts its own least recently used entry, which is approximate for the whole cache.
+
+    Args:
+        max_size (int | None): Maximum number of entries, if None the cache is unbounded.
+
+    Returns:
+        tuple[CacheShard, ...]: The shards, whose capacities add up to max_size.
+    """
+    if max_size is None:
+        return tuple(CacheShard(capacity=None) for _ in range(CACHE_SHARDS))
+
+    shards = 1 if max_size < CACHE_SHARDS * CACHE_SHARD_MIN_SIZE else CACHE_SHARDS
+    return tuple(CacheShard(capacity=max_size // shards + (index < max_size % shards)) for index in range(shards))
+
+
+class Cache:
+    """
+    Thread-safe cache with least recently used eviction and per-entry time to live. Entries are split in shards by key
+    hash, each shard has its own lock so there is no lock shared by every call, and concurrent calls with the same key
+    wait for the first one instead of executing the function again. See make_shards for when the eviction order is
+    exact.
+    """
+
+    __max_size: int | None
+    __ttl: float | None
+    __key: Callable[..., Hashable]
+    __shards: tuple[CacheShard, ...]
+
+    def __init__(self, max_size: int | None, ttl: float | None, key: Callable[..., Hashable]) -> None:
+        """
+        Initializes an empty Cache.
+
+        Args:
+            max_size (int | None): Maximum number of entries, if None the cache is unbounded.
+            ttl (float | None): Seconds an entry stays valid after it is stored, if None entries never expire.
+            key (Callable[..., Hashable]): Function that receives the call arguments and returns the cache key.
+        """
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__key = key
+
+        self.__shards = make_shards(max_size=max_size)
+
+    @property
+    def max_size(self) -> int | None:
+        """
+        Returns the maximum number of entries.
+
+        Returns:
+            int | None: The maximum number of entries, None if the cache is unbounded.
+        """
+        return self.__max_size
+
+    @property
+    def ttl(self) -> float | None:
+        """
+        Returns the time to live of the entries.
+
+        Returns:
+            float | None: The time to live in seconds, None if entries never expire.
+        """
+        return self.__ttl
+
+    def key(self, *args: Any, **kwargs: Any) -> Hashable:
+        """
+        Returns the cache key of a call.
+
+        Args:
+            *args (Any): Positional arguments of the call.
+            **kwargs (Any): Keyword arguments of the call.
+
+        Returns:
+            Hashable: The cache key.
+        """
+        return self.__key(*args, **kwargs)
+
+    def lookup(self, key: Hashable, owner: Hashable) -> tuple[bool, Any, bool]:
+        """
+        Looks a key up. On a hit the cached value is returned, on a miss a future is returned that is completed by the
+        call that owns the computation through complete. When the computation in flight is owned by the same owner, a
+        recursive call with the same key, None is returned instead of the future, since waiting for it would never end,
+        and the caller must compute the value without caching it.
+
+        Args:
+            key (Hashable): The cache key.
+            owner (Hashable): Identifier of the caller, the thread or the asyncio task that runs the call.
+
+        Returns:
+            tuple[bool, Any, bool]: Whether the key was cached, the cached value or the future of the computation, and
+            whether the caller owns the computation and must complete it.
+        """
+        shard = self.__shards[hash(key) % len(self.__shards)]
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or monotonic() < expires_at:
+                    shard.entries.move_to_end(key)
+                    shard.hits += 1
+                    return True, value, False
+
+                del shard.entries[key]
+                shard.expirations += 1
+
+            in_flight = shard.in_flight.get(key)
+            if in_flight is not None:
+                future, computing_owner = in_flight
+                if computing_owner == owner:
+                    shard.misses += 1
+                    return False, None, False
+
+                shard.hits += 1
+                return False, future, False
+
+            from concurrent.futures import Future  # imported on the first miss, not at import time
+
+            future = Future()
+            shard.in_flight[key] = (future, owner)
+            shard.misses += 1
+            return False, future, True
+
+    def complete(self, key: Hashable, value: Any = None, exception: BaseException | None = None) -> None:
+        """
+        Completes the computation of a key, storing its value or propagating its exception to the waiting calls.
+        Exceptions are never cached. A BaseException that is not an Exception, such as a cancellation or a
+        KeyboardInterrupt, only concerns the call that owns the computation, so the waiting calls get ABANDONED instead
+        and must look the key up again, one of them becoming the new owner.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any, optional): The computed value. Defaults to None.
+            exception (BaseException | None, optional): The exception raised by the computation. Defaults to None.
+        """
+        shard = self.__shards[hash(key) % len(self.__shards)]
+        with shard.lock:
+            future, _ = shard.in_flight.pop(key)
+            if exception is None:
+                expires_at = None if self.__ttl is None else monotonic() + self.__ttl
+                shard.entries[key] = (value, expires_at)
+                shard.entries.move_to_end(key)
+                while shard.capacity is not None and len(shard.entries) > shard.capacity:
+                    shard.entries.popitem(last=False)
+                    shard.evictions += 1
+
+        if exception is None:
+            future.set_result(value)
+        elif isinstance(exception, Exception):
+            future.set_exception(exception)
+        else:
+            future.set_result(ABANDONED)
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> bool:
+        """
+        Removes the entry of a call.
+
+        Args:
+            *args (Any): Positional arguments of the call.
+            **kwargs (Any): Keyword arguments of the call.
+
+        Returns:
+            bool: True if the call was cached.
+        """
+        key = self.key(*args, **kwargs)
+        shard = self.__shards[hash(key) % len(self.__shards)]
+        with shard.lock:
+            return shard.entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """
+        Removes every entry, the statistics are kept.
+        """
+        for shard in self.__shards:
+            with shard.lock:
+                shard.entries.clear()
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            CacheStatistics: The statistics of the cache.
+        """
+        hits = misses = evictions = expirations = size = 0
+        for shard in self.__shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                expirations += shard.expirations
+                size += len(shard.entries)
+
+        return CacheStatistics(hits=hits, misses=misses, evictions=evictions, expirations=expirations, size=size)
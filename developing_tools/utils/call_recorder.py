@@ -0,0 +1,397 @@
+"""
+This module contains the CallRecorder class, which appends function calls to a compact binary log, and the functions to
+stream the recorded calls back and replay them.
+"""
+
+import pickle  # nosec: B403
+from collections.abc import Callable, Iterator
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fspath, replace
+from pathlib import Path
+from struct import Struct
+from threading import Lock
+from time import time
+from typing import Any
+from weakref import finalize
+
+CALL_LOG_MAGIC = b'DTCALLS2'
+FRAME_HEADER = Struct('<I')
+
+
+class CallRecord:
+    """
+    A function call read from a call log.
+    """
+
+    __function: str
+    __args: tuple[Any, ...]
+    __kwargs: dict[str, Any]
+    __return_value: Any
+    __execution_time: float
+    __timestamp: float
+    __replayable: bool
+
+    def __init__(
+        self,
+        function: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        return_value: Any,
+        execution_time: float,
+        timestamp: float,
+        replayable: bool = True,
+    ) -> None:
+        """
+        Initializes the CallRecord.
+
+        Args:
+            function (str): Qualified name of the called function, "module.qualname".
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+            return_value (Any): Value returned by the call.
+            execution_time (float): Execution time of the call in seconds.
+            timestamp (float): Unix timestamp of the call end.
+            replayable (bool, optional): Whether the arguments were recorded as they are, False if they could not be
+            pickled and they were recorded by their repr. Defaults to True.
+        """
+        self.__function = function
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__return_value = return_value
+        self.__execution_time = execution_time
+        self.__timestamp = timestamp
+        self.__replayable = replayable
+
+    @property
+    def function(self) -> str:
+        """
+        Returns the qualified name of the called function.
+
+        Returns:
+            str: The qualified name of the called function, "module.qualname".
+        """
+        return self.__function
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        """
+        Returns the positional arguments of the call.
+
+        Returns:
+            tuple[Any, ...]: The positional arguments of the call.
+        """
+        return self.__args
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        """
+        Returns the keyword arguments of the call.
+
+        Returns:
+            dict[str, Any]: The keyword arguments of the call.
+        """
+        return self.__kwargs
+
+    @property
+    def return_value(self) -> Any:
+        """
+        Returns the value returned by the call.
+
+        Returns:
+            Any: The value returned by the call.
+        """
+        return self.__return_value
+
+    @property
+    def execution_time(self) -> float:
+        """
+        Returns the execution time of the call.
+
+        Returns:
+            float: The execution time of the call in seconds.
+        """
+        return self.__execution_time
+
+    @property
+    def timestamp(self) -> float:
+        """
+        Returns the Unix timestamp of the call end.
+
+        Returns:
+            float: The Unix timestamp of the call end.
+        """
+        return self.__timestamp
+
+    @property
+    def replayable(self) -> bool:
+        """
+        Returns whether the arguments of the call were recorded as they are, so the call can be replayed.
+
+        Returns:
+            bool: True if the arguments were pickled, False if they were recorded by their repr.
+        """
+        return self.__replayable
+
+
+def write_call_log(path: Path, buffer: bytearray, max_bytes: int | None, backup_count: int) -> None:
+    """
+    Writes a buffer of calls to a call log in a single write, rotating the log first if needed, and clears it. The lock
+    of the recorder that owns the buffer must be held.
+
+    Args:
+        path (Path): Path of the call log file.
+        buffer (bytearray): The buffered calls.
+        max_bytes (int | None): Size in bytes at which the log is rotated, if None it is never rotated.
+        backup_count (int): Number of rotated logs to keep.
+    """
+    if not buffer:
+        return
+
+    size = path.stat().st_size if path.exists() else 0
+    if max_bytes is not None and size and size + len(buffer) > max_bytes:
+        for index in range(backup_count - 1, 0, -1):  # path becomes path.1, path.1 becomes path.2 and so on
+            source = path.with_name(f'{path.name}.{index}')
+            if source.exists():
+                replace(source, path.with_name(f'{path.name}.{index + 1}'))
+
+        replace(path, path.with_name(f'{path.name}.1'))
+        size = 0
+
+    with path.open(mode='ab') as file:
+        file.write(buffer if size else CALL_LOG_MAGIC + buffer)
+
+    buffer.clear()
+
+
+def flush_call_log(path: Path, buffer: bytearray, lock: Lock, max_bytes: int | None, backup_count: int) -> None:
+    """
+    Writes the buffer of a recorder holding its lock, run when the recorder is garbage collected or at interpreter
+    exit. It does not reference the recorder, so the recorder is not kept alive until exit.
+
+    Args:
+        path (Path): Path of the call log file.
+        buffer (bytearray): The buffered calls.
+        lock (Lock): The lock of the recorder.
+        max_bytes (int | None): Size in bytes at which the log is rotated, if None it is never rotated.
+        backup_count (int): Number of rotated logs to keep.
+    """
+    with lock:
+        write_call_log(path=path, buffer=buffer, max_bytes=max_bytes, backup_count=backup_count)
+
+
+class CallRecorder:
+    """
+    Thread-safe recorder that appends function calls to a binary log file. Calls are pickled into an in-memory buffer
+    that is written in bulk when it is full, when flush is called, when the recorder is garbage collected and at
+    interpreter exit. The log can optionally be rotated when it reaches a given size.
+    """
+
+    __path: Path
+    __buffer_size: int
+    __max_bytes: int | None
+    __backup_count: int
+    __buffer: bytearray
+    __lock: Lock
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        buffer_size: int = 1024 * 1024,
+        max_bytes: int | None = None,
+        backup_count: int = 1,
+    ) -> None:
+        """
+        Initializes the CallRecorder.
+
+        Args:
+            path (str | PathLike[str]): Path of the call log file, calls are appended if it already exists.
+            buffer_size (int, optional): Number of buffered bytes that triggers a write to the file. Defaults to 1 MiB.
+            max_bytes (int | None, optional): Size in bytes at which the log is rotated, if None it is never rotated.
+            Defaults to None.
+            backup_count (int, optional): Number of rotated logs to keep, named path.1, path.2, ... Defaults to 1.
+
+        Raises:
+            TypeError: If the path is not a string or a path.
+            TypeError: If the buffer_size is not an integer.
+            ValueError: If the buffer_size is negative.
+            TypeError: If the max_bytes is not an integer or None.
+            ValueError: If the max_bytes is less than 1.
+            TypeError: If the backup_count is not an integer.
+            ValueError: If the backup_count is less than 1.
+        """
+        if not isinstance(path, str | PathLike):
+            raise TypeError(f'path must be a string or a path, got {type(path).__name__} instead.')
+
+        if type(buffer_size) is not int:
+            raise TypeError(f'buffer_size must be an integer, got {type(buffer_size).__name__} instead.')
+
+        if buffer_size < 0:
+            raise ValueError(f'buffer_size must be a non-negative integer, got {buffer_size} instead.')
+
+        if max_bytes is not None:
+            if type(max_bytes) is not int:
+                raise TypeError(f'max_bytes must be an integer or None, got {type(max_bytes).__name__} instead.')
+
+            if max_bytes < 1:
+                raise ValueError(f'max_bytes must be greater than 0, got {max_bytes} instead.')
+
+        if type(backup_count) is not int:
+            raise TypeError(f'backup_count must be an integer, got {type(backup_count).__name__} instead.')
+
+        if backup_count < 1:
+            raise ValueError(f'backup_count must be greater than 0, got {backup_count} instead.')
+
+        self.__path = Path(fspath(path))
+        self.__buffer_size = buffer_size
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__buffer = bytearray()
+        self.__lock = Lock()
+
+        finalize(self, flush_call_log, self.__path, self.__buffer, self.__lock, max_bytes, backup_count)
+
+    @property
+    def path(self) -> Path:
+        """
+        Returns the path of the call log file.
+
+        Returns:
+            Path: The path of the call log file.
+        """
+        return self.__path
+
+    def dump_arguments(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bytes | None:
+        """
+        Pickles the arguments of a call, to be called before the function runs so the arguments are recorded as they
+        were received and not with the in-place changes made by the call.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            bytes | None: The pickled arguments, None if they can not be pickled.
+        """
+        try:
+            return pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+
+        except Exception:
+            return None
+
+    def record(
+        self,
+        function: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        return_value: Any,
+        execution_time: float,
+        arguments: bytes | None = None,
+    ) -> None:
+        """
+        Records a function call. Arguments that can not be pickled are recorded by their repr and the record is not
+        replayable, a return value that can not be pickled is recorded by its repr.
+
+        Args:
+            function (str): Qualified name of the called function, "module.qualname".
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+            return_value (Any): Value returned by the call.
+            execution_time (float): Execution time of the call in seconds.
+            arguments (bytes | None, optional): The arguments pickled by dump_arguments before the call, if None they
+            are pickled from args and kwargs. Defaults to None.
+        """
+        recorded_arguments: bytes | tuple[tuple[str, ...], dict[str, str]] | None = arguments
+        if recorded_arguments is None:
+            recorded_arguments = self.dump_arguments(args=args, kwargs=kwargs)
+
+        if recorded_arguments is None:
+            recorded_arguments = (tuple(map(repr, args)), {key: repr(value) for key, value in kwargs.items()})
+
+        timestamp = time()
+        try:
+            payload = pickle.dumps((function, recorded_arguments, return_value, execution_time, timestamp), protocol=pickle.HIGHEST_PROTOCOL)  # fmt: skip  # noqa: E501
+
+        except Exception:
+            payload = pickle.dumps((function, recorded_arguments, repr(return_value), execution_time, timestamp), protocol=pickle.HIGHEST_PROTOCOL)  # fmt: skip  # noqa: E501
+
+        with self.__lock:
+            self.__buffer += FRAME_HEADER.pack(len(payload))
+            self.__buffer += payload
+            if len(self.__buffer) >= self.__buffer_size:
+                write_call_log(path=self.__path, buffer=self.__buffer, max_bytes=self.__max_bytes, backup_count=self.__backup_count)  # fmt: skip  # noqa: E501
+
+    def flush(self) -> None:
+        """
+        Writes the buffered calls to the log file.
+        """
+        flush_call_log(path=self.__path, buffer=self.__buffer, lock=self.__lock, max_bytes=self.__max_bytes, backup_count=self.__backup_count)  # fmt: skip  # noqa: E501
+
+
+def iter_call_records(path: str | PathLike[str]) -> Iterator[CallRecord]:
+    """
+    Streams the calls recorded in a call log, the file is memory-mapped so it is never loaded at once. Only read logs
+    from trusted sources, records are unpickled.
+
+    Args:
+        path (str | PathLike[str]): Path of the call log file.
+
+    Raises:
+        ValueError: If the file is not a call log.
+
+    Yields:
+        CallRecord: The recorded calls, in recording order. A truncated last record is ignored.
+    """
+    with open(path, mode='rb') as file:
+        if not file.read(len(CALL_LOG_MAGIC)):
+            return
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+            if data[: len(CALL_LOG_MAGIC)] != CALL_LOG_MAGIC:
+                raise ValueError(f'File {fspath(path)} is not a call log.')
+
+            offset = len(CALL_LOG_MAGIC)
+            while offset + FRAME_HEADER.size <= len(data):
+                (length,) = FRAME_HEADER.unpack_from(data, offset)
+                offset += FRAME_HEADER.size
+                if offset + length > len(data):
+                    return
+
+                call = pickle.loads(data[offset : offset + length])  # noqa: S301  # nosec: B301
+                offset += length
+                function, arguments, return_value, execution_time, timestamp = call
+                replayable = isinstance(arguments, bytes)
+                args, kwargs = pickle.loads(arguments) if replayable else arguments  # noqa: S301  # nosec: B301
+
+                yield CallRecord(
+                    function=function,
+                    args=args,
+                    kwargs=kwargs,
+                    return_value=return_value,
+                    execution_time=execution_time,
+                    timestamp=timestamp,
+                    replayable=replayable,
+                )
+
+
+def replay_calls(
+    function: Callable[..., Any],
+    path: str | PathLike[str],
+    name: str | None = None,
+) -> Iterator[tuple[CallRecord, Any]]:
+    """
+    Re-runs a function against the calls recorded in a call log. Records whose arguments could not be pickled are not
+    replayable and they are skipped.
+
+    Args:
+        function (Callable[..., Any]): Function to call with the recorded arguments.
+        path (str | PathLike[str]): Path of the call log file.
+        name (str | None, optional): Qualified name of the recorded calls to replay, if None the "module.qualname" of
+        the function is used. Defaults to None.
+
+    Yields:
+        tuple[CallRecord, Any]: Each replayed record and the value returned by the function.
+    """
+    name = f'{function.__module__}.{function.__qualname__}' if name is None else name
+    for record in iter_call_records(path=path):
+        if record.function == name and record.replayable:
+            yield record, function(*record.args, **record.kwargs)
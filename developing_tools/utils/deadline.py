@@ -0,0 +1,51 @@
+"""
+This module contains the deadline shared by the timeout and retryit decorators. The deadline is stored in a context
+variable, so it follows the call through nested decorated functions, threads started by timeout and asyncio tasks.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+_deadline: ContextVar[float | None] = ContextVar('deadline', default=None)
+
+
+def remaining_time() -> float | None:
+    """
+    Returns the time left before the deadline of the current context, set by the outermost timeout decorated call.
+
+    Returns:
+        float | None: The remaining seconds, 0 if the deadline has passed, None if there is no deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+
+    return max(deadline - monotonic(), 0.0)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[float]:
+    """
+    Sets the deadline of the current context to the given number of seconds from now while the block runs. An
+    enclosing deadline that expires earlier is kept, so nested scopes can only shorten it.
+
+    Args:
+        seconds (float): Number of seconds from now.
+
+    Yields:
+        float: The seconds left before the effective deadline.
+    """
+    now = monotonic()
+    remaining = seconds
+    enclosing = _deadline.get()
+    if enclosing is not None and enclosing - now < seconds:
+        remaining = max(enclosing - now, 0.0)
+
+    token = _deadline.set(now + remaining)
+    try:
+        yield remaining
+
+    finally:
+        _deadline.reset(token)
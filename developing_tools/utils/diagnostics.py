@@ -0,0 +1,42 @@
+"""
+This module contains the switch that disables the diagnostic decorators and context managers of the package, so they
+can be kept in production code at no cost.
+"""
+
+from os import environ
+
+DIAGNOSTICS_ENVIRONMENT_VARIABLE = 'DEVELOPING_TOOLS_DISABLE_DIAGNOSTICS'
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+_diagnostics_enabled = environ.get(DIAGNOSTICS_ENVIRONMENT_VARIABLE, '').strip().lower() not in TRUE_VALUES
+
+
+def diagnostics_enabled() -> bool:
+    """
+    Returns whether the diagnostic decorators and context managers are enabled. They are disabled at import time when
+    the DEVELOPING_TOOLS_DISABLE_DIAGNOSTICS environment variable is "1", "true", "yes" or "on".
+
+    Returns:
+        bool: True if the diagnostics are enabled.
+    """
+    return _diagnostics_enabled
+
+
+def set_diagnostics_enabled(enabled: bool) -> None:
+    """
+    Enables or disables the diagnostic decorators and context managers. Decorators check the switch when they are
+    applied, so it must be set before the functions are decorated, while ExecutionTimeBlock checks it when it is
+    created.
+
+    Args:
+        enabled (bool): Whether the diagnostics are enabled.
+
+    Raises:
+        TypeError: If enabled is not a boolean.
+    """
+    global _diagnostics_enabled
+
+    if type(enabled) is not bool:
+        raise TypeError(f'enabled must be a boolean, got {type(enabled).__name__} instead.')
+
+    _diagnostics_enabled = enabled
@@ -0,0 +1,198 @@
+"""
+This module contains the HedgeState class, the shared state of a function decorated with hedge: the delay before a
+hedged call, the latency histogram it is derived from and the extra load counters.
+"""
+
+from threading import Lock
+
+from developing_tools.utils.latency_registry import LatencyHistogram
+from developing_tools.utils.override import override
+
+HEDGE_MIN_SAMPLES = 20
+HEDGE_DELAY_REFRESH = 32
+
+
+class HedgeStatistics:
+    """
+    Immutable snapshot of the statistics of a hedged function.
+    """
+
+    __calls: int
+    __hedges: int
+    __wins: int
+
+    def __init__(self, calls: int, hedges: int, wins: int) -> None:
+        """
+        Initializes the HedgeStatistics snapshot.
+
+        Args:
+            calls (int): Number of calls to the decorated function.
+            hedges (int): Number of hedged calls launched.
+            wins (int): Number of calls answered by a hedged call.
+        """
+        self.__calls = calls
+        self.__hedges = hedges
+        self.__wins = wins
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the snapshot.
+
+        Returns:
+            str: The string representation of the snapshot.
+        """
+        return f'HedgeStatistics(calls={self.calls}, hedges={self.hedges}, wins={self.wins}, extra_load={self.extra_load:.4f})'  # fmt: skip  # noqa: E501
+
+    @property
+    def calls(self) -> int:
+        """
+        Returns the number of calls to the decorated function.
+
+        Returns:
+            int: The number of calls.
+        """
+        return self.__calls
+
+    @property
+    def hedges(self) -> int:
+        """
+        Returns the number of hedged calls launched.
+
+        Returns:
+            int: The number of hedged calls.
+        """
+        return self.__hedges
+
+    @property
+    def wins(self) -> int:
+        """
+        Returns the number of calls answered by a hedged call instead of the primary one.
+
+        Returns:
+            int: The number of wins.
+        """
+        return self.__wins
+
+    @property
+    def extra_load(self) -> float:
+        """
+        Returns the extra load caused by hedging, the ratio of hedged calls to calls.
+
+        Returns:
+            float: The extra load ratio, 0 if there are no calls.
+        """
+        return self.__hedges / self.__calls if self.__calls else 0.0
+
+
+class HedgeState:
+    """
+    Thread-safe state of a hedged function. The delay is fixed or derived from the observed latency percentile of the
+    primary calls, which is recomputed every HEDGE_DELAY_REFRESH calls once HEDGE_MIN_SAMPLES latencies have been
+    recorded, until then no call is hedged.
+    """
+
+    __fixed_delay: float | None
+    __percentile: float
+    __max_extra_load: float | None
+    __histogram: LatencyHistogram
+    __delay: float | None
+    __samples: int
+    __calls: int
+    __hedges: int
+    __wins: int
+    __lock: Lock
+
+    def __init__(self, delay: float | None, percentile: float, max_extra_load: float | None) -> None:
+        """
+        Initializes the HedgeState.
+
+        Args:
+            delay (float | None): Fixed delay in seconds, if None it is derived from the observed latency.
+            percentile (float): Latency percentile used as the delay when it is not fixed.
+            max_extra_load (float | None): Maximum ratio of hedged calls to calls, if None it is unbounded.
+        """
+        self.__fixed_delay = delay
+        self.__percentile = percentile
+        self.__max_extra_load = max_extra_load
+        self.__histogram = LatencyHistogram()
+        self.__delay = delay
+        self.__samples = self.__calls = self.__hedges = self.__wins = 0
+        self.__lock = Lock()
+
+    def start(self) -> float | None:
+        """
+        Counts a call and returns the delay before hedging it.
+
+        Returns:
+            float | None: The delay in seconds, None if the call must not be hedged.
+        """
+        with self.__lock:
+            self.__calls += 1
+            return self.__delay
+
+    def acquire_hedge(self) -> bool:
+        """
+        Counts a hedged call if the maximum extra load allows it.
+
+        Returns:
+            bool: True if the call can be hedged.
+        """
+        with self.__lock:
+            if self.__max_extra_load is not None and self.__hedges + 1 > self.__max_extra_load * self.__calls:
+                return False
+
+            self.__hedges += 1
+            return True
+
+    def finish(self, hedged_win: bool) -> None:
+        """
+        Counts a successful call.
+
+        Args:
+            hedged_win (bool): Whether the call was answered by a hedged call.
+        """
+        with self.__lock:
+            self.__wins += hedged_win
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Records the latency of the primary call and refreshes the delay when it is derived from the latency. Only the
+        primary call is recorded, the end-to-end latency of a hedged call is shortened by the hedge itself and would
+        lower the delay, hedging more and more calls.
+
+        Args:
+            nanoseconds (int): Latency of the primary call in nanoseconds.
+        """
+        self.__histogram.record(nanoseconds=nanoseconds)
+        with self.__lock:
+            self.__samples += 1
+            if self.__fixed_delay is not None or self.__samples < HEDGE_MIN_SAMPLES:
+                return
+
+            if self.__delay is not None and self.__samples % HEDGE_DELAY_REFRESH:
+                return
+
+        delay = self.__histogram.snapshot().percentile(percentile=self.__percentile)
+        with self.__lock:
+            self.__delay = delay
+
+    @property
+    def delay(self) -> float | None:
+        """
+        Returns the current delay before hedging a call.
+
+        Returns:
+            float | None: The delay in seconds, None while there are not enough latency samples.
+        """
+        return self.__delay
+
+    def statistics(self) -> HedgeStatistics:
+        """
+        Returns the statistics of the hedged function.
+
+        Returns:
+            HedgeStatistics: The statistics of the hedged function.
+        """
+        with self.__lock:
+            return HedgeStatistics(calls=self.__calls, hedges=self.__hedges, wins=self.__wins)
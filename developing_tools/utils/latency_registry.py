@@ -0,0 +1,502 @@
+"""
+This module contains an array-backed latency histogram and a registry that keeps one histogram per measured function,
+used to aggregate execution times instead of printing them one by one.
+"""
+
+from array import array
+from threading import Lock, local
+from typing import Any
+from weakref import WeakMethod, finalize
+
+from developing_tools.patterns import SingletonPattern
+from developing_tools.utils.override import override
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_BITS = 44  # about 4.9 hours in nanoseconds, longer samples are clamped to the last bucket
+BUCKETS = (MAX_BITS - SUB_BUCKET_BITS + 1) * SUB_BUCKETS
+
+
+def bucket_index(nanoseconds: int) -> int:
+    """
+    Returns the log-linear bucket of a sample, every power of two is split in 32 linear sub-buckets so the relative
+    error of any percentile is below 3.2%.
+
+    Args:
+        nanoseconds (int): The sample in nanoseconds.
+
+    Returns:
+        int: The bucket index.
+    """
+    if nanoseconds < SUB_BUCKETS:
+        return max(nanoseconds, 0)
+
+    exponent = nanoseconds.bit_length() - 1
+    if exponent >= MAX_BITS:
+        return BUCKETS - 1
+
+    shift = exponent - SUB_BUCKET_BITS
+    return (shift + 1) * SUB_BUCKETS + (nanoseconds >> shift) - SUB_BUCKETS
+
+
+def bucket_value(index: int) -> float:
+    """
+    Returns the value in nanoseconds that represents a bucket, the middle point of its range.
+
+    Args:
+        index (int): The bucket index.
+
+    Returns:
+        float: The representative value of the bucket in nanoseconds.
+    """
+    if index < SUB_BUCKETS:
+        return index
+
+    shift = index // SUB_BUCKETS - 1
+    lower = (SUB_BUCKETS + index % SUB_BUCKETS) << shift
+    return lower + ((1 << shift) - 1) / 2
+
+
+class LatencyShard:
+    """
+    Samples recorded by a single thread, only its owner thread writes to it so recording needs no lock. Counts and
+    totals are weighted, so a sample that stands for several unsampled calls is counted as many times.
+    """
+
+    __slots__ = ('count', 'counts', 'maximum', 'minimum', 'samples', 'total')
+
+    count: float
+    counts: 'array[float]'
+    maximum: int
+    minimum: int
+    samples: int
+    total: float
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty LatencyShard.
+        """
+        self.count = 0.0
+        self.counts = array('d', bytes(8 * BUCKETS))
+        self.maximum = 0
+        self.minimum = -1
+        self.samples = 0
+        self.total = 0.0
+
+
+class ShardOwner:
+    """
+    Thread-local handle of a LatencyShard, it is freed when its thread finishes so the shard can be folded.
+    """
+
+    __slots__ = ('__weakref__', 'shard')
+
+    shard: LatencyShard
+
+    def __init__(self, shard: LatencyShard) -> None:
+        """
+        Initializes the ShardOwner.
+
+        Args:
+            shard (LatencyShard): The shard of the thread.
+        """
+        self.shard = shard
+
+
+def merge_shards(shards: list[LatencyShard]) -> LatencyShard:
+    """
+    Returns a new shard with the samples of all the given shards.
+
+    Args:
+        shards (list[LatencyShard]): The shards to merge.
+
+    Returns:
+        LatencyShard: The merged shard.
+    """
+    merged = LatencyShard()
+    counts = merged.counts
+    for shard in shards:
+        if not shard.samples:
+            continue
+
+        for index, count in enumerate(shard.counts):
+            if count:
+                counts[index] += count
+
+        merged.count += shard.count
+        merged.samples += shard.samples
+        merged.total += shard.total
+        merged.maximum = max(merged.maximum, shard.maximum)
+        if shard.minimum < merged.minimum or merged.minimum < 0:
+            merged.minimum = shard.minimum
+
+    return merged
+
+
+def retire_shard(method: 'WeakMethod[Any]', shard: LatencyShard) -> None:
+    """
+    Hands the shard of a finished thread back to its histogram, if the histogram is still alive.
+
+    Args:
+        method (WeakMethod[Any]): Weak reference to the retire method of the histogram.
+        shard (LatencyShard): The shard of the finished thread.
+    """
+    retire = method()
+    if retire is not None:
+        retire(shard)
+
+
+class LatencyStatistics:
+    """
+    Immutable snapshot of the samples recorded by a LatencyHistogram, all values are expressed in seconds.
+    """
+
+    __count: float
+    __total: float
+    __minimum: int
+    __maximum: int
+    __counts: list[float]
+    __samples: int
+
+    def __init__(
+        self,
+        count: float,
+        total: float,
+        minimum: int,
+        maximum: int,
+        counts: list[float],
+        samples: int,
+    ) -> None:
+        """
+        Initializes the LatencyStatistics snapshot.
+
+        Args:
+            count (float): Weighted number of samples, the estimated number of calls.
+            total (float): Weighted sum of all samples in nanoseconds.
+            minimum (int): Smallest sample in nanoseconds.
+            maximum (int): Largest sample in nanoseconds.
+            counts (list[float]): Weighted number of samples per bucket.
+            samples (int): Number of recorded samples, without weighting.
+        """
+        self.__count = count
+        self.__total = total
+        self.__minimum = minimum
+        self.__maximum = maximum
+        self.__counts = counts
+        self.__samples = samples
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the snapshot.
+
+        Returns:
+            str: The string representation of the snapshot.
+        """
+        return f'LatencyStatistics(count={self.count}, samples={self.samples}, mean={self.mean}, minimum={self.minimum}, maximum={self.maximum}, p50={self.p50}, p95={self.p95}, p99={self.p99})'  # fmt: skip  # noqa: E501
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of samples, weighted by the number of calls each sample stands for, so with sampling it is
+        an unbiased estimate of the number of calls.
+
+        Returns:
+            int: The weighted number of samples.
+        """
+        return round(self.__count)
+
+    @property
+    def samples(self) -> int:
+        """
+        Returns the number of recorded samples, without weighting.
+
+        Returns:
+            int: The number of recorded samples.
+        """
+        return self.__samples
+
+    @property
+    def mean(self) -> float:
+        """
+        Returns the mean of the samples.
+
+        Returns:
+            float: The mean of the samples in seconds, 0 if there are no samples.
+        """
+        return self.__total / self.__count / 1e9 if self.__count else 0.0
+
+    @property
+    def minimum(self) -> float:
+        """
+        Returns the smallest sample.
+
+        Returns:
+            float: The smallest sample in seconds, 0 if there are no samples.
+        """
+        return self.__minimum / 1e9 if self.__count else 0.0
+
+    @property
+    def maximum(self) -> float:
+        """
+        Returns the largest sample.
+
+        Returns:
+            float: The largest sample in seconds, 0 if there are no samples.
+        """
+        return self.__maximum / 1e9
+
+    @property
+    def p50(self) -> float:
+        """
+        Returns the median of the samples.
+
+        Returns:
+            float: The median of the samples in seconds.
+        """
+        return self.percentile(percentile=50)
+
+    @property
+    def p95(self) -> float:
+        """
+        Returns the 95th percentile of the samples.
+
+        Returns:
+            float: The 95th percentile of the samples in seconds.
+        """
+        return self.percentile(percentile=95)
+
+    @property
+    def p99(self) -> float:
+        """
+        Returns the 99th percentile of the samples.
+
+        Returns:
+            float: The 99th percentile of the samples in seconds.
+        """
+        return self.percentile(percentile=99)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns the given percentile of the samples.
+
+        Args:
+            percentile (float): The percentile to compute, between 0 and 100.
+
+        Raises:
+            TypeError: If the percentile is not a number.
+            ValueError: If the percentile is not between 0 and 100.
+
+        Returns:
+            float: The percentile of the samples in seconds, 0 if there are no samples.
+        """
+        if type(percentile) not in [int, float]:
+            raise TypeError(f'Percentile must be a number. Got {type(percentile).__name__} instead.')
+
+        if not 0 <= percentile <= 100:
+            raise ValueError(f'Percentile must be between 0 and 100. Got {percentile} instead.')
+
+        if not self.__count:
+            return 0.0
+
+        rank = max(1, round(percentile / 100 * self.__count))
+        seen = 0.0
+        for index, count in enumerate(self.__counts):
+            seen += count
+            if seen >= rank:
+                return min(max(bucket_value(index=index), self.__minimum), self.__maximum) / 1e9
+
+        return self.__maximum / 1e9  # pragma: no cover
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram. Each thread records into its own array-backed shard, so recording never contends on
+    a lock, and the shards are merged when a snapshot is requested. When a thread finishes its shard is retired and
+    later folded, under the lock, into a single shard of the finished threads, so short-lived threads do not leave a
+    shard each behind.
+    """
+
+    __lock: Lock
+    __local: local
+    __shards: list[LatencyShard]
+    __finished: LatencyShard | None
+    __retired: list[LatencyShard]
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty LatencyHistogram.
+        """
+        self.__lock = Lock()
+        self.__local = local()
+        self.__shards = []
+        self.__finished = None
+        self.__retired = []
+
+    @property
+    def shards(self) -> int:
+        """
+        Returns the number of shards, one per alive thread that recorded samples plus one for the finished threads.
+
+        Returns:
+            int: The number of shards.
+        """
+        with self.__lock:
+            self.__fold()
+            return len(self.__shards)
+
+    def record(self, nanoseconds: int, weight: float = 1) -> None:
+        """
+        Records a sample.
+
+        Args:
+            nanoseconds (int): The sample in nanoseconds.
+            weight (float, optional): Number of calls the sample stands for, for example N when only 1 in N calls is
+            timed. Defaults to 1.
+        """
+        owner = getattr(self.__local, 'owner', None)
+        if owner is None:
+            owner = self.__local.owner = ShardOwner(shard=LatencyShard())
+            finalize(owner, retire_shard, WeakMethod(self.__retire), owner.shard)
+            with self.__lock:
+                self.__fold()
+                self.__shards.append(owner.shard)
+
+        shard = owner.shard
+
+        shard.counts[bucket_index(nanoseconds=nanoseconds)] += weight
+        shard.count += weight
+        shard.samples += 1
+        shard.total += nanoseconds * weight
+        if nanoseconds > shard.maximum:
+            shard.maximum = nanoseconds
+
+        if nanoseconds < shard.minimum or shard.minimum < 0:
+            shard.minimum = nanoseconds
+
+    def snapshot(self) -> LatencyStatistics:
+        """
+        Returns the statistics of the samples recorded so far.
+
+        Returns:
+            LatencyStatistics: The statistics of the recorded samples.
+        """
+        with self.__lock:
+            self.__fold()
+            shards = list(self.__shards)
+
+        merged = merge_shards(shards=shards)
+        return LatencyStatistics(
+            count=merged.count,
+            total=merged.total,
+            minimum=max(merged.minimum, 0),
+            maximum=merged.maximum,
+            counts=merged.counts.tolist(),
+            samples=merged.samples,
+        )
+
+    def reset(self) -> None:
+        """
+        Discards every recorded sample.
+        """
+        with self.__lock:
+            self.__local = local()
+            self.__shards = []
+            self.__finished = None
+            self.__retired = []
+
+    def __retire(self, shard: LatencyShard) -> None:
+        """
+        Queues the shard of a finished thread to be folded. It takes no lock because it runs when the thread-local
+        storage of the thread is freed, which may happen while the lock is held.
+
+        Args:
+            shard (LatencyShard): The shard of the finished thread.
+        """
+        self.__retired.append(shard)
+
+    def __fold(self) -> None:
+        """
+        Folds the retired shards into the shard of the finished threads, it must be called with the lock held. The
+        folded shard is built anew, so a snapshot taken meanwhile never reads a shard while it changes.
+        """
+        retired: list[LatencyShard] = []
+        while self.__retired:
+            shard = self.__retired.pop()
+            if any(current is shard for current in self.__shards):  # shards recorded before a reset are dropped
+                retired.append(shard)
+
+        if not retired:
+            return
+
+        finished = merge_shards(shards=retired if self.__finished is None else [self.__finished, *retired])
+        folded = [*retired, self.__finished]
+        self.__shards = [current for current in self.__shards if not any(current is shard for shard in folded)]
+        self.__shards.append(finished)
+        self.__finished = finished
+
+
+class LatencyRegistry(metaclass=SingletonPattern):
+    """
+    Registry that keeps one LatencyHistogram per measured function name.
+    """
+
+    __lock: Lock
+    __histograms: dict[str, LatencyHistogram]
+
+    def __init__(self) -> None:
+        """
+        Initializes the LatencyRegistry.
+        """
+        self.__lock = Lock()
+        self.__histograms = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """
+        Returns the histogram registered with the given name, creating it if it does not exist.
+
+        Args:
+            name (str): The histogram name.
+
+        Returns:
+            LatencyHistogram: The histogram registered with the given name.
+        """
+        with self.__lock:
+            if name not in self.__histograms:
+                self.__histograms[name] = LatencyHistogram()
+
+            return self.__histograms[name]
+
+    def snapshot(self, name: str | None = None) -> dict[str, LatencyStatistics]:
+        """
+        Returns the statistics of every registered histogram, or only of the given one.
+
+        Args:
+            name (str | None, optional): The histogram name, if None every histogram is included. Defaults to None.
+
+        Raises:
+            KeyError: If there is no histogram registered with the given name.
+
+        Returns:
+            dict[str, LatencyStatistics]: The statistics of each histogram by name.
+        """
+        with self.__lock:
+            histograms = dict(self.__histograms) if name is None else {name: self.__histograms[name]}
+
+        return {histogram_name: histogram.snapshot() for histogram_name, histogram in histograms.items()}
+
+    def reset(self, name: str | None = None) -> None:
+        """
+        Discards the samples of every registered histogram, or only of the given one.
+
+        Args:
+            name (str | None, optional): The histogram name, if None every histogram is reset. Defaults to None.
+
+        Raises:
+            KeyError: If there is no histogram registered with the given name.
+        """
+        with self.__lock:
+            histograms = list(self.__histograms.values()) if name is None else [self.__histograms[name]]
+
+        for histogram in histograms:
+            histogram.reset()
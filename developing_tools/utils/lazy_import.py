@@ -0,0 +1,84 @@
+"""
+This module contains the helpers that make the attributes of a package import their submodule on first access, so
+importing a package does not import every submodule.
+"""
+
+from collections.abc import Callable
+from importlib import import_module
+from sys import modules
+from types import ModuleType
+from typing import Any
+
+from developing_tools.utils.override import override
+
+LAZY_EXPORTS_ATTRIBUTE = '__lazy_exports__'
+
+
+class LazyPackage(ModuleType):
+    """
+    Module type of a package with lazy exports. Importing a submodule binds it as an attribute of its package, when the
+    submodule has the same name as the export it defines (for example developing_tools.functions.timeout) the export is
+    bound instead, so the package attribute is always the exported object.
+    """
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute of the package, replacing a submodule by the export with the same name.
+
+        Args:
+            name (str): Attribute name.
+            value (Any): Attribute value.
+        """
+        exports = self.__dict__.get(LAZY_EXPORTS_ATTRIBUTE, {})
+        if isinstance(value, ModuleType) and exports.get(name) == name and hasattr(value, name):
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Makes the exports of a package lazy, returning the module level __getattr__ and __dir__ functions of the package.
+
+    Args:
+        package (str): Name of the package, its __name__.
+        exports (dict[str, str]): Name of the submodule that defines each export.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The __getattr__ and __dir__ functions of the package.
+    """
+    module = modules[package]
+    setattr(module, LAZY_EXPORTS_ATTRIBUTE, exports)
+    module.__class__ = LazyPackage
+
+    def get_attribute(name: str) -> Any:
+        """
+        Imports the submodule that defines an export and binds the export to the package.
+
+        Args:
+            name (str): Attribute name.
+
+        Raises:
+            AttributeError: If the package has no such export.
+
+        Returns:
+            Any: The exported object.
+        """
+        if name not in exports:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+        value = getattr(import_module(f'{package}.{exports[name]}'), name)
+        setattr(module, name, value)
+        return value
+
+    def list_attributes() -> list[str]:
+        """
+        Returns the attributes of the package, including the exports that have not been imported yet.
+
+        Returns:
+            list[str]: The attribute names.
+        """
+        return sorted({*vars(module), *exports})
+
+    return get_attribute, list_attributes
@@ -0,0 +1,182 @@
+"""
+This module contains the MemoryProfile class, that measures the allocations, resident memory and garbage collections
+of a code block for ExecutionTimeBlock.
+"""
+
+import gc
+import tracemalloc
+from sys import platform
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+GC_GENERATIONS = 3
+
+_tracing_lock = Lock()
+_tracing_profiles = 0
+_started_tracing = False
+
+
+def resident_memory() -> int:
+    """
+    Returns the resident set size (RSS) of the process. It is read from /proc/self/statm when it exists, on other
+    platforms the peak resident set size is returned as it is the only one the standard library exposes.
+
+    Returns:
+        int: The resident set size in bytes, 0 if the platform does not expose it.
+    """
+    try:
+        with open('/proc/self/statm', mode='rb') as file:
+            from resource import getpagesize
+
+            return int(file.read().split()[1]) * getpagesize()
+
+    except (OSError, ImportError, IndexError, ValueError):
+        pass
+
+    try:
+        from resource import RUSAGE_SELF, getrusage
+
+    except ImportError:  # pragma: no cover
+        return 0
+
+    return getrusage(RUSAGE_SELF).ru_maxrss * (1 if platform == 'darwin' else 1024)  # pragma: no cover
+
+
+class MemoryProfile:
+    """
+    Measures a code block between start and stop: the memory allocated and the allocation peak traced by tracemalloc,
+    the resident set size delta, and the garbage collections and their pause time per generation.
+
+    tracemalloc is process wide, it is started by the first active profile if it is not already tracing and stopped
+    when the last active profile stops, it slows every allocation down while it traces. The allocation peak is reset
+    only when no other profile is active, so the peak of overlapping profiles, nested or in other threads and tasks,
+    is the peak since the first of them started and may overstate theirs. Allocations, as garbage collections, are
+    process wide, the ones made by other threads while the block runs are counted too.
+    """
+
+    __start_traced_memory: int
+    __start_resident_memory: int
+    __allocated_memory: int
+    __peak_memory: int
+    __resident_memory_delta: int
+    __collection_start: float
+    __collections: list[int]
+    __pause_times: list[float]
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty MemoryProfile.
+        """
+        self.__start_traced_memory = self.__start_resident_memory = 0
+        self.__allocated_memory = self.__peak_memory = self.__resident_memory_delta = 0
+        self.__collection_start = 0.0
+        self.__collections = [0] * GC_GENERATIONS
+        self.__pause_times = [0.0] * GC_GENERATIONS
+
+    def start(self) -> None:
+        """
+        Starts measuring, discarding the measures of a previous run.
+        """
+        global _tracing_profiles, _started_tracing
+
+        self.__collections = [0] * GC_GENERATIONS
+        self.__pause_times = [0.0] * GC_GENERATIONS
+        with _tracing_lock:
+            if _tracing_profiles == 0:
+                _started_tracing = not tracemalloc.is_tracing()
+                if _started_tracing:
+                    tracemalloc.start()
+
+                tracemalloc.reset_peak()
+
+            _tracing_profiles += 1
+            self.__start_traced_memory = tracemalloc.get_traced_memory()[0]
+
+        self.__start_resident_memory = resident_memory()
+        gc.callbacks.append(self.__gc_callback)
+
+    def stop(self) -> None:
+        """
+        Stops measuring.
+        """
+        global _tracing_profiles, _started_tracing
+
+        gc.callbacks.remove(self.__gc_callback)
+        self.__resident_memory_delta = resident_memory() - self.__start_resident_memory
+
+        with _tracing_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            _tracing_profiles -= 1
+            if _tracing_profiles == 0 and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+
+        self.__allocated_memory = current - self.__start_traced_memory
+        self.__peak_memory = max(peak - self.__start_traced_memory, 0)
+
+    def __gc_callback(self, phase: str, info: dict[str, Any]) -> None:
+        """
+        Records the garbage collections, called by the garbage collector before and after each collection.
+
+        Args:
+            phase (str): 'start' before the collection and 'stop' after it.
+            info (dict[str, Any]): Information about the collection, including its generation.
+        """
+        if phase == 'start':
+            self.__collection_start = perf_counter()
+            return
+
+        generation = info['generation']
+        self.__collections[generation] += 1
+        self.__pause_times[generation] += perf_counter() - self.__collection_start
+
+    @property
+    def allocated_memory(self) -> int:
+        """
+        Returns the memory allocated by the block and still alive when it ended.
+
+        Returns:
+            int: The allocated memory in bytes, negative if the block freed more than it allocated.
+        """
+        return self.__allocated_memory
+
+    @property
+    def peak_memory(self) -> int:
+        """
+        Returns the allocation peak of the block over the memory traced when it started.
+
+        Returns:
+            int: The allocation peak in bytes.
+        """
+        return self.__peak_memory
+
+    @property
+    def resident_memory_delta(self) -> int:
+        """
+        Returns the change of the resident set size of the process while the block ran.
+
+        Returns:
+            int: The resident set size delta in bytes.
+        """
+        return self.__resident_memory_delta
+
+    @property
+    def gc_collections(self) -> tuple[int, ...]:
+        """
+        Returns the number of garbage collections per generation.
+
+        Returns:
+            tuple[int, ...]: The number of collections of generations 0, 1 and 2.
+        """
+        return tuple(self.__collections)
+
+    @property
+    def gc_pause_time(self) -> tuple[float, ...]:
+        """
+        Returns the time spent in garbage collections per generation.
+
+        Returns:
+            tuple[float, ...]: The pause time in seconds of generations 0, 1 and 2.
+        """
+        return tuple(self.__pause_times)
@@ -0,0 +1,33 @@
+"""
+This module contains the override decorator used to mark overridden methods, type checkers get the typing_extensions
+version while at runtime a no-op fallback is used, so typing_extensions is neither imported nor required.
+"""
+
+from collections.abc import Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, TypeVar
+
+Method = TypeVar('Method', bound=Callable[..., Any])
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing_extensions import override
+
+else:
+
+    def override(method: Method) -> Method:  # noqa: UP047
+        """
+        Marks a method as an override of a method of a base class.
+
+        Args:
+            method (Method): The overriding method.
+
+        Returns:
+            Method: The same method, flagged with the __override__ attribute.
+        """
+        with suppress(AttributeError, TypeError):
+            method.__override__ = True
+
+        return method
+
+
+__all__ = ('override',)
@@ -0,0 +1,458 @@
+"""
+This module contains a pool of reusable worker processes that can be terminated and replaced one by one, used to run
+functions that must be killed when they exceed a deadline.
+"""
+
+import pickle  # nosec: B403
+from collections.abc import Callable
+from importlib import import_module
+from mmap import mmap
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from os import O_RDWR, close, name as os_name, open as os_open, unlink
+from os.path import isdir, join
+from sys import version_info
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Any
+
+PROCESS_TARGET_ATTRIBUTE = '__process_target__'
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+SHARED_MEMORY_SUPPORTED = os_name == 'posix'  # on Windows a segment is destroyed when its creator closes it
+SHARED_MEMORY_DIRECTORY = '/dev/shm'  # noqa: S108  # nosec: B108  # where Linux exposes the segments as files
+
+
+def function_reference(function: Callable[..., Any]) -> bytes:
+    """
+    Serializes a function so it can be sent to a worker process. Functions decorated at module level can not be pickled
+    directly because the module attribute is the wrapper, in that case they are referenced by module and qualified name
+    and the worker unwraps them until it finds the wrapper holding the original function.
+
+    Args:
+        function (Callable[..., Any]): Function to serialize.
+
+    Returns:
+        bytes: The serialized function reference.
+    """
+    try:
+        return pickle.dumps(function)
+
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return pickle.dumps((function.__module__, function.__qualname__))
+
+
+def resolve_function(reference: bytes) -> Callable[..., Any]:
+    """
+    Resolves a function reference created by function_reference inside the worker process.
+
+    Args:
+        reference (bytes): The serialized function reference.
+
+    Returns:
+        Callable[..., Any]: The function to execute.
+    """
+    function = pickle.loads(reference)  # noqa: S301  # nosec: B301
+    if not isinstance(function, tuple):
+        return function  # type: ignore[no-any-return]
+
+    module_name, qualname = function
+    target = import_module(name=module_name)
+    for attribute in qualname.split('.'):
+        target = getattr(target, attribute)
+
+    while not hasattr(target, PROCESS_TARGET_ATTRIBUTE):
+        target = target.__wrapped__
+
+    return getattr(target, PROCESS_TARGET_ATTRIBUTE)  # type: ignore[no-any-return]
+
+
+def create_segment(buffer: pickle.PickleBuffer) -> tuple[str, int]:
+    """
+    Copies a buffer into a new shared memory segment, the receiver is responsible of unlinking it.
+
+    Args:
+        buffer (pickle.PickleBuffer): Buffer to share.
+
+    Returns:
+        tuple[str, int]: The segment name and the buffer size in bytes.
+    """
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+
+    data = buffer.raw()
+    if version_info >= (3, 13):
+        segment = SharedMemory(create=True, size=data.nbytes, track=False)  # type: ignore[call-arg, unused-ignore]
+    else:
+        segment = SharedMemory(create=True, size=data.nbytes)
+        resource_tracker.unregister(segment._name, 'shared_memory')  # type: ignore[attr-defined]
+
+    segment.buf[: data.nbytes] = data  # type: ignore[index]
+    segment.close()
+
+    return segment.name, data.nbytes
+
+
+def map_segment(name: str, size: int, readonly: bool) -> memoryview | None:
+    """
+    Maps a shared memory segment without copying it and unlinks its name. The memory stays mapped while the returned
+    view, or any object built on it, is alive and it is freed once the last one is released.
+
+    Args:
+        name (str): Segment name.
+        size (int): Buffer size in bytes.
+        readonly (bool): Whether the returned view is read-only.
+
+    Returns:
+        memoryview | None: The view of the segment, None if the platform does not expose the segments as files, then
+        the segment is not unlinked.
+    """
+    if not isdir(SHARED_MEMORY_DIRECTORY):
+        return None
+
+    path = join(SHARED_MEMORY_DIRECTORY, name.lstrip('/'))
+    descriptor = os_open(path, O_RDWR)
+    try:
+        mapping = mmap(descriptor, size)  # the mapping keeps its own descriptor
+
+    finally:
+        close(descriptor)
+        unlink(path)
+
+    view = memoryview(mapping)
+    return view.toreadonly() if readonly else view
+
+
+def read_segment(
+    name: str,
+    size: int,
+    kind: type[bytes] | type[bytearray] | type[memoryview],
+    readonly: bool,
+) -> bytes | bytearray | memoryview:
+    """
+    Reads a shared memory segment and unlinks it. Out-of-band buffers, for example the data of a numpy array, are
+    mapped without copying where the platform allows it, bytes and bytearray results own their memory so they are
+    copied once.
+
+    Args:
+        name (str): Segment name.
+        size (int): Buffer size in bytes.
+        kind (type[bytes] | type[bytearray] | type[memoryview]): Type of the returned buffer, memoryview for a view
+        of the segment.
+        readonly (bool): Whether the buffer is read-only.
+
+    Returns:
+        bytes | bytearray | memoryview: The segment content.
+    """
+    if kind is memoryview:
+        view = map_segment(name=name, size=size, readonly=readonly)
+        if view is not None:
+            return view
+
+        kind = bytes if readonly else bytearray
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    segment = SharedMemory(name=name)
+    try:
+        return kind(segment.buf[:size])  # type: ignore[index]
+
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def dump_result(status: str, value: Any) -> bytes:
+    """
+    Serializes the outcome of a call. Large bytes and bytearray results and large out-of-band buffers (for example
+    contiguous numpy arrays) are placed in shared memory instead of being written through the pipe, the out-of-band
+    buffers are received as views of the shared memory without copying them.
+
+    Args:
+        status (str): 'return' if the function returned a value, 'raise' if it raised an exception.
+        value (Any): The returned value or the raised exception.
+
+    Returns:
+        bytes: The serialized outcome.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    kinds: list[tuple[type[bytes] | type[bytearray] | type[memoryview], bool]] = []
+    result: pickle.PickleBuffer | None = None
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        """
+        Keeps small buffers in-band and collects the large ones to be sent through shared memory.
+
+        Args:
+            buffer (pickle.PickleBuffer): Buffer to serialize.
+
+        Returns:
+            bool: True if the buffer must be serialized in-band.
+        """
+        if buffer.raw().nbytes < SHARED_MEMORY_THRESHOLD:
+            return True
+
+        readonly = buffer.raw().readonly
+        buffers.append(buffer)
+        kinds.append(((bytes if readonly else bytearray) if buffer is result else memoryview, readonly))
+        return False
+
+    if SHARED_MEMORY_SUPPORTED and type(value) in (bytes, bytearray) and len(value) >= SHARED_MEMORY_THRESHOLD:
+        value = result = pickle.PickleBuffer(value)  # loaded as the received buffer, so it must own its memory
+
+    try:
+        payload = pickle.dumps(value, protocol=5, buffer_callback=buffer_callback if SHARED_MEMORY_SUPPORTED else None)
+
+    except Exception as exception:
+        status, buffers, kinds = 'raise', [], []
+        payload = pickle.dumps(TypeError(f'Function outcome could not be sent back to the caller: {exception}'))
+
+    segments = [(*create_segment(buffer=buffer), *kind) for buffer, kind in zip(buffers, kinds, strict=True)]
+    return pickle.dumps((status, payload, segments))
+
+
+def load_result(message: bytes) -> tuple[str, Any]:
+    """
+    Deserializes the outcome of a call created by dump_result, unlinking every shared memory segment it used.
+
+    Args:
+        message (bytes): The serialized outcome.
+
+    Returns:
+        tuple[str, Any]: The status and the returned value or the raised exception.
+    """
+    status, payload, segments = pickle.loads(message)  # noqa: S301  # nosec: B301
+
+    buffers: list[bytes | bytearray | memoryview] = []
+    try:
+        for name, size, kind, readonly in segments:
+            buffers.append(read_segment(name=name, size=size, kind=kind, readonly=readonly))
+
+    finally:
+        for name, _, _, _ in segments[len(buffers) + 1 :]:
+            read_segment(name=name, size=0, kind=bytes, readonly=True)
+
+    return status, pickle.loads(payload, buffers=buffers)  # noqa: S301  # nosec: B301
+
+
+def worker_loop(connection: Connection) -> None:
+    """
+    Main loop of a worker process, it executes the received calls one by one and sends back their outcome.
+
+    Args:
+        connection (Connection): Worker end of the pipe.
+    """
+    functions: dict[bytes, Callable[..., Any]] = {}
+    while True:
+        try:
+            reference, args, kwargs = pickle.loads(connection.recv_bytes())  # noqa: S301  # nosec: B301
+
+        except (EOFError, OSError):
+            return
+
+        try:
+            if reference not in functions:
+                functions[reference] = resolve_function(reference=reference)
+
+            message = dump_result(status='return', value=functions[reference](*args, **kwargs))
+
+        except Exception as exception:
+            message = dump_result(status='raise', value=exception)
+
+        connection.send_bytes(message)
+
+
+class ProcessWorker:
+    """
+    A worker process connected to its pool through a pipe.
+    """
+
+    __process: Any
+    __connection: Connection
+
+    def __init__(self, context: BaseContext) -> None:
+        """
+        Initializes and starts the worker process.
+
+        Args:
+            context (BaseContext): Multiprocessing context used to create the process.
+
+        Raises:
+            OSError: If the worker process can not be started.
+        """
+        self.__connection, worker_connection = context.Pipe()
+        try:
+            self.__process = context.Process(target=worker_loop, args=(worker_connection,), daemon=True)  # type: ignore[attr-defined]
+            self.__process.start()
+
+        except BaseException:
+            self.__connection.close()
+            raise
+
+        finally:
+            worker_connection.close()
+
+    @property
+    def connection(self) -> Connection:
+        """
+        Returns the pool end of the pipe.
+
+        Returns:
+            Connection: The pool end of the pipe.
+        """
+        return self.__connection
+
+    def is_alive(self) -> bool:
+        """
+        Returns whether the worker process is still running.
+
+        Returns:
+            bool: True if the worker process is running.
+        """
+        return self.__process.is_alive()  # type: ignore[no-any-return]
+
+    def terminate(self) -> None:
+        """
+        Terminates the worker process, killing it if it does not stop in one second.
+        """
+        self.__process.terminate()
+        self.__process.join(1)
+        if self.__process.is_alive():
+            self.__process.kill()
+            self.__process.join()
+
+        self.__connection.close()
+
+
+class ProcessPool:
+    """
+    A bounded pool of warm worker processes. Idle workers are reused between calls and a worker that exceeds its
+    deadline is terminated and immediately replaced by a new one.
+    """
+
+    __context: BaseContext
+    __idle: list[ProcessWorker]
+    __lock: Lock
+    __slots: BoundedSemaphore
+
+    def __init__(self, max_workers: int) -> None:
+        """
+        Initializes the ProcessPool, worker processes are started on demand.
+
+        Args:
+            max_workers (int): Maximum number of worker processes running at the same time.
+        """
+        self.__context = get_context()
+        self.__idle = []
+        self.__lock = Lock()
+        self.__slots = BoundedSemaphore(value=max_workers)
+
+    def execute(
+        self,
+        function: Callable[..., Any],
+        reference: bytes,
+        seconds: float,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        remaining: float | None = None,
+    ) -> Any:
+        """
+        Executes a function in a worker process and waits for it at most the given number of seconds.
+
+        Args:
+            function (Callable[..., Any]): Function to execute, only used for error messages.
+            reference (bytes): The function reference created by function_reference.
+            seconds (float): Timeout in seconds, it includes the time waiting for a free worker.
+            args (tuple[Any, ...]): Function positional arguments.
+            kwargs (dict[str, Any]): Function keyword arguments.
+            remaining (float | None, optional): Seconds to wait when an enclosing deadline is closer than the timeout,
+            the TimeoutError still reports the timeout seconds. Defaults to None, waiting the timeout seconds.
+
+        Raises:
+            TimeoutError: If the function execution exceeds the timeout.
+            RuntimeError: If the worker process dies while executing the function.
+            Exception: If the function raises an exception.
+
+        Returns:
+            Any: The result of the function.
+        """
+        wait = seconds if remaining is None else remaining
+        deadline = monotonic() + wait
+        call = pickle.dumps((reference, args, kwargs), protocol=5)
+        if not self.__slots.acquire(timeout=wait):
+            raise TimeoutError(f'Function {function.__name__} exceeded the {seconds} seconds timeout.')
+
+        try:
+            worker = self.__acquire()
+
+        except BaseException:
+            self.__slots.release()
+            raise
+
+        try:
+            worker.connection.send_bytes(call)
+            finished = worker.connection.poll(max(0, deadline - monotonic()))
+            message = worker.connection.recv_bytes() if finished else b''
+
+        except (EOFError, OSError):
+            self.__replace(worker=worker)
+            raise RuntimeError(f'Worker process died while executing function {function.__name__}.') from None
+
+        if not finished:
+            self.__replace(worker=worker)
+            raise TimeoutError(f'Function {function.__name__} exceeded the {seconds} seconds timeout.')
+
+        self.__release(worker=worker)
+
+        status, value = load_result(message=message)
+        if status == 'raise':
+            raise value
+
+        return value
+
+    def __acquire(self) -> ProcessWorker:
+        """
+        Returns an idle worker or starts a new one, a slot must be already acquired.
+
+        Returns:
+            ProcessWorker: The worker to use.
+        """
+        with self.__lock:
+            while self.__idle:
+                worker = self.__idle.pop()
+                if worker.is_alive():
+                    return worker
+
+                worker.terminate()
+
+        return ProcessWorker(context=self.__context)
+
+    def __release(self, worker: ProcessWorker) -> None:
+        """
+        Returns a worker to the idle list and frees its slot.
+
+        Args:
+            worker (ProcessWorker): The worker to release.
+        """
+        with self.__lock:
+            self.__idle.append(worker)
+
+        self.__slots.release()
+
+    def __replace(self, worker: ProcessWorker) -> None:
+        """
+        Terminates a worker, starts a warm replacement and frees its slot. If the replacement can not be started the
+        slot is freed anyway and a worker is started on demand by a later call.
+
+        Args:
+            worker (ProcessWorker): The worker to replace.
+        """
+        worker.terminate()
+        try:
+            replacement = ProcessWorker(context=self.__context)
+
+        except Exception:
+            self.__slots.release()
+            return
+
+        self.__release(worker=replacement)
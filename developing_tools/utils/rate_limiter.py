@@ -0,0 +1,214 @@
+"""
+This module contains the rate limiters used by the ratelimit decorator and the registry that shares them by key.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Hashable
+from threading import Lock
+from time import monotonic
+
+from developing_tools.utils.override import override
+
+
+class RateLimitExceededError(Exception):
+    """
+    Raised by a function decorated with ratelimit when the limit is reached and it does not block.
+    """
+
+    __retry_after: float
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """
+        Initializes the RateLimitExceededError.
+
+        Args:
+            message (str): The error message.
+            retry_after (float): Seconds until a call may be allowed.
+        """
+        super().__init__(message)
+        self.__retry_after = retry_after
+
+    @property
+    def retry_after(self) -> float:
+        """
+        Returns the number of seconds until a call may be allowed.
+
+        Returns:
+            float: The number of seconds.
+        """
+        return self.__retry_after
+
+
+class RateLimiter(ABC):
+    """
+    Base class of the thread-safe rate limiters.
+    """
+
+    @abstractmethod
+    def try_acquire(self) -> float:
+        """
+        Acquires a call if the limit allows it, never waits.
+
+        Returns:
+            float: 0 if the call was acquired, otherwise the number of seconds until a call may be allowed.
+        """
+
+
+class TokenBucket(RateLimiter):
+    """
+    Token bucket limiter, the bucket is refilled at a constant rate up to its capacity and each call takes a token, so
+    bursts of up to capacity calls are allowed while the long-run rate is kept.
+    """
+
+    __rate: float
+    __capacity: float
+    __tokens: float
+    __updated_at: float
+    __lock: Lock
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initializes the TokenBucket, the bucket starts full.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens, the largest burst.
+
+        Raises:
+            TypeError: If the rate is not a number.
+            ValueError: If the rate is not greater than 0.
+            TypeError: If the capacity is not a number.
+            ValueError: If the capacity is less than 1.
+        """
+        if type(rate) not in [int, float]:
+            raise TypeError(f'rate must be a number. Got {type(rate).__name__} instead.')
+
+        if rate <= 0:
+            raise ValueError(f'rate must be greater than 0. Got {rate} instead.')
+
+        if type(capacity) not in [int, float]:
+            raise TypeError(f'capacity must be a number. Got {type(capacity).__name__} instead.')
+
+        if capacity < 1:
+            raise ValueError(f'capacity must be greater than or equal to 1. Got {capacity} instead.')
+
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__updated_at = monotonic()
+        self.__lock = Lock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Returns the number of available tokens, as of the last call.
+
+        Returns:
+            float: The number of available tokens.
+        """
+        return self.__tokens
+
+    @override
+    def try_acquire(self) -> float:
+        """
+        Takes a token if there is one available, never waits.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the number of seconds until one is available.
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__rate)
+            self.__updated_at = now
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return 0.0
+
+            return (1 - self.__tokens) / self.__rate
+
+
+class SlidingWindow(RateLimiter):
+    """
+    Sliding window limiter, at most limit calls are allowed in any period of the given number of seconds. The time of
+    each allowed call is kept, so there are no bursts at window boundaries.
+    """
+
+    __limit: int
+    __period: float
+    __calls: deque[float]
+    __lock: Lock
+
+    def __init__(self, limit: int, period: float) -> None:
+        """
+        Initializes the SlidingWindow.
+
+        Args:
+            limit (int): Maximum number of calls in a window.
+            period (float): Length of the window in seconds.
+
+        Raises:
+            TypeError: If the limit is not an integer.
+            ValueError: If the limit is less than 1.
+            TypeError: If the period is not a number.
+            ValueError: If the period is not greater than 0.
+        """
+        if type(limit) is not int:
+            raise TypeError(f'limit must be an integer. Got {type(limit).__name__} instead.')
+
+        if limit < 1:
+            raise ValueError(f'limit must be greater than 0. Got {limit} instead.')
+
+        if type(period) not in [int, float]:
+            raise TypeError(f'period must be a number. Got {type(period).__name__} instead.')
+
+        if period <= 0:
+            raise ValueError(f'period must be greater than 0. Got {period} instead.')
+
+        self.__limit = limit
+        self.__period = period
+        self.__calls = deque()
+        self.__lock = Lock()
+
+    @override
+    def try_acquire(self) -> float:
+        """
+        Acquires a call if fewer than limit calls were allowed in the last period, never waits.
+
+        Returns:
+            float: 0 if the call was acquired, otherwise the number of seconds until the oldest call leaves the window.
+        """
+        with self.__lock:
+            now = monotonic()
+            while self.__calls and self.__calls[0] + self.__period <= now:
+                self.__calls.popleft()
+
+            if len(self.__calls) < self.__limit:
+                self.__calls.append(now)
+                return 0.0
+
+            return self.__calls[0] + self.__period - now
+
+
+_limiters: dict[Hashable, RateLimiter] = {}
+_limiters_lock = Lock()
+
+
+def shared_limiter(key: Hashable, factory: Callable[[], RateLimiter]) -> RateLimiter:
+    """
+    Returns the limiter registered with the given key, creating it with the factory if it does not exist. Functions
+    that use the same key share the limiter, the first one to be decorated configures it.
+
+    Args:
+        key (Hashable): The limiter key.
+        factory (Callable[[], RateLimiter]): Function that creates the limiter.
+
+    Returns:
+        RateLimiter: The limiter registered with the given key.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = factory()
+
+        return limiter
@@ -0,0 +1,83 @@
+"""
+This module contains the RetryBudget class, a token bucket that limits the retries of the retryit decorator to a
+fraction of the total calls.
+"""
+
+from threading import Lock
+
+
+class RetryBudget:
+    """
+    Thread-safe token bucket shared by the functions decorated with retryit. Every call deposits a fraction of a token
+    and every retry withdraws a whole token, so retries are limited to that fraction of the total calls. When a
+    dependency degrades the budget is exhausted and retries stop instead of multiplying the load.
+    """
+
+    __ratio: float
+    __capacity: float
+    __tokens: float
+    __lock: Lock
+
+    def __init__(self, ratio: float = 0.1, capacity: float = 10) -> None:
+        """
+        Initializes the RetryBudget, the bucket starts full.
+
+        Args:
+            ratio (float, optional): Tokens deposited by each call, the maximum fraction of calls that can be retried
+            in the long run. Defaults to 0.1.
+            capacity (float, optional): Maximum number of tokens, the number of retries allowed in a burst. Defaults
+            to 10.
+
+        Raises:
+            TypeError: If the ratio is not a number.
+            ValueError: If the ratio is not between 0 and 1.
+            TypeError: If the capacity is not a number.
+            ValueError: If the capacity is less than 1.
+        """
+        if type(ratio) not in [int, float]:
+            raise TypeError(f'ratio must be a number. Got {type(ratio).__name__} instead.')
+
+        if not 0 <= ratio <= 1:
+            raise ValueError(f'ratio must be between 0 and 1. Got {ratio} instead.')
+
+        if type(capacity) not in [int, float]:
+            raise TypeError(f'capacity must be a number. Got {type(capacity).__name__} instead.')
+
+        if capacity < 1:
+            raise ValueError(f'capacity must be greater than or equal to 1. Got {capacity} instead.')
+
+        self.__ratio = ratio
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__lock = Lock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Returns the number of available tokens.
+
+        Returns:
+            float: The number of available tokens.
+        """
+        return self.__tokens
+
+    def deposit(self) -> None:
+        """
+        Deposits the tokens earned by a call.
+        """
+        with self.__lock:
+            self.__tokens = min(self.__capacity, self.__tokens + self.__ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Withdraws the token needed by a retry.
+
+        Returns:
+            bool: True if the retry is allowed, False if the budget is exhausted.
+        """
+        with self.__lock:
+            if self.__tokens < 1:
+                return False
+
+            self.__tokens -= 1
+            return True
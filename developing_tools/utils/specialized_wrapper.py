@@ -0,0 +1,139 @@
+"""
+This module contains the factory of the wrappers of the decorators. The wrapper is generated once at decoration time
+with the same signature as the decorated function, so calls do not pack the arguments into a tuple and a dict and unpack
+them again.
+"""
+
+from collections.abc import Callable, Collection
+from functools import wraps
+from inspect import Parameter, Signature, signature
+from textwrap import indent
+from typing import Any
+
+MISSING = object()  # default of the tracked parameters, tells the wrapper body whether they were passed
+
+
+def wrapper_signature(function: Callable[..., Any]) -> Signature | None:
+    """
+    Returns the signature the specialized wrappers of the function have.
+
+    Args:
+        function (Callable[..., Any]): The decorated function.
+
+    Returns:
+        Signature | None: The signature of the function, None if it can not be inspected or it has variable arguments,
+        in which case the wrappers receive *args and **kwargs.
+    """
+    try:
+        function_signature = signature(function, follow_wrapped=False)
+
+    except (TypeError, ValueError):
+        return None
+
+    for parameter in function_signature.parameters.values():
+        if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            return None
+
+    return function_signature
+
+
+def body_names(body: str, reads: Collection[str], asynchronous: bool) -> set[str]:
+    """
+    Returns the names a parameter of the wrapper must not shadow, the local variables of its body and the globals and
+    attributes it loads, except for the parameters it reads.
+
+    Args:
+        body (str): Source of the body of the wrapper.
+        reads (Collection[str]): Names of the parameters the body reads.
+        asynchronous (bool): Whether the body belongs to a coroutine function.
+
+    Returns:
+        set[str]: The names used by the body.
+    """
+    definition = 'async def' if asynchronous else 'def'
+    code = compile(f'{definition} probe():\n{indent(body.replace("{call}", "function()"), "    ")}', '<probe>', 'exec')
+    probe = next(constant for constant in code.co_consts if hasattr(constant, 'co_varnames'))
+    return {*probe.co_varnames, *probe.co_freevars, *(name for name in probe.co_names if name not in reads)}
+
+
+def specialized_wrapper(
+    function: Callable[..., Any],
+    body: str,
+    namespace: dict[str, Any],
+    tracked: Collection[str] = (),
+    generic_body: str | None = None,
+    asynchronous: bool = False,
+    reads: Collection[str] = (),
+) -> Callable[..., Any]:
+    """
+    Generates a wrapper of the function that runs the given body, the source of a function body where {call} is
+    replaced with the call to the function with the received arguments and the names of the namespace are globals.
+
+    The wrapper has the signature of the function, so it receives the arguments in its own frame without packing them,
+    unless the signature can not be reproduced or a parameter shadows a name used by the body, then it receives *args
+    and **kwargs. The tracked parameters that have a default default to MISSING instead, so the body can tell whether
+    they were passed, the function receives their actual default. The body may only read the tracked parameters and the
+    ones given in reads.
+
+    Args:
+        function (Callable[..., Any]): The decorated function.
+        body (str): Source of the body of the wrapper.
+        namespace (dict[str, Any]): Globals of the wrapper, besides function and MISSING.
+        tracked (Collection[str], optional): Names of the parameters whose default is MISSING. Defaults to ().
+        generic_body (str | None, optional): Source of the body of the wrapper when it receives *args and **kwargs, if
+        None the body is used. Defaults to None.
+        asynchronous (bool, optional): Whether the wrapper is a coroutine function, so the body can await the call.
+        Defaults to False.
+        reads (Collection[str], optional): Names of the other parameters the body reads. Defaults to ().
+
+    Returns:
+        Callable[..., Any]: The wrapper, with the metadata of the function.
+    """
+    namespace = {**namespace, 'function': function, 'MISSING': MISSING}
+    function_signature = wrapper_signature(function=function)
+
+    parameters: list[str] = []
+    arguments: list[str] = []
+    if function_signature is not None:
+        previous_kind = None
+        for index, (name, parameter) in enumerate(function_signature.parameters.items()):
+            if previous_kind is Parameter.POSITIONAL_ONLY and parameter.kind is not Parameter.POSITIONAL_ONLY:
+                parameters.append('/')
+
+            if parameter.kind is Parameter.KEYWORD_ONLY and previous_kind is not Parameter.KEYWORD_ONLY:
+                parameters.append('*')
+
+            previous_kind = parameter.kind
+            argument = name
+            if parameter.default is Parameter.empty:
+                parameters.append(name)
+
+            elif name in tracked:
+                namespace[f'_default_{index}'] = parameter.default
+                parameters.append(f'{name}=MISSING')
+                argument = f'({name} if {name} is not MISSING else _default_{index})'
+
+            else:
+                namespace[f'_default_{index}'] = parameter.default
+                parameters.append(f'{name}=_default_{index}')
+
+            arguments.append(f'{name}={argument}' if parameter.kind is Parameter.KEYWORD_ONLY else argument)
+
+        if previous_kind is Parameter.POSITIONAL_ONLY:
+            parameters.append('/')
+
+        shadowed = body_names(body=body, reads={*tracked, *reads}, asynchronous=asynchronous) | set(namespace)
+        if set(function_signature.parameters) & shadowed:
+            function_signature = None
+
+    if function_signature is None:
+        parameters = ['*args', '**kwargs']
+        arguments = ['*args', '**kwargs']
+        body = body if generic_body is None else generic_body
+
+    call = f'function({", ".join(arguments)})'
+    definition = 'async def' if asynchronous else 'def'
+    source = f'{definition} wrapper({", ".join(parameters)}):\n{indent(body.replace("{call}", call), "    ")}'
+    exec(compile(source, f'<wrapper of {function.__qualname__}>', 'exec'), namespace)  # noqa: S102  # nosec: B102
+
+    return wraps(wrapped=function)(namespace['wrapper'])
@@ -0,0 +1,159 @@
+"""
+This module contains the TimingNode class, a node of the call tree built by nested ExecutionTimeBlock context managers.
+"""
+
+from typing import Self
+
+ROOT_TITLE = '<root>'
+UNTITLED_TITLE = '<untitled>'
+
+
+class TimingNode:
+    """
+    A node of a timing call tree. Blocks with the same title under the same parent share a node, so repeated identical
+    paths are aggregated into a single node with a call count.
+    """
+
+    __title: str
+    __count: int
+    __inclusive_time: float
+    __children: dict[str, Self]
+
+    def __init__(self, title: str) -> None:
+        """
+        Initializes an empty TimingNode.
+
+        Args:
+            title (str): Title of the timed code block.
+        """
+        self.__title = title
+        self.__count = 0
+        self.__inclusive_time = 0.0
+        self.__children = {}
+
+    def child(self, title: str | None) -> Self:
+        """
+        Returns the child node with the given title, creating it if it does not exist.
+
+        Args:
+            title (str | None): Title of the timed code block, untitled blocks share the '<untitled>' node.
+
+        Returns:
+            TimingNode: The child node.
+        """
+        title = UNTITLED_TITLE if title is None else title
+        node = self.__children.get(title)
+        if node is None:
+            node = self.__children[title] = type(self)(title=title)
+
+        return node
+
+    def add(self, execution_time: float) -> None:
+        """
+        Adds an execution of the code block to the node.
+
+        Args:
+            execution_time (float): Execution time of the code block in seconds.
+        """
+        self.__count += 1
+        self.__inclusive_time += execution_time
+
+    @property
+    def title(self) -> str:
+        """
+        Returns the title of the timed code block.
+
+        Returns:
+            str: The title of the timed code block.
+        """
+        return self.__title
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of times the code block was executed.
+
+        Returns:
+            int: The number of times the code block was executed.
+        """
+        return self.__count
+
+    @property
+    def children(self) -> tuple[Self, ...]:
+        """
+        Returns the child nodes in the order they were first executed.
+
+        Returns:
+            tuple[TimingNode, ...]: The child nodes.
+        """
+        return tuple(self.__children.values())
+
+    @property
+    def inclusive_time(self) -> float:
+        """
+        Returns the total time spent in the code block, including its nested blocks. For the root node it is the time
+        of all its children.
+
+        Returns:
+            float: The inclusive time in seconds.
+        """
+        if self.__title == ROOT_TITLE:
+            return sum(child.inclusive_time for child in self.__children.values())
+
+        return self.__inclusive_time
+
+    @property
+    def exclusive_time(self) -> float:
+        """
+        Returns the time spent in the code block itself, excluding its nested blocks.
+
+        Returns:
+            float: The exclusive time in seconds.
+        """
+        return max(self.inclusive_time - sum(child.inclusive_time for child in self.__children.values()), 0.0)
+
+    def report(self, output_decimals: int = 6) -> str:
+        """
+        Returns a table with the inclusive and exclusive time of the node and all its descendants, with their
+        percentage of the node inclusive time.
+
+        Args:
+            output_decimals (int, optional): Number of decimal places of the reported times. Defaults to 6.
+
+        Raises:
+            TypeError: If the output_decimals argument is not an integer.
+            ValueError: If the output_decimals argument is a negative integer.
+
+        Returns:
+            str: The report table.
+        """
+        if type(output_decimals) is not int:
+            raise TypeError(f'output_decimals must be an integer, got {type(output_decimals).__name__} instead.')
+
+        if output_decimals < 0:
+            raise ValueError(f'output_decimals must be a non-negative integer, got {output_decimals} instead.')
+
+        total_time = self.inclusive_time
+        rows = [('Title', 'Calls', 'Inclusive (s)', 'Inclusive %', 'Exclusive (s)', 'Exclusive %')]
+        stack = [(self, 0)] if self.__title != ROOT_TITLE else [(child, 0) for child in reversed(self.children)]
+        while stack:
+            node, depth = stack.pop()
+            inclusive_percentage = 100 * node.inclusive_time / total_time if total_time else 0
+            exclusive_percentage = 100 * node.exclusive_time / total_time if total_time else 0
+            rows.append((
+                f'{"  " * depth}{node.title}',
+                str(node.count),
+                f'{node.inclusive_time:.{output_decimals}f}',
+                f'{inclusive_percentage:.2f}%',
+                f'{node.exclusive_time:.{output_decimals}f}',
+                f'{exclusive_percentage:.2f}%',
+            ))  # fmt: skip
+            stack.extend((child, depth + 1) for child in reversed(node.children))
+
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        lines = []
+        for title, *values in rows:
+            cells = [title.ljust(widths[0])] + [value.rjust(width) for value, width in zip(values, widths[1:], strict=True)]  # fmt: skip  # noqa: E501
+            lines.append('  '.join(cells))
+
+        return '\n'.join(lines)
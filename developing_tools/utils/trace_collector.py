@@ -0,0 +1,241 @@
+"""
+This module contains the TraceCollector class, that records the calls timed by execution_time and the blocks timed by
+ExecutionTimeBlock as a timeline in the Chrome trace event format, which can be opened with Perfetto or
+chrome://tracing.
+"""
+
+from os import getpid
+from threading import current_thread, get_ident
+from time import perf_counter_ns
+from types import TracebackType
+from typing import Any, Self
+
+TRACE_MAX_EVENTS = 1_000_000
+
+_collector: 'TraceCollector | None' = None
+
+
+def active_collector() -> 'TraceCollector | None':
+    """
+    Returns the collector that is recording, if any.
+
+    Returns:
+        TraceCollector | None: The active collector, None if no collector is recording.
+    """
+    return _collector
+
+
+class TraceCollector:
+    """
+    In-memory recorder of trace events. While it is active, every call timed by execution_time and every block timed by
+    ExecutionTimeBlock is recorded with its thread, so nesting, overlap and waits between threads can be seen. Events
+    are appended to a list and only converted and written to disk by write, so recording stays cheap. Once max_events
+    are recorded new events are dropped and counted.
+
+    Only one collector is active at a time, use it as a context manager or call start and stop.
+    """
+
+    __max_events: int
+    __events: list[tuple[str, str, int, int, int, dict[str, Any] | None]]
+    __thread_names: dict[int, str]
+    __dropped: int
+    __origin: int
+
+    def __init__(self, max_events: int = TRACE_MAX_EVENTS) -> None:
+        """
+        Initializes an empty TraceCollector.
+
+        Args:
+            max_events (int, optional): Maximum number of events kept in memory. Defaults to TRACE_MAX_EVENTS.
+
+        Raises:
+            TypeError: If max_events is not an integer.
+            ValueError: If max_events is less than 1.
+        """
+        if type(max_events) is not int:
+            raise TypeError(f'max_events must be an integer, got {type(max_events).__name__} instead.')
+
+        if max_events < 1:
+            raise ValueError(f'max_events must be greater than 0, got {max_events} instead.')
+
+        self.__max_events = max_events
+        self.__events = []
+        self.__thread_names = {}
+        self.__dropped = 0
+        self.__origin = perf_counter_ns()
+
+    def __enter__(self) -> Self:
+        """
+        Starts recording.
+
+        Returns:
+            Self: Returns itself to be used in the 'with' statement.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: TracebackType | None) -> None:
+        """
+        Stops recording.
+
+        Args:
+            exc_type (type | None): The type of the exception that caused the context to be exited. None if the context
+            was exited without an exception.
+            exc_val (Exception | None): The exception that caused the context to be exited. None if the context was
+            exited without an exception.
+            exc_tb (TracebackType | None): The traceback object for the exception. None if the context was exited
+            without an exception.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Makes this collector the active one.
+
+        Raises:
+            RuntimeError: If another collector is already active.
+        """
+        global _collector
+
+        if _collector is not None and _collector is not self:
+            raise RuntimeError('Another TraceCollector is already active.')
+
+        _collector = self
+
+    def stop(self) -> None:
+        """
+        Stops recording, the recorded events are kept.
+        """
+        global _collector
+
+        if _collector is self:
+            _collector = None
+
+    def __record(self, phase: str, name: str, timestamp: int, duration: int, args: dict[str, Any] | None) -> None:
+        """
+        Appends an event to the buffer.
+
+        Args:
+            phase (str): Trace event phase, 'B' for begin, 'E' for end and 'X' for complete events.
+            name (str): Name of the event.
+            timestamp (int): perf_counter_ns value of the event.
+            duration (int): Duration in nanoseconds of complete events, 0 otherwise.
+            args (dict[str, Any] | None): Custom arguments shown with the event.
+        """
+        if len(self.__events) >= self.__max_events:
+            self.__dropped += 1
+            return
+
+        thread = get_ident()
+        if thread not in self.__thread_names:
+            self.__thread_names[thread] = current_thread().name
+
+        self.__events.append((phase, name, timestamp, duration, thread, args))
+
+    def begin(self, name: str, args: dict[str, Any] | None = None) -> None:
+        """
+        Records the beginning of a slice in the current thread.
+
+        Args:
+            name (str): Name of the slice.
+            args (dict[str, Any] | None, optional): Custom arguments shown with the slice. Defaults to None.
+        """
+        self.__record(phase='B', name=name, timestamp=perf_counter_ns(), duration=0, args=args)
+
+    def end(self, name: str, args: dict[str, Any] | None = None) -> None:
+        """
+        Records the end of the last slice begun in the current thread.
+
+        Args:
+            name (str): Name of the slice.
+            args (dict[str, Any] | None, optional): Custom arguments merged into the slice arguments. Defaults to None.
+        """
+        self.__record(phase='E', name=name, timestamp=perf_counter_ns(), duration=0, args=args)
+
+    def complete(self, name: str, start_time: int, args: dict[str, Any] | None = None) -> None:
+        """
+        Records a slice that started at the given time and ends now. Used for coroutines, whose slices can interleave
+        in the same thread.
+
+        Args:
+            name (str): Name of the slice.
+            start_time (int): perf_counter_ns value when the slice started.
+            args (dict[str, Any] | None, optional): Custom arguments shown with the slice. Defaults to None.
+        """
+        self.__record(phase='X', name=name, timestamp=start_time, duration=perf_counter_ns() - start_time, args=args)
+
+    @property
+    def events(self) -> int:
+        """
+        Returns the number of recorded events.
+
+        Returns:
+            int: The number of recorded events.
+        """
+        return len(self.__events)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns the number of events dropped because the buffer was full.
+
+        Returns:
+            int: The number of dropped events.
+        """
+        return self.__dropped
+
+    def trace(self) -> dict[str, Any]:
+        """
+        Returns the recorded events in the Chrome trace event format.
+
+        Returns:
+            dict[str, Any]: The trace, ready to be serialized as JSON.
+        """
+        pid = getpid()
+        events: list[dict[str, Any]] = [
+            {'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': thread, 'args': {'name': name}}
+            for thread, name in self.__thread_names.items()
+        ]
+        for phase, name, timestamp, duration, thread, args in self.__events:
+            event = {'ph': phase, 'name': name, 'cat': 'developing_tools', 'ts': (timestamp - self.__origin) / 1e3, 'pid': pid, 'tid': thread}  # fmt: skip  # noqa: E501
+            if phase == 'X':
+                event['dur'] = duration / 1e3
+
+            if args:
+                event['args'] = args
+
+            events.append(event)
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'dropped_events': self.__dropped}}
+
+    def write(self, path: str, compress: bool | None = None) -> None:
+        """
+        Writes the recorded events to a JSON file in the Chrome trace event format.
+
+        Args:
+            path (str): Path of the file.
+            compress (bool | None, optional): Whether to gzip the file, if None it is compressed when the path ends with
+            '.gz'. Defaults to None.
+        """
+        import json
+
+        if compress is None:
+            compress = path.endswith('.gz')
+
+        if compress:
+            import gzip
+
+            with gzip.open(path, mode='wt', encoding='utf-8') as file:
+                json.dump(self.trace(), file, default=repr)
+
+            return
+
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(self.trace(), file, default=repr)
+
+    def clear(self) -> None:
+        """
+        Discards the recorded events.
+        """
+        self.__events = []
+        self.__dropped = 0
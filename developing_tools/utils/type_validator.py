@@ -0,0 +1,326 @@
+"""
+This module compiles type annotations into validator functions for the typecheck decorator. Each annotation is compiled
+once into a function that only does the checks it needs and validators are cached by annotation.
+"""
+
+from collections.abc import Callable, Collection, Hashable, Iterable, Mapping, Sequence
+from itertools import islice
+from threading import Lock
+from types import NoneType, UnionType
+from typing import Annotated, Any, ForwardRef, Literal, NewType, TypeVar, Union, get_args, get_origin
+
+TYPECHECK_SAMPLE_SIZE = 32
+
+Validator = Callable[[Any], bool]
+
+_validators: dict[Hashable, Validator] = {}
+_validators_lock = Lock()
+
+
+def type_name(annotation: Any) -> str:
+    """
+    Returns the readable name of an annotation, list[int] or int | None included.
+
+    Args:
+        annotation (Any): The annotation.
+
+    Returns:
+        str: The name of the annotation.
+    """
+    if isinstance(annotation, type) and not get_args(annotation):
+        return annotation.__name__
+
+    return repr(annotation).replace('typing.', '')
+
+
+def accept(value: Any) -> bool:
+    """
+    Validator of annotations that accept every value.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: Always True.
+    """
+    return True
+
+
+def sample(value: Collection[Any], sample_size: int | None) -> Iterable[Any]:
+    """
+    Returns the elements of a collection that are validated, every element if the collection has at most sample_size
+    elements, otherwise sample_size elements evenly spaced for sequences and the first sample_size for the others.
+
+    Args:
+        value (Collection[Any]): The collection.
+        sample_size (int | None): Maximum number of elements validated, if None every element is validated.
+
+    Returns:
+        Iterable[Any]: The elements to validate.
+    """
+    length = len(value)
+    if sample_size is None or length <= sample_size:
+        return value
+
+    if isinstance(value, Sequence):
+        step = length // sample_size
+        return (value[index] for index in range(0, step * sample_size, step))
+
+    return islice(value, sample_size)
+
+
+def instance_validator(classes: type | tuple[type, ...]) -> Validator:
+    """
+    Returns the validator of one or several classes, the numeric tower is honoured so int is a float and int and float
+    are complex.
+
+    Args:
+        classes (type | tuple[type, ...]): The classes.
+
+    Returns:
+        Validator: The validator.
+    """
+    classes = classes if isinstance(classes, tuple) else (classes,)
+    if complex in classes:
+        classes = (*classes, float, int)
+
+    elif float in classes:
+        classes = (*classes, int)
+
+    try:
+        isinstance(None, classes)
+
+    except TypeError:  # protocols that are not runtime checkable
+        return accept
+
+    def validator(value: Any) -> bool:
+        return isinstance(value, classes)
+
+    return validator
+
+
+def union_validator(arguments: tuple[Any, ...], sample_size: int | None) -> Validator:
+    """
+    Returns the validator of a union, plain classes are checked with a single isinstance call.
+
+    Args:
+        arguments (tuple[Any, ...]): The members of the union.
+        sample_size (int | None): Maximum number of elements validated of each collection.
+
+    Returns:
+        Validator: The validator.
+    """
+    arguments = tuple(NoneType if argument is None else argument for argument in arguments)
+    classes = tuple(argument for argument in arguments if isinstance(argument, type) and not get_args(argument))
+    others = tuple(compile_validator(annotation=argument, sample_size=sample_size) for argument in arguments if argument not in classes)  # fmt: skip  # noqa: E501
+    if accept in others:
+        return accept
+
+    instance = instance_validator(classes=classes)
+    if not others:
+        return instance
+
+    def validator(value: Any) -> bool:
+        return instance(value) or any(other(value) for other in others)
+
+    return validator
+
+
+def literal_validator(arguments: tuple[Any, ...]) -> Validator:
+    """
+    Returns the validator of a literal, values must be equal and of the same type, so True is not 1.
+
+    Args:
+        arguments (tuple[Any, ...]): The allowed values.
+
+    Returns:
+        Validator: The validator.
+    """
+    allowed = frozenset((type(argument), argument) for argument in arguments)
+
+    def validator(value: Any) -> bool:
+        try:
+            return (type(value), value) in allowed
+
+        except TypeError:  # unhashable values are never literals
+            return False
+
+    return validator
+
+
+def class_validator(argument: Any) -> Validator:
+    """
+    Returns the validator of a type[C] annotation, the value must be C or a subclass of it.
+
+    Args:
+        argument (Any): The argument of the annotation, a class or a union of classes.
+
+    Returns:
+        Validator: The validator.
+    """
+    bases = get_args(argument) if get_origin(argument) in (Union, UnionType) else (argument,)
+    classes = tuple(base for base in bases if isinstance(base, type))
+    if len(classes) != len(bases):
+        return instance_validator(classes=type)
+
+    def validator(value: Any) -> bool:
+        return isinstance(value, type) and issubclass(value, classes)
+
+    return validator
+
+
+def tuple_validator(arguments: tuple[Any, ...], sample_size: int | None) -> Validator:
+    """
+    Returns the validator of a tuple annotation, homogeneous tuple[T, ...] are sampled as the other collections.
+
+    Args:
+        arguments (tuple[Any, ...]): The arguments of the annotation.
+        sample_size (int | None): Maximum number of elements validated.
+
+    Returns:
+        Validator: The validator.
+    """
+    if len(arguments) == 2 and arguments[1] is Ellipsis:
+        return collection_validator(origin=tuple, arguments=arguments[:1], sample_size=sample_size)
+
+    if arguments == ((),):  # tuple[()]
+        arguments = ()
+
+    validators = tuple(compile_validator(annotation=argument, sample_size=sample_size) for argument in arguments)
+
+    def validator(value: Any) -> bool:
+        if not isinstance(value, tuple) or len(value) != len(validators):
+            return False
+
+        return all(check(element) for check, element in zip(validators, value, strict=True))
+
+    return validator
+
+
+def collection_validator(origin: type, arguments: tuple[Any, ...], sample_size: int | None) -> Validator:
+    """
+    Returns the validator of a generic collection, mapping or iterable. Collections and mappings larger than
+    sample_size are validated by sampling, iterables that are not collections, like iterators and generators, are not
+    consumed, only their class is validated.
+
+    Args:
+        origin (type): The class of the generic.
+        arguments (tuple[Any, ...]): The arguments of the generic.
+        sample_size (int | None): Maximum number of elements validated.
+
+    Returns:
+        Validator: The validator.
+    """
+    validators = tuple(compile_validator(annotation=argument, sample_size=sample_size) for argument in arguments)
+    if not validators or all(validator is accept for validator in validators) or not issubclass(origin, Iterable):
+        return instance_validator(classes=origin)
+
+    if issubclass(origin, Mapping):
+        key_validator, value_validator = validators if len(validators) == 2 else (validators[0], accept)
+
+        def mapping_validator(value: Any) -> bool:
+            if not isinstance(value, origin):
+                return False
+
+            return all(key_validator(key) and value_validator(value[key]) for key in sample(value=value.keys(), sample_size=sample_size))  # fmt: skip  # noqa: E501
+
+        return mapping_validator
+
+    element_validator = validators[0]
+
+    def validator(value: Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+
+        if not isinstance(value, Collection):  # iterators and generators are not consumed
+            return True
+
+        return all(map(element_validator, sample(value=value, sample_size=sample_size)))
+
+    return validator
+
+
+def build_validator(annotation: Any, sample_size: int | None) -> Validator:  # noqa: C901
+    """
+    Compiles an annotation into a validator.
+
+    Args:
+        annotation (Any): The annotation.
+        sample_size (int | None): Maximum number of elements validated of each collection.
+
+    Returns:
+        Validator: The validator.
+    """
+    if annotation is Any or annotation is object or isinstance(annotation, str | ForwardRef):
+        return accept
+
+    if annotation is None or annotation is NoneType:
+        return instance_validator(classes=NoneType)
+
+    if isinstance(annotation, TypeVar):
+        if annotation.__constraints__:
+            return union_validator(arguments=annotation.__constraints__, sample_size=sample_size)
+
+        return compile_validator(annotation=annotation.__bound__ or Any, sample_size=sample_size)
+
+    if isinstance(annotation, NewType):
+        return compile_validator(annotation=annotation.__supertype__, sample_size=sample_size)
+
+    origin = get_origin(annotation)
+    arguments = get_args(annotation)
+    if origin is None:
+        return instance_validator(classes=annotation) if isinstance(annotation, type) else accept
+
+    if origin is Annotated:
+        return compile_validator(annotation=arguments[0], sample_size=sample_size)
+
+    if origin is Union or origin is UnionType:
+        return union_validator(arguments=arguments, sample_size=sample_size)
+
+    if origin is Literal:
+        return literal_validator(arguments=arguments)
+
+    if origin is Callable:
+        return callable
+
+    if origin is type:
+        return class_validator(argument=arguments[0] if arguments else Any)
+
+    if origin is tuple:
+        return tuple_validator(arguments=arguments, sample_size=sample_size)
+
+    if isinstance(origin, type):
+        return collection_validator(origin=origin, arguments=arguments, sample_size=sample_size)
+
+    return accept
+
+
+def compile_validator(annotation: Any, sample_size: int | None = TYPECHECK_SAMPLE_SIZE) -> Validator:
+    """
+    Returns the validator of an annotation, compiling it the first time. The validator returns whether a value
+    matches the annotation.
+
+    Plain classes, None, Any, unions, Optional, Literal, Annotated, NewType, TypeVar, type[C], Callable, tuples and
+    generic collections, mappings and iterables are supported, other annotations accept every value.
+
+    Args:
+        annotation (Any): The annotation.
+        sample_size (int | None, optional): Maximum number of elements validated of each collection, if None every
+        element is validated. Defaults to TYPECHECK_SAMPLE_SIZE.
+
+    Returns:
+        Validator: The validator.
+    """
+    key = (annotation, sample_size)
+    try:
+        validator = _validators.get(key)
+
+    except TypeError:  # unhashable annotations are not cached
+        return build_validator(annotation=annotation, sample_size=sample_size)
+
+    if validator is None:
+        validator = build_validator(annotation=annotation, sample_size=sample_size)
+        with _validators_lock:
+            validator = _validators.setdefault(key, validator)
+
+    return validator
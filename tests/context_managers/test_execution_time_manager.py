@@ -3,9 +3,11 @@ Test ExecutionTimeBlock context manager.
 """
 
 from datetime import UTC, datetime
+from threading import Thread
+from time import perf_counter
 
 from freezegun import freeze_time
-from pytest import CaptureFixture, mark, raises as assert_raises
+from pytest import CaptureFixture, approx, mark, raises as assert_raises
 
 from developing_tools.context_managers import ExecutionTimeBlock
 
@@ -184,3 +186,214 @@ def test_execution_time_manager_execution_time_can_not_be_changed() -> None:
 
     with assert_raises(expected_exception=AttributeError):
         context.execution_time = 3.5  # type: ignore
+
+
+def test_execution_time_manager_timing_tree() -> None:
+    """
+    Test that nested ExecutionTimeBlock context managers build an aggregated call tree.
+    """
+    ExecutionTimeBlock.reset_timing_tree()
+
+    request = ExecutionTimeBlock(title='request')
+    for _ in range(3):
+        with request:
+            with ExecutionTimeBlock(title='parse'):
+                pass
+
+            with ExecutionTimeBlock(title='query'):
+                pass
+
+    (request_node,) = ExecutionTimeBlock.timing_tree().children
+    assert request_node.title == 'request'
+    assert request_node.count == 3
+    assert [child.title for child in request_node.children] == ['parse', 'query']
+    assert [child.count for child in request_node.children] == [3, 3]
+    assert request_node.inclusive_time >= request.execution_time
+    assert request_node.exclusive_time == approx(
+        request_node.inclusive_time - sum(child.inclusive_time for child in request_node.children)
+    )
+
+
+def test_execution_time_manager_timing_tree_report() -> None:
+    """
+    Test that the timing tree report contains every node indented by its depth.
+    """
+    ExecutionTimeBlock.reset_timing_tree()
+
+    with ExecutionTimeBlock(title='request'), ExecutionTimeBlock(title='parse'):
+        pass
+
+    lines = ExecutionTimeBlock.timing_tree().report().splitlines()
+    assert lines[0].startswith('Title')
+    assert lines[1].startswith('request ')
+    assert lines[1].split()[3] == '100.00%'
+    assert lines[2].startswith('  parse ')
+
+
+def test_execution_time_manager_timing_tree_per_thread() -> None:
+    """
+    Test that each thread builds its own timing tree.
+    """
+    ExecutionTimeBlock.reset_timing_tree()
+
+    def run() -> None:
+        with ExecutionTimeBlock(title='thread'):
+            pass
+
+    thread = Thread(target=run)
+    thread.start()
+    thread.join()
+
+    assert ExecutionTimeBlock.timing_tree().children == ()
+
+
+@mark.asyncio
+async def test_execution_time_manager_async(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that the ExecutionTimeBlock context manager can be used with 'async with', reporting the CPU time and the
+    longest event loop block.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    from asyncio import sleep
+
+    ExecutionTimeBlock.reset_timing_tree()
+
+    async with ExecutionTimeBlock(title='Async Block', output_decimals=3) as block:
+        await sleep(0.05)
+
+    assert block.execution_time >= 0.05
+    assert block.cpu_time < 0.04
+    assert block.loop_hold_time < 0.04
+    assert [(node.title, node.count) for node in ExecutionTimeBlock.timing_tree().children] == [('Async Block', 1)]
+    assert capsys.readouterr().out.startswith('Code block with title "Async Block" took 0.05')
+
+    async with ExecutionTimeBlock() as block:
+        end = perf_counter() + 0.05
+        while perf_counter() < end:
+            pass
+
+    assert block.loop_hold_time >= 0.04
+    assert block.cpu_time >= 0.04
+    assert 'blocked the event loop for at most' in capsys.readouterr().out
+
+
+def test_execution_time_manager_sync_loop_hold_time() -> None:
+    """
+    Test that a sync block reports its CPU time and no event loop block.
+    """
+    with ExecutionTimeBlock() as block:
+        end = perf_counter() + 0.02
+        while perf_counter() < end:
+            pass
+
+    assert block.cpu_time >= 0.01
+    assert block.loop_hold_time == 0.0
+
+
+def test_execution_time_manager_profile_memory(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that the ExecutionTimeBlock context manager measures the allocations and garbage collections of the block
+    when profile_memory is True.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    import gc
+    import tracemalloc
+
+    kept = []
+    with ExecutionTimeBlock(title='Memory', profile_memory=True) as block:
+        kept.append(bytearray(1_000_000))
+        discarded = bytearray(2_000_000)
+        del discarded
+        gc.collect()
+
+    assert block.allocated_memory is not None and 1_000_000 <= block.allocated_memory < 2_000_000
+    assert block.peak_memory is not None and block.peak_memory >= 3_000_000
+    assert block.resident_memory_delta is not None
+    assert block.gc_collections is not None and block.gc_collections[2] >= 1
+    assert block.gc_pause_time is not None and block.gc_pause_time[2] > 0
+    assert not tracemalloc.is_tracing()
+
+    output = capsys.readouterr().out
+    assert '\tMemory: ' in output
+    assert '\tGarbage collector generation 2: ' in output
+
+
+def test_execution_time_manager_profile_memory_reused_block() -> None:
+    """
+    Test that reusing a block reports the garbage collections of its last run only.
+    """
+    import gc
+
+    block = ExecutionTimeBlock(profile_memory=True)
+    with block:
+        for _ in range(3):
+            gc.collect()
+
+    with block:
+        gc.collect()
+
+    assert block.gc_collections is not None and 1 <= block.gc_collections[2] < 3
+    assert block.gc_pause_time is not None and block.gc_pause_time[2] > 0
+
+
+def test_execution_time_manager_profile_memory_overlapping_threads() -> None:
+    """
+    Test that overlapping memory profiles in several threads keep tracing until the last one stops.
+    """
+    import tracemalloc
+    from threading import Event
+
+    started = Event()
+    released = Event()
+    kept = []
+
+    def measure() -> None:
+        """
+        Profiles a block that ends while the main thread block is still measuring.
+        """
+        with ExecutionTimeBlock(profile_memory=True):
+            started.set()
+            released.wait(timeout=5)
+
+    thread = Thread(target=measure)
+    with ExecutionTimeBlock(profile_memory=True) as block:
+        thread.start()
+        started.wait(timeout=5)
+        released.set()
+        thread.join()
+
+        kept.append(bytearray(1_000_000))
+
+    assert block.allocated_memory is not None and 1_000_000 <= block.allocated_memory < 2_000_000
+    assert block.peak_memory is not None and block.peak_memory >= 1_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_execution_time_manager_profile_memory_disabled_by_default(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that the memory is not profiled unless profile_memory is True.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    with ExecutionTimeBlock() as block:
+        pass
+
+    assert block.allocated_memory is None
+    assert block.peak_memory is None
+    assert block.resident_memory_delta is None
+    assert block.gc_collections is None
+    assert block.gc_pause_time is None
+    assert 'Memory' not in capsys.readouterr().out
+
+
+def test_execution_time_manager_invalid_profile_memory_type() -> None:
+    """
+    Test that the ExecutionTimeBlock context manager raises a TypeError when profile_memory is not a boolean.
+    """
+    with assert_raises(TypeError, match='profile_memory must be a boolean, got int instead'):
+        ExecutionTimeBlock(profile_memory=1)  # type: ignore[arg-type]
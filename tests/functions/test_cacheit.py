@@ -0,0 +1,323 @@
+"""
+Test cacheit decorator.
+"""
+
+from asyncio import CancelledError, create_task, gather, sleep as async_sleep
+from threading import Thread
+from time import sleep
+from typing import Any
+
+from freezegun import freeze_time
+from pytest import mark, raises as assert_raises
+
+from developing_tools.functions import cacheit
+
+
+def test_cacheit_returns_cached_result() -> None:
+    """
+    Test that the cacheit decorator executes the function once per arguments.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    def square(number: int) -> int:
+        calls.append(number)
+        return number**2
+
+    assert [square(2), square(2), square(3), square(number=2)] == [4, 4, 9, 4]
+    assert calls == [2, 3, 2]
+
+    statistics = square.cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.size) == (1, 3, 3)
+
+
+def test_cacheit_evicts_least_recently_used() -> None:
+    """
+    Test that the cacheit decorator evicts the least recently used entry when the cache is full.
+    """
+    calls: list[int] = []
+
+    @cacheit(max_size=2)
+    def identity(number: int) -> int:
+        calls.append(number)
+        return number
+
+    identity(1)
+    identity(2)
+    identity(1)
+    identity(3)
+    identity(1)
+    identity(2)
+
+    assert calls == [1, 2, 3, 2]
+    assert identity.cache.statistics().evictions == 2
+
+
+def test_cacheit_default_size_evicts_exact_least_recently_used() -> None:
+    """
+    Test that a cache with the default size evicts the least recently used entry of the whole cache.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    def identity(number: int) -> int:
+        calls.append(number)
+        return number
+
+    for number in (*range(128), 0, 128, 2, 1):
+        identity(number)
+
+    assert calls == [*range(129), 1]
+    assert identity.cache.statistics().evictions == 2
+
+
+def test_cacheit_expires_entries() -> None:
+    """
+    Test that the cacheit decorator executes the function again when the entry time to live elapses.
+    """
+    calls: list[int] = []
+
+    @cacheit(ttl=10)
+    def identity(number: int) -> int:
+        calls.append(number)
+        return number
+
+    with freeze_time('2024-01-01 00:00:00') as frozen_time:
+        identity(1)
+        frozen_time.tick(delta=5)
+        identity(1)
+        frozen_time.tick(delta=6)
+        identity(1)
+
+    assert calls == [1, 1]
+    assert identity.cache.statistics().expirations == 1
+
+
+def test_cacheit_invalidate_and_clear() -> None:
+    """
+    Test that cached entries can be invalidated one by one or cleared.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    def identity(number: int) -> int:
+        calls.append(number)
+        return number
+
+    identity(1)
+    identity(2)
+    assert identity.cache.invalidate(1)
+    assert not identity.cache.invalidate(1)
+
+    identity(1)
+    identity(2)
+    identity.cache.clear()
+    identity(2)
+
+    assert calls == [1, 2, 1, 2]
+
+
+def test_cacheit_custom_key() -> None:
+    """
+    Test that the cacheit decorator uses the custom key function.
+    """
+    calls: list[str] = []
+
+    @cacheit(key=lambda name, **_: name.lower())
+    def greet(name: str, punctuation: str = '!') -> str:
+        calls.append(name)
+        return f'Hello {name}{punctuation}'
+
+    assert greet('World') == greet('WORLD', punctuation='?') == 'Hello World!'
+    assert calls == ['World']
+
+
+def test_cacheit_does_not_cache_exceptions() -> None:
+    """
+    Test that the cacheit decorator executes the function again after it raises an exception.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    def failing_function() -> None:
+        calls.append(1)
+        raise ValueError('This function always fails!')
+
+    for _ in range(2):
+        with assert_raises(expected_exception=ValueError, match='This function always fails!'):
+            failing_function()
+
+    assert len(calls) == 2
+    assert failing_function.cache.statistics().size == 0
+
+
+def test_cacheit_concurrent_calls_execute_once() -> None:
+    """
+    Test that concurrent calls with the same arguments wait for the first one instead of executing the function.
+    """
+    calls: list[int] = []
+    results: list[int] = []
+
+    @cacheit()
+    def slow_function(number: int) -> int:
+        calls.append(number)
+        sleep(0.1)
+        return number
+
+    threads = [Thread(target=lambda: results.append(slow_function(1))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [1] * 8
+
+
+def test_cacheit_recursive_call_with_same_arguments() -> None:
+    """
+    Test that a recursive call with the same arguments as the call in progress executes the function instead of
+    waiting for itself.
+    """
+    calls: list[int] = []
+    results: list[int] = []
+
+    @cacheit()
+    def function(number: int) -> int:
+        calls.append(number)
+        if len(calls) == 1:
+            inner: int = function(number)
+            return inner + 1
+
+        return number
+
+    thread = Thread(target=lambda: results.append(function(1)), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert results == [2]
+    assert function(1) == 2
+    assert calls == [1, 1]
+
+
+@mark.asyncio
+async def test_cacheit_async_recursive_call_with_same_arguments() -> None:
+    """
+    Test that a recursive await with the same arguments as the call in progress awaits the coroutine function instead
+    of waiting for itself.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    async def function(number: int) -> int:
+        calls.append(number)
+        if len(calls) == 1:
+            inner: int = await function(number)
+            return inner + 1
+
+        return number
+
+    assert await function(1) == 2
+    assert await function(1) == 2
+    assert calls == [1, 1]
+
+
+@mark.asyncio
+async def test_cacheit_async() -> None:
+    """
+    Test that the cacheit decorator caches coroutine functions and concurrent awaits execute them once.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    async def slow_coroutine(number: int) -> int:
+        calls.append(number)
+        await async_sleep(0.05)
+        return number
+
+    assert await gather(*(slow_coroutine(1) for _ in range(5))) == [1] * 5
+    assert await slow_coroutine(1) == 1
+    assert calls == [1]
+
+
+@mark.asyncio
+async def test_cacheit_async_cancelled_owner_does_not_cancel_waiters() -> None:
+    """
+    Test that cancelling the call that executes the coroutine function does not cancel the calls waiting for it, one
+    of them executes it instead.
+    """
+    calls: list[int] = []
+
+    @cacheit()
+    async def slow_coroutine(number: int) -> int:
+        calls.append(number)
+        await async_sleep(0.05)
+        return number
+
+    owner = create_task(slow_coroutine(1))
+    await async_sleep(0.01)
+    waiter = create_task(slow_coroutine(1))
+    await async_sleep(0.01)
+    owner.cancel()
+
+    with assert_raises(expected_exception=CancelledError):
+        await owner
+
+    assert await waiter == 1
+    assert await slow_coroutine(1) == 1
+    assert calls == [1, 1]
+
+
+def test_cacheit_interrupted_owner_does_not_interrupt_waiters() -> None:
+    """
+    Test that a BaseException that is not an Exception is raised only in the call that executes the function, the
+    calls waiting for it execute the function again instead.
+    """
+
+    class Interrupted(BaseException):
+        pass
+
+    calls: list[int] = []
+    results: list[int] = []
+
+    @cacheit()
+    def slow_function(number: int) -> int:
+        calls.append(number)
+        sleep(0.05)
+        if len(calls) == 1:
+            raise Interrupted
+
+        return number
+
+    def owner() -> None:
+        with assert_raises(expected_exception=Interrupted):
+            slow_function(1)
+
+    threads = [Thread(target=owner), Thread(target=lambda: results.append(slow_function(1)))]
+    threads[0].start()
+    sleep(0.01)
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1]
+    assert calls == [1, 1]
+
+
+@mark.parametrize(
+    'arguments, expected_exception',
+    [
+        ({'max_size': 1.5}, TypeError),
+        ({'max_size': 0}, ValueError),
+        ({'ttl': '10'}, TypeError),
+        ({'ttl': 0}, ValueError),
+        ({'key': 'name'}, TypeError),
+    ],
+)
+def test_cacheit_invalid_arguments(arguments: dict[str, Any], expected_exception: type[Exception]) -> None:
+    """
+    Test that the cacheit decorator validates its arguments.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        cacheit(**arguments)
@@ -0,0 +1,98 @@
+"""
+Test exclusive_parameters decorator.
+"""
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.functions import exclusive_parameters
+from developing_tools.utils.argument_class import Argument
+
+
+@exclusive_parameters(Argument(compatible=['a', 'b'], incompatible=['c']))
+def function(a: int | None = None, b: int | None = None, c: int | None = None) -> int:
+    """
+    Function guarded by an exclusive parameters rule.
+
+    Args:
+        a (int | None, optional): First parameter. Defaults to None.
+        b (int | None, optional): Second parameter. Defaults to None.
+        c (int | None, optional): Third parameter. Defaults to None.
+
+    Returns:
+        int: The number of provided parameters.
+    """
+    return sum(parameter is not None for parameter in (a, b, c))
+
+
+@mark.parametrize(
+    'args, kwargs',
+    [((), {'a': 1, 'b': 2}), ((), {'c': 3}), ((), {'a': 1, 'c': 3}), ((1,), {'c': 3}), ((), {})],
+)
+def test_exclusive_parameters_valid_arguments(args: tuple[int, ...], kwargs: dict[str, int]) -> None:
+    """
+    Test that the exclusive_parameters decorator calls the function when the rules are respected.
+
+    Args:
+        args (tuple[int, ...]): Positional arguments.
+        kwargs (dict[str, int]): Keyword arguments.
+    """
+    assert function(*args, **kwargs) == len(args) + len(kwargs)
+
+
+@mark.parametrize('args, kwargs', [((), {'a': 1, 'b': 2, 'c': 3}), ((1, 2), {'c': 3}), ((1, 2, 3), {}), ((1,), {'b': 2, 'c': 3})])  # fmt: skip  # noqa: E501
+def test_exclusive_parameters_incompatible_arguments(args: tuple[int, ...], kwargs: dict[str, int]) -> None:
+    """
+    Test that the exclusive_parameters decorator raises a ValueError when incompatible arguments are used together,
+    either positionally or by keyword.
+
+    Args:
+        args (tuple[int, ...]): Positional arguments.
+        kwargs (dict[str, int]): Keyword arguments.
+    """
+    for _ in range(2):  # the second call goes through the validated combinations cache
+        with assert_raises(expected_exception=ValueError, match='Incompatible arguments used together'):
+            function(*args, **kwargs)
+
+
+def test_exclusive_parameters_unknown_parameters() -> None:
+    """
+    Test that the exclusive_parameters decorator raises a ValueError at decoration time when a rule uses parameters
+    that the function does not accept.
+    """
+    with assert_raises(expected_exception=ValueError, match='Parameters not accepted by function'):
+
+        @exclusive_parameters(Argument(compatible=['a'], incompatible=['z']))
+        def invalid_function(a: int) -> int:
+            return a
+
+
+def test_exclusive_parameters_variable_keyword_arguments() -> None:
+    """
+    Test that the exclusive_parameters decorator accepts any rule parameter when the function takes **kwargs.
+    """
+
+    @exclusive_parameters(Argument(compatible=['a'], incompatible=['z']))
+    def keyword_function(**kwargs: int) -> int:
+        return len(kwargs)
+
+    assert keyword_function(a=1) == 1
+    with assert_raises(expected_exception=ValueError, match='Incompatible arguments used together'):
+        keyword_function(a=1, z=2)
+
+
+def test_exclusive_parameters_required_and_default_arguments() -> None:
+    """
+    Test that the exclusive_parameters decorator counts required parameters as always provided and optional ones as
+    provided when they are passed, even with their default value.
+    """
+
+    @exclusive_parameters(Argument(compatible=['a'], incompatible=['b', 'c']))
+    def required_function(a: int, /, b: int | None = None, *, c: int | None = None) -> int:
+        return a
+
+    assert required_function(1) == 1
+    with assert_raises(expected_exception=ValueError, match='Incompatible arguments used together'):
+        required_function(1, None)
+
+    with assert_raises(expected_exception=ValueError, match='Incompatible arguments used together'):
+        required_function(1, c=None)
@@ -0,0 +1,198 @@
+"""
+Test execution_time decorator.
+"""
+
+from typing import Any
+
+from pytest import CaptureFixture, approx, mark, raises as assert_raises
+
+from developing_tools.functions import execution_time
+from developing_tools.utils.latency_registry import LatencyRegistry
+
+
+def test_execution_time_aggregate(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that the aggregate mode records every call into the registry without printing.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+
+    @execution_time(aggregate=True)
+    def function(a: int) -> int:
+        return a
+
+    name = f'{function.__module__}.{function.__qualname__}'
+    LatencyRegistry().histogram(name=name).reset()
+
+    for i in range(10):
+        assert function(i) == i
+
+    out, _ = capsys.readouterr()
+    assert out == ''
+    assert LatencyRegistry().snapshot(name=name)[name].count == 10
+
+    LatencyRegistry().reset(name=name)
+    assert LatencyRegistry().snapshot(name=name)[name].count == 0
+
+
+def test_execution_time_invalid_aggregate_type() -> None:
+    """
+    Test that the execution_time decorator raises a TypeError when the aggregate argument is not a boolean.
+    """
+    with assert_raises(expected_exception=TypeError, match='aggregate must be a boolean, got int instead'):
+        execution_time(aggregate=1)  # type: ignore[arg-type]
+
+
+def test_execution_time_sample_every(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that with sample_every only 1 in every N calls is timed.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+
+    @execution_time(sample_every=3)
+    def function(a: int) -> int:
+        return a
+
+    for i in range(7):
+        assert function(i) == i
+
+    out, _ = capsys.readouterr()
+    assert out.count('took') == 3
+
+
+def test_execution_time_sample_every_aggregate_is_unbiased() -> None:
+    """
+    Test that the aggregated samples are weighted so the count estimates the number of calls.
+    """
+
+    @execution_time(aggregate=True, sample_every=10)
+    def function(a: int) -> int:
+        return a
+
+    name = f'{function.__module__}.{function.__qualname__}'
+    LatencyRegistry().reset(name=name)
+
+    for i in range(1000):
+        function(i)
+
+    statistics = LatencyRegistry().snapshot(name=name)[name]
+    assert statistics.samples == 100
+    assert statistics.count == 1000
+
+
+def test_execution_time_sample_probability_aggregate_is_unbiased() -> None:
+    """
+    Test that the probability-sampled aggregated samples are weighted so the count estimates the number of calls.
+    """
+
+    @execution_time(aggregate=True, sample_probability=0.25)
+    def function(a: int) -> int:
+        return a
+
+    name = f'{function.__module__}.{function.__qualname__}'
+    LatencyRegistry().reset(name=name)
+
+    for i in range(20_000):
+        function(i)
+
+    statistics = LatencyRegistry().snapshot(name=name)[name]
+    assert statistics.samples == approx(5_000, rel=0.1)
+    assert statistics.count == approx(20_000, rel=0.1)
+
+
+@mark.parametrize(
+    'arguments, expected_exception',
+    [
+        ({'sample_every': 1.5}, TypeError),
+        ({'sample_every': 0}, ValueError),
+        ({'sample_probability': '0.5'}, TypeError),
+        ({'sample_probability': 0}, ValueError),
+        ({'sample_probability': 1.5}, ValueError),
+        ({'sample_every': 2, 'sample_probability': 0.5}, ValueError),
+    ],
+)
+def test_execution_time_invalid_sampling(arguments: dict[str, Any], expected_exception: type[Exception]) -> None:
+    """
+    Test that the execution_time decorator validates the sampling arguments.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        execution_time(**arguments)
+
+
+@mark.asyncio
+async def test_execution_time_coroutine_function(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that a coroutine function is timed while it is awaited, reporting its CPU time and event loop hold.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    from asyncio import sleep
+
+    @execution_time(output_decimals=3)
+    async def function(a: int) -> int:
+        await sleep(0.05)
+        return a
+
+    assert await function(1) == 1
+
+    output = capsys.readouterr().out
+    assert output.startswith('Coroutine function "function" took 0.05')
+    assert 'seconds of CPU time and held the event loop for at most 0.0' in output
+
+
+@mark.asyncio
+async def test_execution_time_coroutine_function_aggregate() -> None:
+    """
+    Test that the aggregate mode of a coroutine function records the wall time, CPU time and event loop hold, so a
+    coroutine that sleeps has a low CPU time and one that busy waits holds the event loop.
+    """
+    from asyncio import sleep
+    from time import perf_counter
+
+    @execution_time(aggregate=True)
+    async def function(busy: bool) -> None:
+        if busy:
+            end = perf_counter() + 0.05
+            while perf_counter() < end:
+                pass
+
+        await sleep(0.05)
+
+    name = f'{function.__module__}.{function.__qualname__}'
+    for suffix in ('', '[cpu]', '[loop_hold]'):
+        LatencyRegistry().histogram(name=f'{name}{suffix}').reset()
+
+    await function(busy=False)
+    wall = LatencyRegistry().histogram(name=name).snapshot()
+    cpu = LatencyRegistry().histogram(name=f'{name}[cpu]').snapshot()
+    loop_hold = LatencyRegistry().histogram(name=f'{name}[loop_hold]').snapshot()
+    assert wall.count == cpu.count == loop_hold.count == 1
+    assert wall.maximum >= 0.05
+    assert cpu.maximum < 0.04
+    assert loop_hold.maximum < 0.04
+
+    await function(busy=True)
+    assert LatencyRegistry().histogram(name=f'{name}[loop_hold]').snapshot().maximum >= 0.04
+
+
+@mark.asyncio
+async def test_execution_time_coroutine_function_exception() -> None:
+    """
+    Test that the exceptions of a timed coroutine function are propagated and the call is still recorded.
+    """
+
+    @execution_time(aggregate=True)
+    async def function() -> None:
+        raise ValueError('error')
+
+    name = f'{function.__module__}.{function.__qualname__}'
+    LatencyRegistry().histogram(name=name).reset()
+
+    with assert_raises(ValueError, match='error'):
+        await function()
+
+    assert LatencyRegistry().histogram(name=name).snapshot().count == 1
@@ -0,0 +1,257 @@
+"""
+Test hedge decorator.
+"""
+
+from asyncio import CancelledError, sleep as async_sleep
+from threading import Event, Lock
+from time import perf_counter, sleep
+
+from pytest import MonkeyPatch, mark, raises as assert_raises
+
+from developing_tools.functions import hedge
+from developing_tools.utils import hedging
+from developing_tools.utils.hedging import HEDGE_MIN_SAMPLES
+
+
+def test_hedge_returns_first_result() -> None:
+    """
+    Test that a slow call is hedged after the delay and the result of the hedged call is returned.
+    """
+    calls: list[int] = []
+    lock = Lock()
+    release = Event()
+
+    @hedge(delay=0.02, max_extra_load=None)
+    def function() -> int:
+        with lock:
+            calls.append(1)
+            call = len(calls)
+
+        if call == 1:
+            release.wait(timeout=0.5)
+
+        return call
+
+    start = perf_counter()
+    assert function() == 2
+    assert perf_counter() - start < 0.3
+    release.set()  # let the abandoned primary call finish, so it does not keep running into later tests
+
+    statistics = function.hedging.statistics()
+    assert (statistics.calls, statistics.hedges, statistics.wins, statistics.extra_load) == (1, 1, 1, 1)
+
+
+def test_hedge_does_not_hedge_fast_calls() -> None:
+    """
+    Test that calls that finish before the delay are not hedged.
+    """
+
+    @hedge(delay=1)
+    def function(a: int) -> int:
+        return a
+
+    assert [function(i) for i in range(5)] == list(range(5))
+    assert function.hedging.statistics().hedges == 0
+
+
+def test_hedge_caps_hedges_per_call() -> None:
+    """
+    Test that at most max_hedges hedged calls are launched per call.
+    """
+    calls: list[int] = []
+
+    @hedge(delay=0.01, max_hedges=2, max_extra_load=None)
+    def function() -> None:
+        calls.append(1)
+        sleep(0.1)
+
+    function()
+
+    assert len(calls) == 3
+    assert function.hedging.statistics().hedges == 2
+
+
+def test_hedge_respects_max_extra_load() -> None:
+    """
+    Test that calls are not hedged once the ratio of hedged calls to calls reaches max_extra_load.
+    """
+
+    @hedge(delay=0, max_extra_load=0.5)
+    def function() -> None:
+        sleep(0.01)
+
+    for _ in range(6):
+        function()
+
+    statistics = function.hedging.statistics()
+    assert statistics.calls == 6
+    assert statistics.hedges == 3
+    assert statistics.extra_load == 0.5
+
+
+def test_hedge_raises_when_every_call_fails() -> None:
+    """
+    Test that the exception of the first failed call is raised when every call fails.
+    """
+    calls: list[int] = []
+    lock = Lock()
+
+    @hedge(delay=0.01, max_extra_load=None)
+    def function() -> None:
+        with lock:
+            calls.append(1)
+            call = len(calls)
+
+        sleep(0.05 if call == 1 else 0.1)
+        raise ValueError(f'Call {call} failed!')
+
+    with assert_raises(expected_exception=ValueError, match='Call 1 failed!'):
+        function()
+
+    assert len(calls) == 2
+
+
+def test_hedge_derives_delay_from_observed_latency() -> None:
+    """
+    Test that without a fixed delay no call is hedged until enough latencies are observed, then the delay is the
+    observed percentile.
+    """
+
+    @hedge()
+    def function() -> None:
+        sleep(0.01)
+
+    initial_delay = function.hedging.delay
+    for _ in range(HEDGE_MIN_SAMPLES):
+        function()
+
+    delay = function.hedging.delay
+    assert initial_delay is None
+    assert function.hedging.statistics().hedges == 0
+    assert delay is not None and 0.005 < delay < 0.1
+
+
+def test_hedge_derives_delay_from_primary_calls(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the delay is derived from the latency of the primary calls, not from the shorter latency of the calls
+    answered by a hedged call.
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest fixture to patch attributes.
+    """
+    monkeypatch.setattr(hedging, 'HEDGE_MIN_SAMPLES', 1)
+    monkeypatch.setattr(hedging, 'HEDGE_DELAY_REFRESH', 1)
+    invocations: list[int] = []
+    lock = Lock()
+
+    @hedge(percentile=99, max_extra_load=None)
+    def function() -> None:
+        with lock:
+            invocations.append(len(invocations))
+            slow = len(invocations) == 2
+
+        sleep(0.1 if slow else 0.01)
+
+    function()
+    function()
+    sleep(0.15)
+
+    delay = function.hedging.delay
+    assert function.hedging.statistics().wins == 1
+    assert delay is not None and delay > 0.05
+
+
+@mark.asyncio
+async def test_hedge_async_returns_first_result_and_cancels_loser() -> None:
+    """
+    Test that a slow coroutine is hedged and the task that loses is cancelled.
+    """
+    calls: list[int] = []
+    cancelled: list[int] = []
+
+    @hedge(delay=0.02, max_extra_load=None)
+    async def function() -> int:
+        calls.append(1)
+        call = len(calls)
+        try:
+            await async_sleep(0.5 if call == 1 else 0.01)
+
+        except CancelledError:
+            cancelled.append(call)
+            raise
+
+        return call
+
+    start = perf_counter()
+    assert await function() == 2
+    assert perf_counter() - start < 0.3
+
+    await async_sleep(0)
+    assert cancelled == [1]
+    assert function.hedging.statistics().wins == 1
+
+
+@mark.asyncio
+async def test_hedge_async_derives_delay_from_primary_calls(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the delay of a coroutine function is derived from the latency of the primary calls, a primary call
+    cancelled because a hedged call answered first is not recorded.
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest fixture to patch attributes.
+    """
+    monkeypatch.setattr(hedging, 'HEDGE_MIN_SAMPLES', 1)
+    monkeypatch.setattr(hedging, 'HEDGE_DELAY_REFRESH', 1)
+    invocations: list[int] = []
+
+    @hedge(percentile=99, max_extra_load=None)
+    async def function() -> None:
+        invocations.append(len(invocations))
+        await async_sleep({2: 0.2, 3: 0.03}.get(len(invocations), 0.01))
+
+    await function()
+    initial_delay = function.hedging.delay
+    await function()
+
+    delay = function.hedging.delay
+    assert function.hedging.statistics().wins == 1
+    assert initial_delay is not None and delay == initial_delay
+
+
+@mark.asyncio
+async def test_hedge_async_raises_when_every_call_fails() -> None:
+    """
+    Test that the exception of the coroutine is raised when every call fails.
+    """
+
+    @hedge(delay=1)
+    async def function() -> None:
+        raise ValueError('This coroutine always fails!')
+
+    with assert_raises(expected_exception=ValueError, match='This coroutine always fails!'):
+        await function()
+
+
+@mark.parametrize(
+    'arguments, expected_exception',
+    [
+        ({'delay': '1'}, TypeError),
+        ({'delay': -1}, ValueError),
+        ({'percentile': '95'}, TypeError),
+        ({'percentile': 100}, ValueError),
+        ({'max_hedges': 1.0}, TypeError),
+        ({'max_hedges': 0}, ValueError),
+        ({'max_extra_load': '0.1'}, TypeError),
+        ({'max_extra_load': 0}, ValueError),
+    ],
+)
+def test_hedge_invalid_arguments(arguments: dict[str, object], expected_exception: type[Exception]) -> None:
+    """
+    Test that the hedge decorator validates its arguments.
+
+    Args:
+        arguments (dict[str, object]): Arguments to pass to the hedge decorator.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        hedge(**arguments)  # type: ignore[arg-type]
@@ -0,0 +1,111 @@
+"""
+Test print_parameters decorator.
+"""
+
+from typing import Any
+
+from pytest import CaptureFixture, mark, raises as assert_raises
+
+from developing_tools.functions import print_parameters
+
+
+def function(a: int, b: list[int] | None = None) -> int:
+    """
+    Function whose parameters are printed.
+
+    Args:
+        a (int): First parameter.
+        b (list[int] | None, optional): Second parameter. Defaults to None.
+
+    Returns:
+        int: The first parameter.
+    """
+    return a
+
+
+def test_print_parameters_prints_arguments(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that print_parameters prints the positional and keyword arguments and the return value with their types.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    print_parameters(show_types=True)(function)(1, b=[1, 2])
+
+    out, _ = capsys.readouterr()
+    assert out == (
+        'Positional arguments:\n'
+        '\tArgument 1: value "1", type int\n'
+        '\nKeyword arguments:\n'
+        '\tArgument b: value "[1, 2]", supposed type list[int] | None, real type list\n'
+        '\nReturn value:\n'
+        '\t"1", supposed type int, real type int\n'
+    )
+
+
+def test_print_parameters_bounds_large_arguments(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that print_parameters only formats a bounded part of large arguments.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    print_parameters(max_elements=3, include_return=False)(function)(b'\x00' * 10**6, b=list(range(10**6)))
+
+    out, _ = capsys.readouterr()
+    assert '\tArgument 1: value "bytes(len=1000000)"\n' in out
+    assert '\tArgument b: value "[0, 1, 2, ...] (list of 1000000 items)"\n' in out
+
+
+def test_print_parameters_sample_every(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that print_parameters only prints 1 in every sample_every calls.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    decorated = print_parameters(sample_every=3)(function)
+    for i in range(7):
+        assert decorated(i) == i
+
+    out, _ = capsys.readouterr()
+    assert out.count('Positional arguments:') == 3
+    assert out.count('Return value:') == 3
+
+
+def test_print_parameters_max_prints_per_second(capsys: CaptureFixture[str]) -> None:
+    """
+    Test that print_parameters prints at most max_prints_per_second calls per second.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    decorated = print_parameters(max_prints_per_second=2)(function)
+    for i in range(10):
+        assert decorated(i) == i
+
+    out, _ = capsys.readouterr()
+    assert out.count('Positional arguments:') == 2
+
+
+@mark.parametrize(
+    'kwargs, expected_exception',
+    [
+        ({'show_types': 1}, TypeError),
+        ({'max_length': 5}, ValueError),
+        ({'sample_every': 1.5}, TypeError),
+        ({'sample_every': 0}, ValueError),
+        ({'max_prints_per_second': '1'}, TypeError),
+        ({'max_prints_per_second': 0}, ValueError),
+    ],
+)
+def test_print_parameters_invalid_arguments(kwargs: dict[str, Any], expected_exception: type[Exception]) -> None:
+    """
+    Test that print_parameters validates its arguments.
+
+    Args:
+        kwargs (dict[str, Any]): Invalid arguments.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        print_parameters(**kwargs)
@@ -0,0 +1,179 @@
+"""
+Test ratelimit decorator.
+"""
+
+from asyncio import gather, sleep as async_sleep
+from contextlib import suppress
+from threading import Thread
+from time import perf_counter
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.functions import ratelimit, timeout
+from developing_tools.utils.rate_limiter import RateLimitExceededError
+
+
+@mark.parametrize('algorithm', ['token_bucket', 'sliding_window'])
+def test_ratelimit_blocks_until_allowed(algorithm: str) -> None:
+    """
+    Test that the ratelimit decorator waits until a call is allowed.
+
+    Args:
+        algorithm (str): The rate limiting algorithm.
+    """
+
+    @ratelimit(calls=5, period=0.1, algorithm=algorithm)  # type: ignore[arg-type]
+    def function(a: int) -> int:
+        return a
+
+    start = perf_counter()
+    assert [function(i) for i in range(10)] == list(range(10))
+    assert 0.08 <= perf_counter() - start < 0.5
+
+
+@mark.parametrize('algorithm', ['token_bucket', 'sliding_window'])
+def test_ratelimit_fails_fast(algorithm: str) -> None:
+    """
+    Test that the ratelimit decorator raises a RateLimitExceededError when it does not block.
+
+    Args:
+        algorithm (str): The rate limiting algorithm.
+    """
+
+    @ratelimit(calls=2, period=10, algorithm=algorithm, blocking=False)  # type: ignore[arg-type]
+    def function() -> None:
+        pass
+
+    function()
+    function()
+    with assert_raises(expected_exception=RateLimitExceededError, match='exceeded the rate limit of 2 calls per 10 seconds') as exception_info:  # fmt: skip  # noqa: E501
+        function()
+
+    assert 0 < exception_info.value.retry_after <= 10
+
+
+def test_ratelimit_is_thread_safe() -> None:
+    """
+    Test that concurrent threads never exceed the limit.
+    """
+    calls: list[float] = []
+
+    @ratelimit(calls=10, period=10, blocking=False)
+    def function() -> None:
+        calls.append(perf_counter())
+
+    def worker() -> None:
+        for _ in range(10):
+            with suppress(RateLimitExceededError):
+                function()
+
+    threads = [Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 10
+
+
+def test_ratelimit_shares_limiter_by_key() -> None:
+    """
+    Test that functions decorated with the same key share their limiter.
+    """
+
+    @ratelimit(calls=3, period=10, blocking=False, key='test_ratelimit_shares_limiter_by_key')
+    def first() -> None:
+        pass
+
+    @ratelimit(calls=3, period=10, blocking=False, key='test_ratelimit_shares_limiter_by_key')
+    def second() -> None:
+        pass
+
+    first()
+    second()
+    first()
+    with assert_raises(expected_exception=RateLimitExceededError):
+        second()
+
+
+def test_ratelimit_fails_fast_when_wait_exceeds_deadline() -> None:
+    """
+    Test that a call that would wait past the deadline of an enclosing timeout fails fast.
+    """
+
+    @ratelimit(calls=1, period=10)
+    def limited() -> None:
+        pass
+
+    @timeout(seconds=1)
+    def function() -> None:
+        limited()
+        limited()
+
+    start = perf_counter()
+    with assert_raises(expected_exception=RateLimitExceededError, match='before the deadline'):
+        function()
+
+    assert perf_counter() - start < 0.5
+
+
+@mark.asyncio
+async def test_ratelimit_async_does_not_block_event_loop() -> None:
+    """
+    Test that coroutine functions wait for the rate limit without blocking the event loop.
+    """
+    ticks: list[int] = []
+
+    @ratelimit(calls=2, period=0.1)
+    async def function(a: int) -> int:
+        return a
+
+    async def ticker() -> None:
+        for i in range(5):
+            ticks.append(i)
+            await async_sleep(0.01)
+
+    results, _ = await gather(gather(*(function(i) for i in range(4))), ticker())
+
+    assert results == [0, 1, 2, 3]
+    assert ticks == [0, 1, 2, 3, 4]
+
+
+@mark.asyncio
+async def test_ratelimit_async_fails_fast() -> None:
+    """
+    Test that coroutine functions raise a RateLimitExceededError when they do not block.
+    """
+
+    @ratelimit(calls=1, period=10, blocking=False)
+    async def function() -> None:
+        pass
+
+    await function()
+    with assert_raises(expected_exception=RateLimitExceededError):
+        await function()
+
+
+@mark.parametrize(
+    'arguments, expected_exception',
+    [
+        ({'calls': 1.5}, TypeError),
+        ({'calls': 0}, ValueError),
+        ({'period': '1'}, TypeError),
+        ({'period': 0}, ValueError),
+        ({'algorithm': 'leaky_bucket'}, ValueError),
+        ({'blocking': 1}, TypeError),
+        ({'key': []}, TypeError),
+    ],
+)
+def test_ratelimit_invalid_arguments(arguments: dict[str, object], expected_exception: type[Exception]) -> None:
+    """
+    Test that the ratelimit decorator validates its arguments.
+
+    Args:
+        arguments (dict[str, object]): Arguments to pass to the ratelimit decorator.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        ratelimit(**arguments)  # type: ignore[arg-type]
@@ -0,0 +1,205 @@
+"""
+Test retryit decorator.
+"""
+
+from asyncio import gather, sleep
+from time import perf_counter
+from typing_extensions import override
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.functions import retryit
+from developing_tools.utils.backoff import BackoffStrategy
+from developing_tools.utils.deadline import deadline_scope
+from developing_tools.utils.retry_budget import RetryBudget
+
+
+@mark.asyncio
+async def test_retryit_async_retries_until_success() -> None:
+    """
+    Test that the retryit decorator awaits coroutine functions and retries them when they raise an exception.
+    """
+    calls: list[int] = []
+
+    @retryit(attempts=3, delay=0)
+    async def flaky_function() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError('Not yet')
+
+        return 'done'
+
+    assert await flaky_function() == 'done'
+    assert len(calls) == 3
+
+
+@mark.asyncio
+async def test_retryit_async_raises_last_exception() -> None:
+    """
+    Test that the retryit decorator raises the last exception of a coroutine function after all attempts fail.
+    """
+
+    @retryit(attempts=2, delay=0)
+    async def failing_function() -> None:
+        raise ValueError('This function always fails!')
+
+    with assert_raises(expected_exception=ValueError, match='This function always fails!'):
+        await failing_function()
+
+
+@mark.asyncio
+async def test_retryit_async_does_not_raise_exception() -> None:
+    """
+    Test that the retryit decorator returns None for a coroutine function when raise_exception is False.
+    """
+
+    @retryit(attempts=2, delay=0, raise_exception=False)
+    async def failing_function() -> None:
+        raise ValueError('This function always fails!')
+
+    assert await failing_function() is None
+
+
+@mark.asyncio
+async def test_retryit_async_does_not_catch_invalid_exceptions() -> None:
+    """
+    Test that the retryit decorator does not retry a coroutine function when the exception is not a valid exception.
+    """
+    calls: list[int] = []
+
+    @retryit(attempts=3, delay=0, valid_exceptions=(ValueError,))
+    async def failing_function() -> None:
+        calls.append(1)
+        raise KeyError('Invalid')
+
+    with assert_raises(expected_exception=KeyError):
+        await failing_function()
+
+    assert len(calls) == 1
+
+
+@mark.asyncio
+async def test_retryit_async_does_not_block_event_loop() -> None:
+    """
+    Test that the delay between attempts of a coroutine function does not block other coroutines.
+    """
+
+    @retryit(attempts=2, delay=0.2, raise_exception=False)
+    async def failing_function() -> None:
+        raise ValueError('This function always fails!')
+
+    start_time = perf_counter()
+    await gather(*(failing_function() for _ in range(10)), sleep(0))
+
+    assert perf_counter() - start_time < 1
+
+
+def test_retryit_uses_backoff_strategy() -> None:
+    """
+    Test that the retryit decorator asks the backoff strategy for the delay before each retry.
+    """
+    delays: list[tuple[int, float]] = []
+
+    class RecordingBackoff(BackoffStrategy):
+        @override
+        def delay(self, attempt: int, previous_delay: float) -> float:
+            delays.append((attempt, previous_delay))
+            return 0.001 * (attempt + 1)
+
+    @retryit(attempts=3, delay=RecordingBackoff(), raise_exception=False)
+    def failing_function() -> None:
+        raise ValueError('This function always fails!')
+
+    failing_function()
+
+    assert delays == [(0, 0.0), (1, 0.001)]
+
+
+def test_retryit_stops_when_budget_is_exhausted() -> None:
+    """
+    Test that the retryit decorator stops retrying when the shared retry budget has no tokens left.
+    """
+    calls: list[int] = []
+    budget = RetryBudget(ratio=0, capacity=2)
+
+    @retryit(attempts=10, delay=0, budget=budget)
+    def failing_function() -> None:
+        calls.append(1)
+        raise ValueError('This function always fails!')
+
+    with assert_raises(expected_exception=ValueError, match='This function always fails!'):
+        failing_function()
+
+    assert len(calls) == 3
+    assert budget.tokens == 0
+
+
+def test_retryit_budget_is_refilled_by_calls() -> None:
+    """
+    Test that every call to a function decorated with retryit deposits in the retry budget.
+    """
+    budget = RetryBudget(ratio=0.5, capacity=1)
+    budget.withdraw()
+
+    @retryit(attempts=2, delay=0, budget=budget)
+    def successful_function() -> int:
+        return 1
+
+    successful_function()
+    assert budget.tokens == 0.5
+
+    successful_function()
+    successful_function()
+    assert budget.tokens == 1
+
+
+def test_retryit_invalid_budget() -> None:
+    """
+    Test that the retryit decorator raises a TypeError when the budget is not a RetryBudget.
+    """
+    with assert_raises(expected_exception=TypeError, match='budget must be a RetryBudget'):
+        retryit(budget=10)  # type: ignore[arg-type]
+
+
+def test_retryit_stops_when_deadline_is_too_close() -> None:
+    """
+    Test that the retryit decorator does not retry when the remaining time of the deadline can not cover another
+    attempt, and shortens the delay to the remaining time.
+    """
+    calls: list[int] = []
+
+    @retryit(attempts=10, delay=10)
+    def failing_function() -> None:
+        calls.append(1)
+        sleep_until = perf_counter() + 0.05
+        while perf_counter() < sleep_until:
+            pass
+
+        raise ValueError('This function always fails!')
+
+    with deadline_scope(seconds=0.12):
+        start = perf_counter()
+        with assert_raises(expected_exception=ValueError, match='This function always fails!'):
+            failing_function()
+
+    assert len(calls) == 2
+    assert perf_counter() - start < 0.2
+
+
+@mark.asyncio
+async def test_retryit_async_stops_when_deadline_has_expired() -> None:
+    """
+    Test that the retryit decorator does not retry a coroutine function once the deadline has expired.
+    """
+    calls: list[int] = []
+
+    @retryit(attempts=10, delay=0)
+    async def failing_function() -> None:
+        calls.append(1)
+        await sleep(0.02)
+        raise ValueError('This function always fails!')
+
+    with deadline_scope(seconds=0.01), assert_raises(expected_exception=ValueError):
+        await failing_function()
+
+    assert len(calls) == 1
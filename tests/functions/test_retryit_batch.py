@@ -0,0 +1,198 @@
+"""
+Test retryit_batch function.
+"""
+
+from asyncio import sleep as async_sleep
+from threading import Lock
+from time import perf_counter, sleep
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.functions import retryit_batch
+from developing_tools.utils.deadline import deadline_scope
+
+
+def test_retryit_batch_retries_only_failed_items() -> None:
+    """
+    Test that retryit_batch retries only the items that failed and streams every result.
+    """
+    calls: dict[int, int] = {}
+    lock = Lock()
+
+    def function(item: int) -> int:
+        with lock:
+            calls[item] = calls.get(item, 0) + 1
+
+        if item % 3 == 0 and calls[item] < 3:
+            raise ValueError(f'Item {item} failed!')
+
+        return item * 2
+
+    results = list(retryit_batch(function, range(10), attempts=3, delay=0))
+
+    assert sorted(result.index for result in results) == list(range(10))
+    assert all(result.succeeded for result in results)
+    assert {result.item: result.value for result in results} == {item: item * 2 for item in range(10)}
+    assert {result.item: result.attempts for result in results if result.attempts > 1} == {0: 3, 3: 3, 6: 3, 9: 3}
+    assert calls == {item: 3 if item % 3 == 0 else 1 for item in range(10)}
+
+
+def test_retryit_batch_failed_items_do_not_delay_the_batch() -> None:
+    """
+    Test that the items run concurrently and the failed items wait a single delay per round.
+    """
+    failed: set[int] = set()
+
+    def function(item: int) -> int:
+        sleep(0.05)
+        if item < 5 and item not in failed:
+            failed.add(item)
+            raise ValueError('First attempt fails!')
+
+        return item
+
+    start = perf_counter()
+    results = list(retryit_batch(function, range(20), attempts=2, delay=0.05, max_workers=20))
+
+    assert len(results) == 20
+    assert perf_counter() - start < 0.5
+
+
+def test_retryit_batch_streams_results() -> None:
+    """
+    Test that the successful items are yielded before the failed items are retried.
+    """
+    calls: list[int] = []
+
+    def function(item: int) -> int:
+        calls.append(item)
+        if item == 0 and calls.count(0) == 1:
+            raise ValueError('First attempt fails!')
+
+        return item
+
+    results = retryit_batch(function, [0, 1], attempts=2, delay=0, max_workers=1)
+
+    assert next(results).item == 1
+    assert calls.count(0) == 1
+    assert next(results).item == 0
+    assert calls.count(0) == 2
+
+
+def test_retryit_batch_raises_exception_group() -> None:
+    """
+    Test that retryit_batch yields the failed items and raises their exceptions once every result has been streamed.
+    """
+
+    def function(item: int) -> int:
+        if item == 1:
+            raise ValueError('Item 1 always fails!')
+
+        if item == 2:
+            raise TypeError('Item 2 is not valid!')
+
+        return item
+
+    results = []
+    with assert_raises(ExceptionGroup) as exception_info:
+        for result in retryit_batch(function, range(4), attempts=3, delay=0, valid_exceptions=(ValueError,)):
+            results.append(result)
+
+    assert len(results) == 4
+    assert {result.item: result.attempts for result in results if not result.succeeded} == {1: 3, 2: 1}
+    assert sorted(type(exception).__name__ for exception in exception_info.value.exceptions) == ['TypeError', 'ValueError']  # fmt: skip  # noqa: E501
+
+
+def test_retryit_batch_does_not_raise_exception() -> None:
+    """
+    Test that retryit_batch does not raise when raise_exception is False.
+    """
+
+    def function(item: int) -> int:
+        raise ValueError('This function always fails!')
+
+    results = list(retryit_batch(function, range(3), attempts=2, delay=0, raise_exception=False))
+
+    assert [result.succeeded for result in results] == [False] * 3
+    assert all(isinstance(result.exception, ValueError) for result in results)
+
+
+def test_retryit_batch_stops_when_deadline_is_too_close() -> None:
+    """
+    Test that retryit_batch does not start another round when the deadline can not cover it.
+    """
+
+    def function(item: int) -> int:
+        sleep(0.05)
+        raise ValueError('This function always fails!')
+
+    with deadline_scope(seconds=0.08):
+        results = list(retryit_batch(function, range(3), delay=0, raise_exception=False))
+
+    assert [result.attempts for result in results] == [1] * 3
+
+
+@mark.asyncio
+async def test_retryit_batch_async() -> None:
+    """
+    Test that retryit_batch executes coroutine functions concurrently and retries only the failed items.
+    """
+    calls: dict[int, int] = {}
+
+    async def function(item: int) -> int:
+        calls[item] = calls.get(item, 0) + 1
+        await async_sleep(0.05)
+        if item == 0 and calls[item] == 1:
+            raise ValueError('First attempt fails!')
+
+        return item * 2
+
+    start = perf_counter()
+    results = [result async for result in retryit_batch(function, range(10), attempts=2, delay=0)]
+
+    assert perf_counter() - start < 0.3
+    assert {result.item: result.value for result in results} == {item: item * 2 for item in range(10)}
+    assert calls == {item: 2 if item == 0 else 1 for item in range(10)}
+
+
+@mark.asyncio
+async def test_retryit_batch_async_limits_concurrency() -> None:
+    """
+    Test that retryit_batch runs at most max_workers coroutines at the same time.
+    """
+    running = []
+    maximum = []
+
+    async def function(item: int) -> int:
+        running.append(item)
+        maximum.append(len(running))
+        await async_sleep(0.01)
+        running.remove(item)
+        return item
+
+    results = [result async for result in retryit_batch(function, range(10), max_workers=3)]
+
+    assert len(results) == 10
+    assert max(maximum) == 3
+
+
+@mark.parametrize(
+    'arguments, expected_exception',
+    [
+        ({'function': 1}, TypeError),
+        ({'max_workers': 1.5}, TypeError),
+        ({'max_workers': 0}, ValueError),
+        ({'attempts': 0}, ValueError),
+        ({'delay': -1}, ValueError),
+    ],
+)
+def test_retryit_batch_invalid_arguments(arguments: dict[str, object], expected_exception: type[Exception]) -> None:
+    """
+    Test that retryit_batch validates its arguments.
+
+    Args:
+        arguments (dict[str, object]): Arguments to pass to retryit_batch.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        retryit_batch(**{'function': print, 'items': [], **arguments})  # type: ignore[call-overload]
@@ -0,0 +1,356 @@
+"""
+Test timeout decorator.
+"""
+
+import signal
+from sys import platform
+from threading import Event
+from time import perf_counter, sleep
+from typing import Any
+
+from pytest import MonkeyPatch, mark, param, raises as assert_raises
+
+from developing_tools.functions import timeout
+from developing_tools.utils.deadline import deadline_scope, remaining_time
+
+
+@timeout(seconds=5, isolation='process')
+def process_sum(a: int, b: int) -> int:
+    """
+    Sum two numbers in a worker process.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+@timeout(seconds=5, isolation='process')
+def process_failure() -> None:
+    """
+    Raise an exception in a worker process.
+
+    Raises:
+        ValueError: Always.
+    """
+    raise ValueError('This function always fails!')
+
+
+@timeout(seconds=5, isolation='process')
+def process_large_result(size: int) -> bytes:
+    """
+    Return a large bytes object from a worker process.
+
+    Args:
+        size (int): Size of the bytes object.
+
+    Returns:
+        bytes: The bytes object.
+    """
+    return bytes(range(256)) * (size // 256)
+
+
+@timeout(seconds=0.5, isolation='process')
+def process_infinite_loop() -> None:
+    """
+    Burn CPU forever in a worker process.
+    """
+    while True:
+        pass
+
+
+@mark.parametrize('isolation', ['thread', param('signal', marks=mark.skipif(platform == 'win32', reason='Unix only'))])
+def test_timeout_returns_result(isolation: str) -> None:
+    """
+    Test that the timeout decorator returns the result of a function that finishes in time.
+
+    Args:
+        isolation (str): Timeout isolation mode.
+    """
+
+    @timeout(seconds=1, isolation=isolation)  # type: ignore[arg-type]
+    def fast_function(a: int, b: int) -> int:
+        return a + b
+
+    assert fast_function(1, b=2) == 3
+
+
+@mark.parametrize('isolation', ['thread', param('signal', marks=mark.skipif(platform == 'win32', reason='Unix only'))])
+def test_timeout_raises_function_exception(isolation: str) -> None:
+    """
+    Test that the timeout decorator raises the exception raised by the decorated function.
+
+    Args:
+        isolation (str): Timeout isolation mode.
+    """
+
+    @timeout(seconds=1, isolation=isolation)  # type: ignore[arg-type]
+    def failing_function() -> None:
+        raise ValueError('This function always fails!')
+
+    with assert_raises(expected_exception=ValueError, match='This function always fails!'):
+        failing_function()
+
+
+def test_timeout_thread_returns_at_deadline() -> None:
+    """
+    Test that the thread isolation raises TimeoutError at the deadline without waiting for the function to finish.
+    """
+    release = Event()
+
+    @timeout(seconds=0.1)
+    def slow_function() -> None:
+        release.wait(timeout=5)
+
+    start_time = perf_counter()
+    with assert_raises(expected_exception=TimeoutError, match='Function slow_function exceeded the'):
+        slow_function()
+
+    assert perf_counter() - start_time < 1
+    release.set()
+
+
+@mark.skipif(platform == 'win32', reason='Unix only')
+def test_timeout_signal_interrupts_function() -> None:
+    """
+    Test that the signal isolation interrupts the decorated function at the deadline.
+    """
+
+    @timeout(seconds=0.1, isolation='signal')
+    def slow_function() -> None:
+        sleep(5)
+
+    start_time = perf_counter()
+    with assert_raises(expected_exception=TimeoutError, match='Function slow_function exceeded the'):
+        slow_function()
+
+    assert perf_counter() - start_time < 1
+
+
+@mark.skipif(platform == 'win32', reason='Unix only')
+def test_timeout_signal_nested_keeps_outer_timeout() -> None:
+    """
+    Test that a nested signal timeout restores the timer of the enclosing signal timeout when it finishes.
+    """
+
+    @timeout(seconds=0.2, isolation='signal')
+    def inner_function() -> None:
+        sleep(5)
+
+    @timeout(seconds=0.5, isolation='signal')
+    def outer_function() -> str:
+        with assert_raises(expected_exception=TimeoutError, match='Function inner_function exceeded the'):
+            inner_function()
+
+        sleep(1.5)
+        return 'finished'
+
+    start_time = perf_counter()
+    with assert_raises(expected_exception=TimeoutError, match='Function outer_function exceeded the'):
+        outer_function()
+
+    assert perf_counter() - start_time < 1
+
+
+@mark.skipif(platform == 'win32', reason='Unix only')
+def test_timeout_signal_nested_outer_expires_first() -> None:
+    """
+    Test that the enclosing signal timeout interrupts a nested signal timeout call when it expires first.
+    """
+
+    @timeout(seconds=5, isolation='signal')
+    def inner_function() -> None:
+        sleep(5)
+
+    @timeout(seconds=0.2, isolation='signal')
+    def outer_function() -> None:
+        inner_function()
+
+    start_time = perf_counter()
+    with assert_raises(expected_exception=TimeoutError):
+        outer_function()
+
+    assert perf_counter() - start_time < 1
+
+
+@mark.skipif(platform == 'win32', reason='Unix only')
+def test_timeout_signal_nested_outer_expires_while_installing(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the enclosing signal timeout is run when it expires right after the nested handler is installed, before
+    the nested timer is armed.
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest fixture to patch attributes.
+    """
+    install_signal_handler = signal.signal
+    installed: list[Any] = []
+
+    def install_and_expire(signalnum: int, handler: Any) -> Any:
+        previous = install_signal_handler(signalnum, handler)
+        installed.append(handler)
+        if len(installed) == 1:  # the handler of the nested timeout
+            signal.raise_signal(signal.SIGALRM)
+
+        return previous
+
+    @timeout(seconds=5, isolation='signal')
+    def inner_function() -> None:
+        sleep(5)
+
+    @timeout(seconds=0.5, isolation='signal')
+    def outer_function() -> None:
+        monkeypatch.setattr(signal, 'signal', install_and_expire)
+        inner_function()
+
+    start_time = perf_counter()
+    with assert_raises(expected_exception=TimeoutError, match='Function outer_function exceeded the'):
+        outer_function()
+
+    monkeypatch.undo()
+    assert perf_counter() - start_time < 0.4
+
+
+@mark.parametrize('seconds', ['10', None, [], (1,)])
+def test_timeout_invalid_seconds_type(seconds: float) -> None:
+    """
+    Test that the timeout decorator raises a TypeError when the seconds argument is not a number.
+
+    Args:
+        seconds (float): Timeout in seconds.
+    """
+    with assert_raises(expected_exception=TypeError, match='Timeout seconds must be an integer or a float'):
+        timeout(seconds=seconds)
+
+
+@mark.parametrize('seconds', [0, -1, -0.5])
+def test_timeout_invalid_seconds_value(seconds: float) -> None:
+    """
+    Test that the timeout decorator raises a ValueError when the seconds argument is not positive.
+
+    Args:
+        seconds (float): Timeout in seconds.
+    """
+    with assert_raises(expected_exception=ValueError, match='Timeout seconds must be greater than zero'):
+        timeout(seconds=seconds)
+
+
+def test_timeout_invalid_isolation() -> None:
+    """
+    Test that the timeout decorator raises a ValueError when the isolation is not supported.
+    """
+    with assert_raises(expected_exception=ValueError, match='Timeout isolation must be'):
+        timeout(isolation='fiber')  # type: ignore[arg-type]
+
+
+def test_timeout_thread_raises_function_timeout_error() -> None:
+    """
+    Test that a TimeoutError raised by the decorated function itself is propagated unchanged.
+    """
+
+    @timeout(seconds=1)
+    def failing_function() -> None:
+        raise TimeoutError('Upstream timeout')
+
+    with assert_raises(expected_exception=TimeoutError, match='Upstream timeout'):
+        failing_function()
+
+
+def test_timeout_process_returns_result() -> None:
+    """
+    Test that the process isolation returns the result of the function executed in a worker process.
+    """
+    assert process_sum(1, b=2) == 3
+
+
+def test_timeout_process_raises_function_exception() -> None:
+    """
+    Test that the process isolation raises the exception raised in the worker process.
+    """
+    with assert_raises(expected_exception=ValueError, match='This function always fails!'):
+        process_failure()
+
+
+def test_timeout_process_returns_large_result() -> None:
+    """
+    Test that the process isolation returns large bytes results through shared memory.
+    """
+    assert process_large_result(size=4 * 1024 * 1024) == bytes(range(256)) * (4 * 1024 * 1024 // 256)
+
+
+def test_timeout_process_terminates_cpu_bound_function() -> None:
+    """
+    Test that the process isolation stops a CPU-bound function at the deadline and replaces its worker.
+    """
+    start_time = perf_counter()
+    with assert_raises(expected_exception=TimeoutError, match='Function process_infinite_loop exceeded the'):
+        process_infinite_loop()
+
+    assert perf_counter() - start_time < 3
+    assert process_sum(2, 3) == 5
+
+
+def test_timeout_propagates_deadline_to_nested_calls() -> None:
+    """
+    Test that the deadline of a timeout decorated call is visible in its worker thread and shortens nested timeouts.
+    """
+    remaining: list[float | None] = []
+
+    @timeout(seconds=5)
+    def inner() -> None:
+        remaining.append(remaining_time())
+        sleep(1)
+
+    @timeout(seconds=0.2)
+    def outer() -> None:
+        remaining.append(remaining_time())
+        inner()
+
+    start = perf_counter()
+    with assert_raises(expected_exception=TimeoutError):
+        outer()
+
+    assert perf_counter() - start < 0.5
+    assert remaining[0] is not None and 0 < remaining[0] <= 0.2
+    assert remaining[1] is not None and remaining[1] <= remaining[0]
+    assert remaining_time() is None
+
+
+@mark.parametrize('isolation', ['thread', param('signal', marks=mark.skipif(platform == 'win32', reason='Unix only'))])
+def test_timeout_shortened_by_deadline_reports_configured_seconds(isolation: str) -> None:
+    """
+    Test that a timeout shortened by the deadline of the caller waits the remaining time but reports the configured
+    timeout.
+
+    Args:
+        isolation (str): Timeout isolation mode.
+    """
+
+    @timeout(seconds=5, isolation=isolation)  # type: ignore[arg-type]
+    def function() -> None:
+        sleep(1)
+
+    start = perf_counter()
+    with deadline_scope(seconds=0.1), assert_raises(expected_exception=TimeoutError, match='exceeded the 5 seconds timeout'):  # fmt: skip  # noqa: E501
+        function()
+
+    assert perf_counter() - start < 0.5
+
+
+def test_timeout_raises_when_deadline_has_expired() -> None:
+    """
+    Test that a timeout decorated function is not executed when the deadline of the caller has already expired.
+    """
+    calls: list[int] = []
+
+    @timeout(seconds=1)
+    def function() -> None:
+        calls.append(1)
+
+    with deadline_scope(seconds=0), assert_raises(expected_exception=TimeoutError, match='deadline has already expired'):  # fmt: skip  # noqa: E501
+        function()
+
+    assert calls == []
@@ -0,0 +1,200 @@
+"""
+Test typecheck decorator.
+"""
+
+from typing import Any, Literal
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.functions import typecheck
+
+
+@typecheck()
+def function(a: int, b: list[str] | None = None, *, mode: Literal['fast', 'slow'] = 'fast') -> str:
+    """
+    Function whose arguments and return value are validated.
+
+    Args:
+        a (int): First parameter.
+        b (list[str] | None, optional): Second parameter. Defaults to None.
+        mode (Literal['fast', 'slow'], optional): Third parameter. Defaults to 'fast'.
+
+    Returns:
+        str: The first parameter as text.
+    """
+    return str(a)
+
+
+class Node:
+    """
+    Class whose methods are annotated with forward references to itself.
+    """
+
+    @typecheck()
+    def link(self, other: 'Node') -> 'Node':
+        """
+        Method annotated with the class being defined.
+
+        Args:
+            other (Node): Node to link.
+
+        Returns:
+            Node: The linked node.
+        """
+        return other
+
+
+@typecheck()
+def later_function(value: 'LaterClass') -> int:
+    """
+    Function annotated with a class defined after it.
+
+    Args:
+        value (LaterClass): The value.
+
+    Returns:
+        int: Always 1.
+    """
+    return 1
+
+
+class LaterClass:
+    """
+    Class defined after the functions annotated with it.
+    """
+
+
+@mark.parametrize('args, kwargs', [((1,), {}), ((1, ['a']), {'mode': 'slow'}), ((), {'a': 1, 'b': None})])
+def test_typecheck_valid_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+    """
+    Test that typecheck calls the function when the arguments match their annotations.
+
+    Args:
+        args (tuple[Any, ...]): Positional arguments.
+        kwargs (dict[str, Any]): Keyword arguments.
+    """
+    assert function(*args, **kwargs) == '1'
+
+
+@mark.parametrize(
+    'args, kwargs, message',
+    [
+        (('1',), {}, 'The argument a of function function must be int'),
+        ((1, [1]), {}, r'The argument b of function function must be list\[str\] \| None'),
+        ((1,), {'mode': 'other'}, 'The argument mode of function function must be Literal'),
+    ],
+)
+def test_typecheck_invalid_arguments(args: tuple[Any, ...], kwargs: dict[str, Any], message: str) -> None:
+    """
+    Test that typecheck raises a TypeError when an argument does not match its annotation.
+
+    Args:
+        args (tuple[Any, ...]): Positional arguments.
+        kwargs (dict[str, Any]): Keyword arguments.
+        message (str): Expected error message.
+    """
+    with assert_raises(expected_exception=TypeError, match=message):
+        function(*args, **kwargs)
+
+
+def test_typecheck_return_value() -> None:
+    """
+    Test that typecheck validates the return value unless check_return is False.
+    """
+
+    def invalid_return() -> int:
+        return 'a'  # type: ignore[return-value]
+
+    with assert_raises(expected_exception=TypeError, match='The return value of function'):
+        typecheck()(invalid_return)()
+
+    assert typecheck(check_return=False)(invalid_return)() == 'a'
+
+
+def test_typecheck_keeps_the_signature() -> None:
+    """
+    Test that the wrapper has the signature of the function, so calls with wrong arguments fail as they would without
+    the decorator.
+    """
+    assert function.__code__.co_varnames[:3] == ('a', 'b', 'mode')
+
+    with assert_raises(expected_exception=TypeError, match='missing 1 required positional argument'):
+        function()
+
+
+def test_typecheck_variable_arguments() -> None:
+    """
+    Test that typecheck validates each variable positional and keyword argument.
+    """
+
+    @typecheck()
+    def variable_function(*args: int, **kwargs: str) -> int:
+        return len(args) + len(kwargs)
+
+    assert variable_function(1, 2, a='a') == 3
+    with assert_raises(expected_exception=TypeError, match='The argument args of function'):
+        variable_function(1, '2')
+
+    with assert_raises(expected_exception=TypeError, match='The argument kwargs of function'):
+        variable_function(a=1)
+
+
+def test_typecheck_samples_large_collections() -> None:
+    """
+    Test that typecheck only validates sample_size elements of large collections.
+    """
+
+    @typecheck(sample_size=10)
+    def total(values: list[int]) -> int:
+        return len(values)
+
+    values: list[Any] = list(range(1000))
+    values[1] = 'not sampled'
+
+    assert total(values) == 1000
+
+
+@mark.asyncio
+async def test_typecheck_coroutine_function() -> None:
+    """
+    Test that typecheck validates the arguments and awaited return value of coroutine functions.
+    """
+
+    @typecheck()
+    async def coroutine_function(a: int) -> int:
+        return a
+
+    assert await coroutine_function(1) == 1
+    with assert_raises(expected_exception=TypeError, match='The argument a of function'):
+        await coroutine_function('1')
+
+
+def test_typecheck_forward_references() -> None:
+    """
+    Test that typecheck resolves forward references to names defined after the decoration on the first call.
+    """
+    node = Node()
+
+    assert node.link(Node()) is not node
+    assert later_function(LaterClass()) == 1
+    with assert_raises(expected_exception=TypeError, match='The argument other of function Node'):
+        node.link('node')
+
+    with assert_raises(expected_exception=TypeError, match='The argument value of function later_function'):
+        later_function(1)
+
+
+@mark.parametrize(
+    'kwargs, expected_exception',
+    [({'check_return': 1}, TypeError), ({'sample_size': 1.5}, TypeError), ({'sample_size': 0}, ValueError)],
+)
+def test_typecheck_invalid_options(kwargs: dict[str, Any], expected_exception: type[Exception]) -> None:
+    """
+    Test that typecheck validates its options.
+
+    Args:
+        kwargs (dict[str, Any]): Invalid options.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        typecheck(**kwargs)
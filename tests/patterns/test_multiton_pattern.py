@@ -0,0 +1,350 @@
+"""
+Test the multiton pattern.
+"""
+
+from gc import collect
+from threading import Event, Thread
+from time import sleep
+from typing import Any
+
+from freezegun import freeze_time
+from pytest import mark, raises as assert_raises
+
+from developing_tools.patterns import MultitonPattern, MultitonRegistry
+from developing_tools.utils.cache import KWARGS_MARK
+
+
+class NamedMultitonClass(metaclass=MultitonPattern):
+    """
+    Test class for the multiton pattern.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Stores the name of the instance.
+
+        Args:
+            name (str): Name of the instance.
+        """
+        self.name = name
+
+
+def test_multiton_instance_per_key() -> None:
+    """
+    Test that the multiton pattern returns the same instance for the same arguments and another one for others.
+    """
+    instance1 = NamedMultitonClass('a')
+    instance2 = NamedMultitonClass('a')
+    instance3 = NamedMultitonClass('b')
+
+    assert instance1 is instance2
+    assert instance1 is not instance3
+    assert (instance1.name, instance3.name) == ('a', 'b')
+
+
+def test_multiton_binds_arguments_to_the_signature() -> None:
+    """
+    Test that passing an argument by position, by keyword or omitting it with its default value gives the same instance.
+    """
+
+    class Client(metaclass=MultitonPattern):
+        def __init__(self, tenant: str, region: str = 'eu', *, retries: int = 3) -> None:
+            self.tenant = tenant
+            self.region = region
+
+    client = Client('acme')
+
+    assert Client(tenant='acme') is client
+    assert Client('acme', 'eu') is client
+    assert Client('acme', region='eu', retries=3) is client
+    assert Client('acme', 'us') is not client
+    assert Client.multiton_registry().key('acme') == ('acme', 'eu', KWARGS_MARK, ('retries', 3))
+
+
+def test_multiton_registry_binds_arguments_to_the_factory() -> None:
+    """
+    Test that the MultitonRegistry binds the arguments to the signature of its factory.
+    """
+
+    def factory(name: str, size: int = 1) -> list[str]:
+        return [name] * size
+
+    registry = MultitonRegistry(factory=factory)
+
+    assert registry.get('a') is registry.get(name='a', size=1)
+    assert registry.get('a') is not registry.get('a', 2)
+
+
+def test_multiton_custom_key() -> None:
+    """
+    Test that the key of the instances can be derived from the arguments with a custom function.
+    """
+
+    class Connection(metaclass=MultitonPattern, key=lambda dsn, timeout=10: dsn):
+        def __init__(self, dsn: str, timeout: int = 10) -> None:
+            self.timeout = timeout
+
+    assert Connection('postgresql://a', timeout=5) is Connection('postgresql://a')
+    assert Connection('postgresql://a').timeout == 5
+
+
+def test_multiton_evicts_least_recently_used() -> None:
+    """
+    Test that the multiton pattern evicts the least recently used instance when the registry is full, calling on_evict.
+    """
+    evicted: list[tuple[Any, str]] = []
+
+    class Client(metaclass=MultitonPattern, max_size=2, on_evict=lambda key, client: evicted.append((key, client.name))):  # fmt: skip  # noqa: E501
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    client1 = Client('a')
+    Client('b')
+    assert Client('a') is client1
+
+    Client('c')
+
+    assert evicted == [(('b',), 'b')]
+    assert Client('a') is client1
+    assert Client.multiton_registry().statistics().evictions == 1
+
+
+def test_multiton_expires_idle_instances() -> None:
+    """
+    Test that the multiton pattern creates a new instance when the previous one was not requested for ttl seconds.
+    """
+    evicted: list[Any] = []
+
+    class Client(metaclass=MultitonPattern, ttl=10, on_evict=lambda key, client: evicted.append(key)):
+        pass
+
+    with freeze_time('2024-01-01 00:00:00') as frozen_time:
+        client = Client()
+        frozen_time.tick(delta=8)
+        assert Client() is client
+        frozen_time.tick(delta=8)
+        assert Client() is client
+        frozen_time.tick(delta=11)
+        assert Client() is not client
+
+    assert evicted == [()]
+    assert Client.multiton_registry().statistics().expirations == 1
+
+
+def test_multiton_weak_references() -> None:
+    """
+    Test that weakly held instances are freed once they are no longer used elsewhere.
+    """
+
+    class Handle(metaclass=MultitonPattern, weak=True):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    handle = Handle('a')
+    assert Handle('a') is handle
+
+    del handle
+    collect()
+    Handle('a')
+
+    assert Handle.multiton_registry().statistics().misses == 2
+
+
+def test_multiton_weak_references_free_space_before_evicting() -> None:
+    """
+    Test that freed instances are discarded before evicting live ones when the registry is full.
+    """
+    evicted: list[Any] = []
+
+    class Handle(metaclass=MultitonPattern, max_size=2, weak=True, on_evict=lambda key, handle: evicted.append(key)):
+        def __init__(self, number: int) -> None:
+            self.number = number
+
+    handle1 = Handle(1)
+    Handle(2)
+    collect()
+    handle3 = Handle(3)
+
+    assert evicted == []
+    assert Handle(1) is handle1
+    assert Handle(3) is handle3
+
+
+def test_multiton_evict_and_clear() -> None:
+    """
+    Test that instances can be evicted one by one or cleared, calling on_evict with each of them.
+    """
+    evicted: list[Any] = []
+
+    class Client(metaclass=MultitonPattern, on_evict=lambda key, client: evicted.append(key)):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    client = Client('a')
+    Client('b')
+    registry = Client.multiton_registry()
+
+    assert registry.evict('a')
+    assert not registry.evict('a')
+    assert Client('a') is not client
+    assert len(registry) == 2
+
+    registry.clear()
+
+    assert len(registry) == 0
+    assert sorted(evicted) == [('a',), ('a',), ('b',)]
+
+
+def test_multiton_inherits_options() -> None:
+    """
+    Test that subclasses inherit the options they do not set and have their own instances.
+    """
+
+    class Base(metaclass=MultitonPattern, max_size=1, ttl=10):
+        pass
+
+    class Child(Base, ttl=20):
+        pass
+
+    assert (Child.multiton_registry().max_size, Child.multiton_registry().ttl) == (1, 20)
+    assert Child() is not Base()
+    assert Child() is Child()
+
+
+def test_multiton_does_not_register_exceptions() -> None:
+    """
+    Test that nothing is registered when the creation raises.
+    """
+    calls: list[int] = []
+
+    class Flaky(metaclass=MultitonPattern):
+        def __init__(self) -> None:
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError('first creation fails')
+
+    with assert_raises(expected_exception=ValueError):
+        Flaky()
+
+    assert Flaky() is Flaky()
+    assert len(calls) == 2
+
+
+def test_multiton_recursive_creation_raises() -> None:
+    """
+    Test that requesting an instance from its own constructor raises instead of waiting for itself.
+    """
+
+    class Recursive(metaclass=MultitonPattern):
+        def __init__(self, name: str) -> None:
+            Recursive(name)
+
+    with assert_raises(expected_exception=RuntimeError, match='being created in the same thread'):
+        Recursive('a')
+
+    assert len(Recursive.multiton_registry()) == 0
+
+
+def test_multiton_interrupted_creation_does_not_interrupt_waiters() -> None:
+    """
+    Test that a BaseException that is not an Exception is raised only in the creation that got it, a waiting creation
+    creates the instance instead.
+    """
+
+    class Interrupted(BaseException):
+        pass
+
+    calls: list[int] = []
+    results: list[Any] = []
+
+    class Slow(metaclass=MultitonPattern):
+        def __init__(self) -> None:
+            calls.append(1)
+            sleep(0.05)
+            if len(calls) == 1:
+                raise Interrupted
+
+    def owner() -> None:
+        with assert_raises(expected_exception=Interrupted):
+            Slow()
+
+    threads = [Thread(target=owner), Thread(target=lambda: results.append(Slow()))]
+    threads[0].start()
+    sleep(0.01)
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+    assert results == [Slow()]
+
+
+def test_multiton_concurrent_creation_once() -> None:
+    """
+    Test that concurrent creations with the same key wait for the first one instead of creating another instance.
+    """
+    calls: list[int] = []
+    results: list[Any] = []
+
+    class Slow(metaclass=MultitonPattern):
+        def __init__(self, number: int) -> None:
+            calls.append(number)
+            sleep(0.1)
+
+    threads = [Thread(target=lambda: results.append(Slow(1))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_multiton_creation_does_not_block_other_keys() -> None:
+    """
+    Test that the creation of an instance does not block the creation of instances with other keys.
+    """
+    creating = Event()
+    release = Event()
+
+    class Client(metaclass=MultitonPattern):
+        def __init__(self, name: str) -> None:
+            if name == 'slow':
+                creating.set()
+                release.wait(timeout=5)
+
+    thread = Thread(target=Client, args=('slow',))
+    thread.start()
+    creating.wait(timeout=5)
+
+    assert Client('fast') is Client('fast')
+    assert not release.is_set()
+
+    release.set()
+    thread.join()
+
+    assert Client('slow') is Client('slow')
+
+
+@mark.parametrize(
+    'arguments, expected_exception',
+    [
+        ({'factory': 'name'}, TypeError),
+        ({'max_size': 1.5}, TypeError),
+        ({'max_size': 0}, ValueError),
+        ({'ttl': '10'}, TypeError),
+        ({'ttl': 0}, ValueError),
+        ({'weak': 1}, TypeError),
+        ({'key': 'name'}, TypeError),
+        ({'on_evict': 'name'}, TypeError),
+    ],
+)
+def test_multiton_registry_invalid_arguments(arguments: dict[str, Any], expected_exception: type[Exception]) -> None:
+    """
+    Test that the MultitonRegistry validates its arguments.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        MultitonRegistry(**{'factory': object, **arguments})
@@ -2,7 +2,7 @@
 Test the singleton pattern.
 """
 
-from threading import Thread
+from threading import Event, Thread
 
 from developing_tools.patterns import SingletonPattern
 
@@ -52,3 +52,34 @@ def test_singleton_thread_safety() -> None:
     thread2.join()
 
     assert results[1] is results[2]
+
+
+def test_singleton_per_class_lock() -> None:
+    """
+    Test that the creation of a singleton does not block the instantiation of other singleton classes.
+    """
+    creating = Event()
+    release = Event()
+
+    class SlowSingletonClass(metaclass=SingletonPattern):
+        """
+        Singleton class whose creation blocks until it is released.
+        """
+
+        def __init__(self) -> None:
+            """
+            Blocks until the test releases the creation.
+            """
+            creating.set()
+            release.wait(timeout=5)
+
+    thread = Thread(target=SlowSingletonClass)
+    thread.start()
+    creating.wait(timeout=5)
+
+    assert TestSingletonClass() is TestSingletonClass()
+
+    release.set()
+    thread.join()
+
+    assert SlowSingletonClass() is SlowSingletonClass()
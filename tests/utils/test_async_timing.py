@@ -0,0 +1,73 @@
+"""
+Test async timing helpers.
+"""
+
+from asyncio import CancelledError, create_task, sleep
+from time import sleep as blocking_sleep
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.utils.async_timing import TimedCoroutine, loop_heartbeat
+
+
+@mark.asyncio
+async def test_timed_coroutine_steps() -> None:
+    """
+    Test that TimedCoroutine returns the result of the coroutine and counts a step per suspension.
+    """
+
+    async def function() -> int:
+        await sleep(0)
+        await sleep(0)
+        return 1
+
+    coroutine = TimedCoroutine(coroutine=function())
+    assert await coroutine == 1
+    assert coroutine.steps == 3
+    assert coroutine.cpu_time >= 0
+    assert coroutine.loop_hold_time >= 0
+
+
+@mark.asyncio
+async def test_timed_coroutine_forwards_exceptions() -> None:
+    """
+    Test that TimedCoroutine forwards the exceptions thrown into it to the coroutine.
+    """
+    caught = []
+
+    async def function() -> None:
+        try:
+            await sleep(10)
+
+        except CancelledError:
+            caught.append(True)
+            raise
+
+    async def timed() -> None:
+        await TimedCoroutine(coroutine=function())
+
+    task = create_task(timed())
+    await sleep(0)
+    task.cancel()
+
+    with assert_raises(CancelledError):
+        await task
+
+    assert caught == [True]
+
+
+@mark.asyncio
+async def test_loop_heartbeat_shared_by_watches() -> None:
+    """
+    Test that the watches of an event loop share its heartbeat and only measure the blocks after they started.
+    """
+    heartbeat = loop_heartbeat()
+    outer = heartbeat.watch()
+    await sleep(0.005)
+    blocking_sleep(0.05)
+    inner = loop_heartbeat().watch()
+    await sleep(0.005)
+
+    assert loop_heartbeat() is heartbeat
+    assert inner.stop() < 0.04
+    assert outer.stop() >= 0.04
@@ -0,0 +1,113 @@
+"""
+Test backoff strategies.
+"""
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.utils.backoff import (
+    BackoffStrategy,
+    ConstantBackoff,
+    DecorrelatedJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+    UniformBackoff,
+)
+
+
+def test_constant_backoff() -> None:
+    """
+    Test that ConstantBackoff always returns the same delay.
+    """
+    strategy = ConstantBackoff(seconds=1.5)
+
+    assert [strategy.delay(attempt=attempt, previous_delay=1.5) for attempt in range(3)] == [1.5, 1.5, 1.5]
+
+
+def test_uniform_backoff_bounds() -> None:
+    """
+    Test that UniformBackoff returns delays between its minimum and maximum.
+    """
+    strategy = UniformBackoff(minimum=1, maximum=2)
+
+    assert all(1 <= strategy.delay(attempt=attempt, previous_delay=0) <= 2 for attempt in range(100))
+
+
+def test_exponential_backoff_grows_and_is_capped() -> None:
+    """
+    Test that ExponentialBackoff multiplies the delay by the factor after each retry and caps it to the maximum.
+    """
+    strategy = ExponentialBackoff(base=0.5, factor=2, maximum=3)
+
+    assert [strategy.delay(attempt=attempt, previous_delay=0) for attempt in range(5)] == [0.5, 1, 2, 3, 3]
+
+
+def test_exponential_backoff_does_not_overflow() -> None:
+    """
+    Test that ExponentialBackoff returns the maximum for huge attempt numbers instead of overflowing.
+    """
+    strategy = ExponentialBackoff(base=1, factor=10.0, maximum=60)
+
+    assert strategy.delay(attempt=10_000, previous_delay=0) == 60
+
+
+def test_full_jitter_backoff_bounds() -> None:
+    """
+    Test that FullJitterBackoff returns delays between 0 and the capped exponential delay.
+    """
+    strategy = FullJitterBackoff(base=1, maximum=4)
+
+    for attempt in range(10):
+        assert 0 <= strategy.delay(attempt=attempt, previous_delay=0) <= min(4, 2**attempt)
+
+
+def test_decorrelated_jitter_backoff_bounds() -> None:
+    """
+    Test that DecorrelatedJitterBackoff returns delays between base and three times the previous delay, capped.
+    """
+    strategy = DecorrelatedJitterBackoff(base=1, maximum=10)
+
+    previous_delay = 0.0
+    for attempt in range(100):
+        delay = strategy.delay(attempt=attempt, previous_delay=previous_delay)
+        assert 1 <= delay <= min(10, max(1, 3 * previous_delay))
+        previous_delay = delay
+
+
+@mark.parametrize(
+    'arguments',
+    [
+        {'base': -1},
+        {'base': 1, 'factor': 0.5},
+        {'base': 1, 'maximum': -1},
+    ],
+)
+def test_exponential_backoff_invalid_values(arguments: dict[str, float]) -> None:
+    """
+    Test that ExponentialBackoff raises a ValueError when its parameters are out of range.
+    """
+    with assert_raises(expected_exception=ValueError):
+        ExponentialBackoff(**arguments)
+
+
+def test_backoff_invalid_type() -> None:
+    """
+    Test that the backoff strategies raise a TypeError when a parameter is not a number.
+    """
+    with assert_raises(expected_exception=TypeError, match='seconds must be a number'):
+        ConstantBackoff(seconds='1')  # type: ignore[arg-type]
+
+
+def test_uniform_backoff_invalid_range() -> None:
+    """
+    Test that UniformBackoff raises a ValueError when the minimum is not less than the maximum.
+    """
+    with assert_raises(expected_exception=ValueError, match='minimum must be less than maximum'):
+        UniformBackoff(minimum=2, maximum=1)
+
+
+def test_backoff_strategy_is_abstract() -> None:
+    """
+    Test that the BackoffStrategy base class can not be instantiated without implementing delay.
+    """
+    with assert_raises(expected_exception=TypeError, match='abstract'):
+        BackoffStrategy()  # type: ignore[abstract]
@@ -0,0 +1,115 @@
+"""
+Test BoundedRepr.
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.utils.bounded_repr import BoundedRepr
+from developing_tools.utils.override import override
+
+
+class ArrayLike:
+    """
+    Object with the shape, size and dtype attributes of an array.
+    """
+
+    shape = (1000, 3)
+    size = 3000
+    dtype = 'float64'
+
+
+@mark.parametrize(
+    'value, expected',
+    [
+        ('Hello', 'Hello'),
+        (1, '1'),
+        (None, 'None'),
+        ([1, 'a'], "[1, 'a']"),
+        ({'a': [1, 2]}, "{'a': [1, 2]}"),
+        ('a' * 30, f'{"a" * 20}... (str of 30 characters)'),
+        (list(range(100)), '[0, 1, 2, 3, ...] (list of 100 items)'),
+        (
+            OrderedDict((str(i), i) for i in range(5, 0, -1)),
+            "{'5': 5, '4': 4, '3': 3, '2': 2, ...} (OrderedDict of 5 items)",
+        ),
+        ({i: i for i in range(10, 0, -1)}, '{10: 10, 9: 9, 8: 8, 7: 7, ...} (dict of 10 items)'),
+        ([[[1]]], '[[[...]]]'),
+        (b'\x00' * 100, 'bytes(len=100)'),
+        (bytearray(b'abc'), "bytearray(b'abc')"),
+        (ArrayLike(), 'ArrayLike(shape=(1000, 3), dtype=float64)'),
+    ],
+)
+def test_bounded_repr_format(value: Any, expected: str) -> None:
+    """
+    Test that BoundedRepr formats values within its limits and summarizes large buffers and arrays.
+
+    Args:
+        value (Any): The value to format.
+        expected (str): Expected text.
+    """
+    formatter = BoundedRepr(max_length=20, max_depth=2, max_elements=4)
+
+    assert formatter.format(value) == expected
+
+
+def test_bounded_repr_huge_integer() -> None:
+    """
+    Test that integers too large to be converted to text are summarized by their number of bits.
+    """
+    assert BoundedRepr().format(value=10**5000) == 'int(bits=16610)'
+
+
+def test_bounded_repr_does_not_format_whole_containers() -> None:
+    """
+    Test that only the shown elements of a large container are formatted.
+    """
+    formatted = []
+
+    class Element:
+        @override
+        def __repr__(self) -> str:
+            formatted.append(self)
+            return 'Element()'
+
+    BoundedRepr(max_elements=3).format(value=[Element() for _ in range(1000)])
+
+    assert len(formatted) == 3
+
+
+def test_bounded_repr_broken_object() -> None:
+    """
+    Test that objects whose str raises an exception are still formatted.
+    """
+
+    class Broken:
+        @override
+        def __str__(self) -> str:
+            raise RuntimeError
+
+    assert BoundedRepr().format(value=Broken()).startswith('<Broken instance at 0x')
+
+
+@mark.parametrize(
+    'kwargs, expected_exception',
+    [
+        ({'max_length': 1.5}, TypeError),
+        ({'max_length': 9}, ValueError),
+        ({'max_depth': '1'}, TypeError),
+        ({'max_depth': 0}, ValueError),
+        ({'max_elements': None}, TypeError),
+        ({'max_elements': 0}, ValueError),
+    ],
+)
+def test_bounded_repr_invalid_limits(kwargs: dict[str, Any], expected_exception: type[Exception]) -> None:
+    """
+    Test that BoundedRepr validates its limits.
+
+    Args:
+        kwargs (dict[str, Any]): Invalid limits.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        BoundedRepr(**kwargs)
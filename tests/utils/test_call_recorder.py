@@ -0,0 +1,183 @@
+"""
+Test call recorder and replay.
+"""
+
+from pathlib import Path
+
+from pytest import CaptureFixture, raises as assert_raises
+
+from developing_tools.functions import print_parameters
+from developing_tools.utils.call_recorder import CallRecorder, iter_call_records, replay_calls
+
+
+def add(a: int, b: int) -> int:
+    """
+    Sum two numbers.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+def test_call_recorder_records_calls(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    """
+    Test that print_parameters records every call in the call log without printing when print_output is False.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+    """
+    recorder = CallRecorder(path=tmp_path / 'calls.log')
+    recorded_add = print_parameters(recorder=recorder, print_output=False)(add)
+
+    for i in range(5):
+        recorded_add(i, b=i)
+
+    assert not (tmp_path / 'calls.log').exists()
+    recorder.flush()
+
+    records = list(iter_call_records(path=tmp_path / 'calls.log'))
+    out, _ = capsys.readouterr()
+
+    assert out == ''
+    assert [(record.args, record.kwargs, record.return_value) for record in records] == [((i,), {'b': i}, 2 * i) for i in range(5)]  # fmt: skip  # noqa: E501
+    assert all(record.function == f'{__name__}.add' for record in records)
+    assert all(record.execution_time >= 0 for record in records)
+
+
+def test_call_recorder_replay(tmp_path: Path) -> None:
+    """
+    Test that replay_calls re-runs a function against the recorded calls.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+    recorder = CallRecorder(path=tmp_path / 'calls.log', buffer_size=0)
+    print_parameters(recorder=recorder, print_output=False)(add)(1, 2)
+
+    replayed = list(replay_calls(function=add, path=tmp_path / 'calls.log'))
+
+    assert len(replayed) == 1
+    assert replayed[0][0].return_value == replayed[0][1] == 3
+
+
+def test_call_recorder_records_arguments_before_the_call(tmp_path: Path) -> None:
+    """
+    Test that the arguments are recorded as they were received, not with the in-place changes made by the call.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+
+    def append(values: list[int]) -> int:
+        values.append(len(values))
+        return len(values)
+
+    recorder = CallRecorder(path=tmp_path / 'calls.log', buffer_size=0)
+    print_parameters(recorder=recorder, print_output=False)(append)([1, 2])
+
+    (record,) = iter_call_records(path=tmp_path / 'calls.log')
+
+    assert record.args == ([1, 2],)
+    assert record.return_value == 3
+
+
+def test_call_recorder_unpicklable_values(tmp_path: Path) -> None:
+    """
+    Test that an unpicklable return value is recorded by its repr keeping the arguments replayable, and that calls
+    with unpicklable arguments are recorded by their repr and skipped when replaying.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+    recorder = CallRecorder(path=tmp_path / 'calls.log', buffer_size=0)
+    recorder.record(function='add', args=(1, 2), kwargs={}, return_value=lambda: 3, execution_time=0.0)
+    recorder.record(function='add', args=(1, lambda: 2), kwargs={}, return_value=3, execution_time=0.0)
+
+    first, second = iter_call_records(path=tmp_path / 'calls.log')
+
+    assert (first.args, first.replayable, first.return_value.startswith('<function')) == ((1, 2), True, True)
+    assert (second.args[0], second.replayable, second.return_value) == ('1', False, 3)
+    assert [record.args for record, _ in replay_calls(function=add, path=tmp_path / 'calls.log', name='add')] == [(1, 2)]  # fmt: skip  # noqa: E501
+
+
+def test_call_recorder_flushes_when_collected(tmp_path: Path) -> None:
+    """
+    Test that a recorder is not kept alive until exit and its buffered calls are written when it is collected.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+    from gc import collect
+    from weakref import ref
+
+    recorder = CallRecorder(path=tmp_path / 'calls.log')
+    recorder.record(function='add', args=(1, 2), kwargs={}, return_value=3, execution_time=0.0)
+    reference = ref(recorder)
+
+    del recorder
+    collect()
+
+    assert reference() is None
+    assert [record.return_value for record in iter_call_records(path=tmp_path / 'calls.log')] == [3]
+
+
+def test_call_recorder_rotation(tmp_path: Path) -> None:
+    """
+    Test that the call log is rotated when it reaches max_bytes.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+    recorder = CallRecorder(path=tmp_path / 'calls.log', buffer_size=0, max_bytes=200, backup_count=2)
+    for i in range(20):
+        recorder.record(function='add', args=(i, i), kwargs={}, return_value=2 * i, execution_time=0.0)
+
+    assert (tmp_path / 'calls.log.1').exists()
+    assert (tmp_path / 'calls.log.2').exists()
+    assert not (tmp_path / 'calls.log.3').exists()
+    assert list(iter_call_records(path=tmp_path / 'calls.log'))[-1].return_value == 38
+
+
+def test_call_recorder_ignores_truncated_record(tmp_path: Path) -> None:
+    """
+    Test that a truncated last record is ignored when reading the call log.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+    recorder = CallRecorder(path=tmp_path / 'calls.log', buffer_size=0)
+    recorder.record(function='add', args=(1, 2), kwargs={}, return_value=3, execution_time=0.0)
+    recorder.record(function='add', args=(2, 3), kwargs={}, return_value=5, execution_time=0.0)
+
+    data = (tmp_path / 'calls.log').read_bytes()
+    (tmp_path / 'calls.log').write_bytes(data[:-5])
+
+    assert [record.return_value for record in iter_call_records(path=tmp_path / 'calls.log')] == [3]
+
+
+def test_call_recorder_invalid_file(tmp_path: Path) -> None:
+    """
+    Test that reading a file that is not a call log raises a ValueError.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+    """
+    for content in (b'not a call log', b'DTCALLS1' + bytes(8)):
+        (tmp_path / 'calls.log').write_bytes(content)
+
+        with assert_raises(expected_exception=ValueError, match='is not a call log'):
+            list(iter_call_records(path=tmp_path / 'calls.log'))
+
+
+def test_print_parameters_invalid_recorder_type() -> None:
+    """
+    Test that print_parameters raises a TypeError when the recorder is not a CallRecorder.
+    """
+    with assert_raises(expected_exception=TypeError, match='recorder must be a CallRecorder or None'):
+        print_parameters(recorder='calls.log')  # type: ignore[arg-type]
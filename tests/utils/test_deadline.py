@@ -0,0 +1,45 @@
+"""
+Test deadline helpers.
+"""
+
+from freezegun import freeze_time
+
+from developing_tools.utils.deadline import deadline_scope, remaining_time
+
+
+def test_remaining_time_without_deadline() -> None:
+    """
+    Test that remaining_time returns None outside of a deadline scope.
+    """
+    assert remaining_time() is None
+
+
+def test_deadline_scope_sets_remaining_time() -> None:
+    """
+    Test that deadline_scope sets the remaining time while the block runs and restores it afterwards.
+    """
+    with freeze_time(time_to_freeze='2021-01-01') as frozen_time:
+        with deadline_scope(seconds=10) as remaining:
+            assert remaining == 10
+            frozen_time.tick(delta=4)
+            assert remaining_time() == 6
+
+            frozen_time.tick(delta=10)
+            assert remaining_time() == 0
+
+        assert remaining_time() is None
+
+
+def test_deadline_scope_keeps_earlier_enclosing_deadline() -> None:
+    """
+    Test that a nested deadline_scope can shorten the deadline but never extend it.
+    """
+    with freeze_time(time_to_freeze='2021-01-01'), deadline_scope(seconds=5):
+        with deadline_scope(seconds=10) as remaining:
+            assert remaining == 5
+
+        with deadline_scope(seconds=2) as remaining:
+            assert remaining == 2
+            assert remaining_time() == 2
+
+        assert remaining_time() == 5
@@ -0,0 +1,108 @@
+"""
+Test diagnostics switch.
+"""
+
+from collections.abc import Iterator
+from subprocess import run  # nosec: B404
+from sys import executable
+
+from pytest import CaptureFixture, fixture, raises as assert_raises
+
+from developing_tools.context_managers import ExecutionTimeBlock
+from developing_tools.functions import execution_time, print_parameters
+from developing_tools.utils.diagnostics import (
+    DIAGNOSTICS_ENVIRONMENT_VARIABLE,
+    diagnostics_enabled,
+    set_diagnostics_enabled,
+)
+
+
+@fixture
+def disabled_diagnostics() -> Iterator[None]:
+    """
+    Disables the diagnostics during a test.
+
+    Yields:
+        None
+    """
+    set_diagnostics_enabled(enabled=False)
+    try:
+        yield
+
+    finally:
+        set_diagnostics_enabled(enabled=True)
+
+
+def function(a: int) -> int:
+    """
+    Function used to test the decorators.
+
+    Args:
+        a (int): A number.
+
+    Returns:
+        int: The same number.
+    """
+    return a
+
+
+def test_disabled_decorators_return_original_function(disabled_diagnostics: None) -> None:
+    """
+    Test that the diagnostic decorators return the original function when the diagnostics are disabled.
+
+    Args:
+        disabled_diagnostics (None): Fixture that disables the diagnostics.
+    """
+    assert execution_time()(function) is function
+    assert execution_time(aggregate=True)(function) is function
+    assert print_parameters(show_types=True)(function) is function
+
+
+def test_disabled_execution_time_block_is_noop(capsys: CaptureFixture[str], disabled_diagnostics: None) -> None:
+    """
+    Test that ExecutionTimeBlock does not print nor add nodes to the timing tree when the diagnostics are disabled.
+
+    Args:
+        capsys (CaptureFixture[str]): Pytest fixture to capture stdout and stderr.
+        disabled_diagnostics (None): Fixture that disables the diagnostics.
+    """
+    ExecutionTimeBlock.reset_timing_tree()
+    with ExecutionTimeBlock(title='disabled') as block:
+        pass
+
+    out, _ = capsys.readouterr()
+    assert out == ''
+    assert block.execution_time == 0
+    assert ExecutionTimeBlock.timing_tree().children == ()
+
+
+def test_diagnostics_are_enabled_by_default() -> None:
+    """
+    Test that the diagnostics are enabled when the environment variable is not set.
+    """
+    assert diagnostics_enabled()
+    assert execution_time()(function) is not function
+
+
+def test_diagnostics_disabled_from_environment() -> None:
+    """
+    Test that the environment variable disables the diagnostics at import time.
+    """
+    code = 'from developing_tools.utils.diagnostics import diagnostics_enabled; print(diagnostics_enabled())'
+    result = run(  # noqa: S603  # nosec: B603
+        [executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={DIAGNOSTICS_ENVIRONMENT_VARIABLE: 'true'},
+    )
+
+    assert result.stdout.strip() == 'False'
+
+
+def test_set_diagnostics_enabled_invalid_type() -> None:
+    """
+    Test that set_diagnostics_enabled raises a TypeError when enabled is not a boolean.
+    """
+    with assert_raises(expected_exception=TypeError, match='enabled must be a boolean, got int instead'):
+        set_diagnostics_enabled(enabled=1)  # type: ignore[arg-type]
@@ -0,0 +1,133 @@
+"""
+Test latency histogram and registry.
+"""
+
+from threading import Thread
+
+from pytest import approx, mark, raises as assert_raises
+
+from developing_tools.utils.latency_registry import LatencyHistogram, LatencyRegistry, bucket_index, bucket_value
+
+
+@mark.parametrize('nanoseconds', [0, 1, 31, 32, 63, 64, 1_000, 123_456, 987_654_321, 3_600_000_000_000])
+def test_bucket_relative_error(nanoseconds: int) -> None:
+    """
+    Test that the representative value of the bucket of a sample is within the histogram relative error.
+
+    Args:
+        nanoseconds (int): The sample in nanoseconds.
+    """
+    assert bucket_value(index=bucket_index(nanoseconds=nanoseconds)) == approx(nanoseconds, rel=0.032)
+
+
+def test_latency_histogram_statistics() -> None:
+    """
+    Test that the histogram snapshot reports count, mean, minimum, maximum and percentiles.
+    """
+    histogram = LatencyHistogram()
+    for nanoseconds in range(1, 1001):
+        histogram.record(nanoseconds=nanoseconds * 1_000)
+
+    statistics = histogram.snapshot()
+
+    assert statistics.count == 1000
+    assert statistics.mean == approx(500.5e-6)
+    assert statistics.minimum == approx(1e-6)
+    assert statistics.maximum == approx(1e-3)
+    assert statistics.p50 == approx(500e-6, rel=0.032)
+    assert statistics.p95 == approx(950e-6, rel=0.032)
+    assert statistics.p99 == approx(990e-6, rel=0.032)
+
+
+def test_latency_histogram_empty_statistics() -> None:
+    """
+    Test that the snapshot of an empty histogram reports zeros.
+    """
+    statistics = LatencyHistogram().snapshot()
+
+    assert statistics.count == 0
+    assert statistics.mean == 0
+    assert statistics.p99 == 0
+
+
+def test_latency_histogram_merges_threads() -> None:
+    """
+    Test that the samples recorded from several threads are merged in the snapshot.
+    """
+    histogram = LatencyHistogram()
+
+    def record() -> None:
+        for _ in range(1000):
+            histogram.record(nanoseconds=100)
+
+    threads = [Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert histogram.snapshot().count == 8000
+
+
+def test_latency_histogram_folds_finished_threads() -> None:
+    """
+    Test that the shards of finished threads are folded into one, keeping their samples.
+    """
+    histogram = LatencyHistogram()
+    histogram.record(nanoseconds=50)
+
+    for nanoseconds in (100, 200, 300, 400):
+        thread = Thread(target=histogram.record, kwargs={'nanoseconds': nanoseconds})
+        thread.start()
+        thread.join()
+
+    statistics = histogram.snapshot()
+
+    assert histogram.shards == 2
+    assert (statistics.count, statistics.minimum, statistics.maximum) == (5, 50 / 1e9, 400 / 1e9)
+
+
+def test_latency_histogram_reset() -> None:
+    """
+    Test that resetting the histogram discards every recorded sample.
+    """
+    histogram = LatencyHistogram()
+    histogram.record(nanoseconds=100)
+    histogram.reset()
+
+    assert histogram.snapshot().count == 0
+
+
+@mark.parametrize('percentile', [-1, 100.5])
+def test_latency_statistics_invalid_percentile(percentile: float) -> None:
+    """
+    Test that requesting a percentile outside 0 and 100 raises a ValueError.
+
+    Args:
+        percentile (float): The percentile to compute.
+    """
+    with assert_raises(expected_exception=ValueError, match='Percentile must be between 0 and 100'):
+        LatencyHistogram().snapshot().percentile(percentile=percentile)
+
+
+def test_latency_registry_is_shared() -> None:
+    """
+    Test that the registry returns the same histogram for the same name.
+    """
+    assert LatencyRegistry().histogram(name='test') is LatencyRegistry().histogram(name='test')
+
+
+def test_latency_histogram_weighted_samples() -> None:
+    """
+    Test that weighted samples count as many calls as their weight without changing the mean.
+    """
+    histogram = LatencyHistogram()
+    histogram.record(nanoseconds=1_000, weight=10)
+    histogram.record(nanoseconds=3_000, weight=10)
+
+    statistics = histogram.snapshot()
+
+    assert statistics.samples == 2
+    assert statistics.count == 20
+    assert statistics.mean == approx(2e-6)
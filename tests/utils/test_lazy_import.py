@@ -0,0 +1,58 @@
+"""
+Test lazy package exports.
+"""
+
+from subprocess import run  # nosec: B404
+from sys import executable
+
+from pytest import mark, raises as assert_raises
+
+import developing_tools.functions
+
+
+def run_python(code: str) -> str:
+    """
+    Runs Python code in a fresh interpreter.
+
+    Args:
+        code (str): Code to run.
+
+    Returns:
+        str: The standard output of the interpreter.
+    """
+    return run([executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()  # noqa: S603  # nosec: B603
+
+
+@mark.parametrize('package', ['developing_tools.functions', 'developing_tools.context_managers', 'developing_tools.patterns'])  # fmt: skip  # noqa: E501
+def test_package_import_does_not_import_submodules(package: str) -> None:
+    """
+    Test that importing a package does not import its submodules nor heavy optional modules.
+
+    Args:
+        package (str): Name of the package.
+    """
+    code = f'import sys, {package}; print(sorted(name for name in sys.modules if name.startswith("{package}.") or name in ("asyncio", "typing_extensions")))'  # noqa: E501
+    assert run_python(code=code) == '[]'
+
+
+def test_importing_submodule_keeps_export() -> None:
+    """
+    Test that importing a submodule with the same name as its export does not shadow the export in the package.
+    """
+    code = 'import developing_tools.functions.timeout; from developing_tools.functions import timeout; print(type(timeout).__name__)'  # noqa: E501
+    assert run_python(code=code) == 'function'
+
+
+def test_lazy_package_dir_lists_exports() -> None:
+    """
+    Test that dir lists the exports of a package before they are imported.
+    """
+    assert set(developing_tools.functions.__all__) <= set(dir(developing_tools.functions))
+
+
+def test_lazy_package_unknown_attribute() -> None:
+    """
+    Test that accessing an attribute that is not an export raises an AttributeError.
+    """
+    with assert_raises(expected_exception=AttributeError, match='has no attribute'):
+        developing_tools.functions.unknown_decorator  # noqa: B018
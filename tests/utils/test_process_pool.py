@@ -0,0 +1,124 @@
+"""
+Test the process pool used by the process isolation of the timeout decorator.
+"""
+
+import pickle
+from os import listdir
+from os.path import isdir
+from sys import platform
+from typing import Any
+
+from pytest import MonkeyPatch, mark, raises as assert_raises
+
+from developing_tools.utils import process_pool
+from developing_tools.utils.override import override
+from developing_tools.utils.process_pool import (
+    SHARED_MEMORY_DIRECTORY,
+    SHARED_MEMORY_THRESHOLD,
+    ProcessPool,
+    dump_result,
+    function_reference,
+    load_result,
+)
+
+
+class Block:
+    """
+    Object whose data is pickled as an out-of-band buffer, like a numpy array.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """
+        Stores the data of the block.
+
+        Args:
+            data (Any): The buffer of the block.
+        """
+        self.data = data
+
+    @override
+    def __reduce_ex__(self, protocol: Any) -> tuple[type['Block'], tuple[pickle.PickleBuffer]]:
+        """
+        Pickles the data of the block out-of-band.
+
+        Args:
+            protocol (Any): The pickle protocol.
+
+        Returns:
+            tuple[type[Block], tuple[pickle.PickleBuffer]]: The reconstructor of the block and its arguments.
+        """
+        return Block, (pickle.PickleBuffer(self.data),)
+
+
+def add(a: int, b: int) -> int:
+    """
+    Sum two numbers in a worker process.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum of both numbers.
+    """
+    return a + b
+
+
+def segments() -> set[str]:
+    """
+    Returns the names of the shared memory segments exposed as files.
+
+    Returns:
+        set[str]: The names of the segments.
+    """
+    return set(listdir(SHARED_MEMORY_DIRECTORY))
+
+
+@mark.skipif(not isdir(SHARED_MEMORY_DIRECTORY), reason='Shared memory segments are not exposed as files')
+def test_load_result_maps_out_of_band_buffers_without_copying() -> None:
+    """
+    Test that out-of-band buffers are received as views of the shared memory and the segment is unlinked at once.
+    """
+    data = bytearray(range(256)) * (2 * SHARED_MEMORY_THRESHOLD // 256)
+    before = segments()
+
+    status, block = load_result(message=dump_result(status='return', value=Block(data=data)))
+
+    assert status == 'return'
+    assert isinstance(block.data, memoryview) and not block.data.readonly
+    assert block.data == data
+    assert segments() == before
+
+
+@mark.skipif(platform == 'win32', reason='Unix only')
+def test_load_result_copies_bytes_results() -> None:
+    """
+    Test that large bytes and bytearray results own their memory.
+    """
+    for value in (bytes(2 * SHARED_MEMORY_THRESHOLD), bytearray(2 * SHARED_MEMORY_THRESHOLD)):
+        status, result = load_result(message=dump_result(status='return', value=value))
+
+        assert status == 'return'
+        assert type(result) is type(value) and result == value
+
+
+def test_process_pool_releases_the_slot_when_a_worker_can_not_start(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the slot of a call is freed when its worker process can not be started.
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest fixture to patch attributes.
+    """
+    pool = ProcessPool(max_workers=1)
+    worker_class = process_pool.ProcessWorker
+
+    def failing_worker(context: Any) -> Any:
+        raise OSError('fork failed')
+
+    monkeypatch.setattr(process_pool, 'ProcessWorker', failing_worker)
+    with assert_raises(expected_exception=OSError, match='fork failed'):
+        pool.execute(function=add, reference=function_reference(function=add), seconds=5, args=(1, 2), kwargs={})
+
+    monkeypatch.setattr(process_pool, 'ProcessWorker', worker_class)
+
+    assert pool.execute(function=add, reference=function_reference(function=add), seconds=5, args=(1, 2), kwargs={}) == 3  # fmt: skip  # noqa: E501
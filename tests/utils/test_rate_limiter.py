@@ -0,0 +1,88 @@
+"""
+Test rate limiters.
+"""
+
+from freezegun import freeze_time
+from pytest import approx, mark, raises as assert_raises
+
+from developing_tools.utils.rate_limiter import RateLimiter, SlidingWindow, TokenBucket, shared_limiter
+
+
+def test_token_bucket_allows_bursts_and_refills() -> None:
+    """
+    Test that TokenBucket allows a burst of up to its capacity and refills at its rate.
+    """
+    with freeze_time(time_to_freeze='2021-01-01') as frozen_time:
+        limiter = TokenBucket(rate=2, capacity=3)
+
+        assert [limiter.try_acquire() for _ in range(3)] == [0, 0, 0]
+        assert limiter.try_acquire() == approx(0.5)
+
+        frozen_time.tick(delta=0.5)
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() == approx(0.5)
+
+        frozen_time.tick(delta=10)
+        assert [limiter.try_acquire() for _ in range(3)] == [0, 0, 0]
+        assert limiter.try_acquire() > 0
+
+
+def test_sliding_window_limits_calls_in_any_window() -> None:
+    """
+    Test that SlidingWindow allows at most limit calls in any window of period seconds.
+    """
+    with freeze_time(time_to_freeze='2021-01-01') as frozen_time:
+        limiter = SlidingWindow(limit=2, period=1)
+
+        assert limiter.try_acquire() == 0
+        frozen_time.tick(delta=0.6)
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() == approx(0.4)
+
+        frozen_time.tick(delta=0.4)
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() == approx(0.6)
+
+
+def test_shared_limiter_returns_the_same_limiter_for_a_key() -> None:
+    """
+    Test that shared_limiter creates the limiter of a key once.
+    """
+    first = shared_limiter(key='test_shared_limiter', factory=lambda: TokenBucket(rate=1, capacity=1))
+    second = shared_limiter(key='test_shared_limiter', factory=lambda: TokenBucket(rate=5, capacity=5))
+
+    assert first is second
+
+
+@mark.parametrize(
+    'limiter, arguments, expected_exception',
+    [
+        (TokenBucket, {'rate': '1', 'capacity': 1}, TypeError),
+        (TokenBucket, {'rate': 0, 'capacity': 1}, ValueError),
+        (TokenBucket, {'rate': 1, 'capacity': None}, TypeError),
+        (TokenBucket, {'rate': 1, 'capacity': 0.5}, ValueError),
+        (SlidingWindow, {'limit': 1.0, 'period': 1}, TypeError),
+        (SlidingWindow, {'limit': 0, 'period': 1}, ValueError),
+        (SlidingWindow, {'limit': 1, 'period': '1'}, TypeError),
+        (SlidingWindow, {'limit': 1, 'period': 0}, ValueError),
+    ],
+)
+def test_rate_limiter_invalid_arguments(limiter: type, arguments: dict[str, object], expected_exception: type[Exception]) -> None:  # fmt: skip  # noqa: E501
+    """
+    Test that the rate limiters validate their arguments.
+
+    Args:
+        limiter (type): Rate limiter class.
+        arguments (dict[str, object]): Arguments to pass to the rate limiter.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        limiter(**arguments)
+
+
+def test_rate_limiter_is_abstract() -> None:
+    """
+    Test that the RateLimiter base class can not be instantiated without implementing try_acquire.
+    """
+    with assert_raises(expected_exception=TypeError, match='abstract'):
+        RateLimiter()  # type: ignore[abstract]
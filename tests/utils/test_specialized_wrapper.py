@@ -0,0 +1,108 @@
+"""
+Test specialized_wrapper.
+"""
+
+from inspect import signature
+from typing import Any
+
+from pytest import raises as assert_raises
+
+from developing_tools.utils.specialized_wrapper import MISSING, specialized_wrapper, wrapper_signature
+
+BODY = """\
+calls.append(1)
+return {call}
+"""
+
+
+def function(a: int, /, b: int, c: int = 3, *, d: int = 4) -> tuple[int, ...]:
+    """
+    Function with every kind of fixed parameter.
+
+    Args:
+        a (int): Positional only parameter.
+        b (int): Positional or keyword parameter.
+        c (int, optional): Positional or keyword parameter. Defaults to 3.
+        d (int, optional): Keyword only parameter. Defaults to 4.
+
+    Returns:
+        tuple[int, ...]: The received arguments.
+    """
+    return a, b, c, d
+
+
+def test_specialized_wrapper_reproduces_the_signature() -> None:
+    """
+    Test that the wrapper receives the arguments of the function as its own parameters and forwards them.
+    """
+    calls: list[int] = []
+    wrapper = specialized_wrapper(function=function, body=BODY, namespace={'calls': calls})
+
+    assert wrapper.__code__.co_varnames == ('a', 'b', 'c', 'd')
+    assert wrapper.__wrapped__ is function  # type: ignore[attr-defined]
+    assert wrapper.__name__ == function.__name__
+    assert signature(wrapper) == signature(function)
+    assert wrapper(1, 2) == (1, 2, 3, 4)
+    assert wrapper(1, b=2, c=5, d=6) == (1, 2, 5, 6)
+    assert len(calls) == 2
+
+    with assert_raises(expected_exception=TypeError, match='missing 1 required positional argument'):
+        wrapper(1)
+
+    with assert_raises(expected_exception=TypeError, match='positional-only arguments passed as keyword'):
+        wrapper(a=1, b=2)
+
+
+def test_specialized_wrapper_tracked_parameters() -> None:
+    """
+    Test that the tracked parameters default to MISSING in the wrapper and to their default in the function.
+    """
+    body = """\
+passed.append(c is not MISSING)
+return {call}
+"""
+    passed: list[bool] = []
+    wrapper = specialized_wrapper(function=function, body=body, namespace={'passed': passed}, tracked=('c',))
+
+    assert wrapper(1, 2) == (1, 2, 3, 4)
+    assert wrapper(1, 2, 3) == (1, 2, 3, 4)
+    assert passed == [False, True]
+
+
+def test_specialized_wrapper_generic_fallback() -> None:
+    """
+    Test that the wrapper receives *args and **kwargs when the function has variable arguments or a parameter shadows
+    a name used by the body.
+    """
+
+    def variable_function(*args: Any, **kwargs: Any) -> int:
+        return len(args) + len(kwargs)
+
+    def shadowing_function(calls: int) -> int:
+        return calls
+
+    calls: list[int] = []
+    variable_wrapper = specialized_wrapper(function=variable_function, body=BODY, namespace={'calls': calls})
+    shadowing_wrapper = specialized_wrapper(function=shadowing_function, body=BODY, namespace={'calls': calls})
+    generic_wrapper = specialized_wrapper(function=function, body=BODY, namespace={'calls': calls}, generic_body='return -1')  # fmt: skip  # noqa: E501
+
+    assert wrapper_signature(function=variable_function) is None
+    assert variable_wrapper.__code__.co_varnames == ('args', 'kwargs')
+    assert variable_wrapper(1, 2, c=3) == 3
+    assert shadowing_wrapper.__code__.co_varnames == ('args', 'kwargs')
+    assert shadowing_wrapper(calls=5) == 5
+    assert generic_wrapper.__code__.co_varnames == ('a', 'b', 'c', 'd')
+    assert generic_wrapper(1, 2) == (1, 2, 3, 4)
+    assert len(calls) == 3
+    assert MISSING is not None
+
+
+def test_specialized_wrapper_uninspectable_function() -> None:
+    """
+    Test that functions without an inspectable signature get a generic wrapper.
+    """
+    calls: list[int] = []
+    wrapper = specialized_wrapper(function=max, body=BODY, namespace={'calls': calls})
+
+    assert wrapper.__code__.co_varnames == ('args', 'kwargs')
+    assert wrapper(1, 3, 2) == 3
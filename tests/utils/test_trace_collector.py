@@ -0,0 +1,167 @@
+"""
+Test TraceCollector.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from threading import Barrier, Thread
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from developing_tools.context_managers import ExecutionTimeBlock
+from developing_tools.functions import execution_time
+from developing_tools.utils.trace_collector import TraceCollector, active_collector
+
+
+def slices(trace: dict[str, Any]) -> list[tuple[str, str]]:
+    """
+    Returns the phase and name of the slice events of a trace.
+
+    Args:
+        trace (dict[str, Any]): The trace.
+
+    Returns:
+        list[tuple[str, str]]: The phase and name of each slice event.
+    """
+    return [(event['ph'], event['name']) for event in trace['traceEvents'] if event['ph'] != 'M']
+
+
+def test_trace_collector_records_timed_calls_and_blocks() -> None:
+    """
+    Test that the calls timed by execution_time and the blocks timed by ExecutionTimeBlock are recorded while the
+    collector is active, nested in their thread.
+    """
+
+    @execution_time(aggregate=True)
+    def function() -> None:
+        pass
+
+    with TraceCollector() as collector:
+        assert active_collector() is collector
+        with ExecutionTimeBlock(title='outer'):
+            function()
+
+    function()
+
+    trace = collector.trace()
+    assert active_collector() is None
+    assert slices(trace=trace) == [
+        ('B', 'outer'),
+        ('B', function.__qualname__),
+        ('E', function.__qualname__),
+        ('E', 'outer'),
+    ]
+    assert len({event['tid'] for event in trace['traceEvents']}) == 1
+    assert trace['traceEvents'][-1]['args']['cpu_time'] >= 0
+
+
+def test_trace_collector_records_thread_names() -> None:
+    """
+    Test that the events of each thread are recorded with its thread id and name.
+    """
+    barrier = Barrier(parties=3)  # keeps the threads alive together, so their ids are not reused
+
+    with TraceCollector() as collector:
+
+        def worker() -> None:
+            with ExecutionTimeBlock(title='worker'):
+                barrier.wait()
+
+        threads = [Thread(target=worker, name=f'worker-{i}') for i in range(3)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    trace = collector.trace()
+    names = {event['args']['name'] for event in trace['traceEvents'] if event['ph'] == 'M'}
+    assert names == {'worker-0', 'worker-1', 'worker-2'}
+    assert len({event['tid'] for event in trace['traceEvents'] if event['ph'] == 'B'}) == 3
+
+
+@mark.asyncio
+async def test_trace_collector_records_coroutines_as_complete_events() -> None:
+    """
+    Test that coroutines and async blocks are recorded as complete events, since they can interleave in a thread.
+    """
+    from asyncio import sleep
+
+    @execution_time(aggregate=True)
+    async def function() -> None:
+        await sleep(0.01)
+
+    with TraceCollector() as collector:
+        async with ExecutionTimeBlock(title='async block'):
+            await function()
+
+    events = [event for event in collector.trace()['traceEvents'] if event['ph'] == 'X']
+    assert [event['name'] for event in events] == [function.__qualname__, 'async block']
+    assert events[0]['dur'] >= 10_000
+    assert events[1]['dur'] >= events[0]['dur']
+    assert 'loop_hold_time' in events[0]['args']
+
+
+@mark.parametrize('file_name, compress', [('trace.json', None), ('trace.json.gz', None), ('trace.trace', True)])
+def test_trace_collector_write(tmp_path: Path, file_name: str, compress: bool | None) -> None:
+    """
+    Test that the trace is written as JSON, gzipped when the path ends with .gz or compress is True.
+
+    Args:
+        tmp_path (Path): Pytest fixture with a temporary directory.
+        file_name (str): Name of the trace file.
+        compress (bool | None): Whether to gzip the file.
+    """
+    with TraceCollector() as collector:
+        collector.begin(name='custom', args={'item': object()})
+        collector.end(name='custom')
+
+    path = tmp_path / file_name
+    collector.write(path=str(path), compress=compress)
+
+    content = path.read_bytes()
+    if file_name.endswith('.gz') or compress:
+        content = gzip.decompress(content)
+
+    trace = json.loads(content)
+    assert slices(trace=trace) == [('B', 'custom'), ('E', 'custom')]
+    assert trace['traceEvents'][1]['args']['item'].startswith('<object object')
+
+
+def test_trace_collector_drops_events_when_full() -> None:
+    """
+    Test that the events recorded once the buffer is full are dropped and counted.
+    """
+    with TraceCollector(max_events=4) as collector:
+        for _ in range(3):
+            collector.begin(name='slice')
+            collector.end(name='slice')
+
+    assert collector.events == 4
+    assert collector.dropped == 2
+
+    collector.clear()
+    assert collector.events == collector.dropped == 0
+
+
+def test_trace_collector_only_one_active() -> None:
+    """
+    Test that only one collector can be active at a time.
+    """
+    with TraceCollector(), assert_raises(RuntimeError, match='Another TraceCollector is already active'):
+        TraceCollector().start()
+
+
+@mark.parametrize('max_events, expected_exception', [(1.5, TypeError), (0, ValueError)])
+def test_trace_collector_invalid_max_events(max_events: Any, expected_exception: type[Exception]) -> None:
+    """
+    Test that TraceCollector validates max_events.
+
+    Args:
+        max_events (Any): Maximum number of events.
+        expected_exception (type[Exception]): Expected exception.
+    """
+    with assert_raises(expected_exception=expected_exception):
+        TraceCollector(max_events=max_events)
@@ -0,0 +1,107 @@
+"""
+Test compile_validator.
+"""
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Annotated, Any, Literal, NewType, Optional, Protocol, TypeVar
+
+from pytest import mark
+
+from developing_tools.utils.type_validator import compile_validator, type_name
+
+UserId = NewType('UserId', int)
+Number = TypeVar('Number', int, float)
+Bounded = TypeVar('Bounded', bound=str)
+
+
+class Closeable(Protocol):
+    """
+    Protocol that is not runtime checkable.
+    """
+
+    def close(self) -> None:
+        """
+        Closes the object.
+        """
+
+
+@mark.parametrize(
+    'annotation, valid, invalid',
+    [
+        (int, [1, True], ['1', 1.5]),
+        (float, [1.5, 1], ['1.5']),
+        (None, [None], [0]),
+        (Any, [1, None], []),
+        (int | None, [1, None], ['1']),
+        (Optional[str], ['a', None], [1]),  # noqa: UP045
+        (int | list[int], [1, [1]], [['1'], '1']),
+        (Literal['a', 1], ['a', 1], ['b', True, [1]]),
+        (Annotated[int, 'meta'], [1], ['1']),
+        (UserId, [1], ['1']),
+        (Number, [1, 1.5], ['1']),
+        (Bounded, ['a'], [1]),
+        (list[int], [[], [1, 2]], [[1, '2'], (1,)]),
+        (set[str], [{'a'}], [{1}]),
+        (dict[str, int], [{'a': 1}], [{'a': '1'}, {1: 1}, []]),
+        (Mapping[str, Any], [{'a': None}], [[]]),
+        (Sequence[int], [[1], (1,), range(3)], [['1']]),
+        (tuple[int, str], [(1, 'a')], [(1, 1), (1,), [1, 'a']]),
+        (tuple[int, ...], [(), (1, 2)], [(1, '2')]),
+        (tuple[()], [()], [(1,)]),
+        (type[Exception], [ValueError], [int, ValueError()]),
+        (Callable[[int], int], [len], [1]),
+        (Iterator[int], [iter(['not consumed'])], [[1]]),
+        (Closeable, [1], []),
+        ('UnresolvedName', [1], []),
+    ],
+)
+def test_compile_validator(annotation: Any, valid: list[Any], invalid: list[Any]) -> None:
+    """
+    Test that the validator of an annotation accepts the matching values and rejects the others.
+
+    Args:
+        annotation (Any): The annotation.
+        valid (list[Any]): Values that match the annotation.
+        invalid (list[Any]): Values that do not match the annotation.
+    """
+    validator = compile_validator(annotation=annotation)
+
+    assert all(validator(value) for value in valid)
+    assert not any(validator(value) for value in invalid)
+
+
+def test_compile_validator_is_cached() -> None:
+    """
+    Test that each annotation is compiled once per sample size.
+    """
+    assert compile_validator(annotation=list[int]) is compile_validator(annotation=list[int])
+    assert compile_validator(annotation=list[int]) is not compile_validator(annotation=list[int], sample_size=None)
+
+
+def test_compile_validator_samples_large_collections() -> None:
+    """
+    Test that only sample_size evenly spaced elements of a large sequence are validated, unless sample_size is None.
+    """
+    values: list[Any] = list(range(1000))
+    values[1] = 'not sampled'
+
+    assert compile_validator(annotation=list[int], sample_size=10)(values)
+    assert not compile_validator(annotation=list[int], sample_size=None)(values)
+
+    values[100] = 'sampled'
+    assert not compile_validator(annotation=list[int], sample_size=10)(values)
+
+
+@mark.parametrize(
+    'annotation, expected',
+    [(int, 'int'), (list[int], 'list[int]'), (int | None, 'int | None'), (Optional[int], 'Optional[int]')],  # noqa: UP045
+)
+def test_type_name(annotation: Any, expected: str) -> None:
+    """
+    Test that type_name returns readable names of classes and generic annotations.
+
+    Args:
+        annotation (Any): The annotation.
+        expected (str): Expected name.
+    """
+    assert type_name(annotation=annotation) == expected